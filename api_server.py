@@ -1,19 +1,19 @@
-from flask import Flask, jsonify, request
-import pyodbc
+from flask import Flask, jsonify, request, g
+import json
+import zlib
 import logging
+import time
 from datetime import datetime
 from dotenv import load_dotenv
 import os
+from db_pool import ConnectionPool, PoolTimeout, PoolConnectionError
+from response_cache import ResponseCache, data_version
+from news_queries import NEWS_FIELDS, parse_fields, encode_cursor, decode_cursor, build_news_query
+from search_index import SearchIndex, SearchIndexUnavailable
+from metrics import REGISTRY, SIZE_BUCKETS, CONTENT_TYPE
+from storage import create_storage, storage_config_from_env
+from content_archive import ContentArchive
 
-# Configurare logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('api_server.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
 # Încarcă variabilele de mediu
@@ -21,139 +21,476 @@ load_dotenv()
 
 app = Flask(__name__)
 
-def get_db_connection():
-    """Creează conexiunea la baza de date SQL Server"""
+# Același backend ca scraper-ul (DB_BACKEND); cu SQLite și DB_READ_ONLY=true, API-ul poate servi o replică
+storage = create_storage(**storage_config_from_env())
+
+db_pool = ConnectionPool(
+    storage.connect,
+    min_size=int(os.getenv('DB_POOL_MIN', 1)),
+    max_size=int(os.getenv('DB_POOL_MAX', 10)),
+    timeout=float(os.getenv('DB_POOL_TIMEOUT', 5)),
+    idle_timeout=float(os.getenv('DB_POOL_IDLE_TIMEOUT', 300)),
+    health_check_interval=float(os.getenv('DB_POOL_HEALTH_CHECK_INTERVAL', 30))
+)
+
+news_cache = ResponseCache(
+    max_size=int(os.getenv('API_CACHE_SIZE', 256)),
+    ttl=float(os.getenv('API_CACHE_TTL', 300))
+)
+
+try:
+    search_index = SearchIndex(os.getenv('SEARCH_INDEX_PATH', 'search_index.db'),
+                               recent_window=int(os.getenv('SEARCH_RECENT_WINDOW', 20000)),
+                               recent_min_hits=int(os.getenv('SEARCH_RECENT_MIN_HITS', 1000)))
+except SearchIndexUnavailable as e:
+    logger.warning(f"Căutarea este dezactivată: {e}")
+    search_index = None
+
+SEARCH_MAX_LIMIT = 100
+NEWS_MAX_LIMIT = int(os.getenv('API_NEWS_MAX_LIMIT', 1000))
+
+# Arhiva cu textul integral (scrisă de scraper); se deschide doar la prima cerere care are nevoie de ea
+CONTENT_ARCHIVE_PATH = os.getenv('CONTENT_ARCHIVE_PATH', 'content_archive.db')
+content_archive = None
+
+# Coloana duplicate_of (sql/near_duplicates.sql) lipsește pe SQL Server până la aplicarea migrării
+duplicates_column = False
+
+# Mesajul pentru client la erorile bazei de date; detaliile driver-ului ajung doar în log
+DATABASE_ERROR = 'Eroare la interogarea bazei de date'
+
+REQUEST_SECONDS = REGISTRY.histogram('api_request_seconds', 'Durata cererilor HTTP per endpoint', ('endpoint',))
+REQUESTS = REGISTRY.counter('api_requests_total', 'Cereri HTTP per endpoint și status', ('endpoint', 'status'))
+QUERY_SECONDS = REGISTRY.histogram('api_query_seconds', 'Durata interogărilor în baza de date', ('endpoint',))
+SERIALIZE_SECONDS = REGISTRY.histogram('api_serialize_seconds', 'Durata serializării JSON a rezultatelor',
+                                       ('endpoint',))
+ROWS_RETURNED = REGISTRY.histogram('api_rows_returned', 'Rânduri returnate per cerere', ('endpoint',),
+                                   buckets=SIZE_BUCKETS)
+
+# Starea pool-ului și a cache-ului se citește doar la export, fără cost pe cereri
+for key in ('size', 'in_use', 'idle', 'waits', 'timeouts', 'health_check_failures'):
+    REGISTRY.gauge(f'api_db_pool_{key}', f'Pool-ul de conexiuni: {key}',
+                   callback=lambda key=key: db_pool.stats()[key])
+for key in ('size', 'hits', 'misses', 'evictions', 'invalidations', 'stale_writes'):
+    REGISTRY.gauge(f'api_cache_{key}', f'Cache-ul de răspunsuri: {key}',
+                   callback=lambda key=key: news_cache.stats()[key])
+
+def normalize_arg(value):
+    value = value.strip() if value else None
+    return value or None
+
+def flag_arg(name):
+    return request.args.get(name, '0').lower() in ('1', 'true')
+
+def cached_json(key):
+    """Returnează răspunsul din cache pentru `key` sau None"""
+    entry = news_cache.get(key)
+    if entry is ResponseCache.MISSING:
+        # Versiunea datelor de dinaintea interogării; cache_json nu stochează rezultatul dacă s-a schimbat între timp
+        g.cache_version = data_version()
+        return None
+    body, headers = entry
+    return app.response_class(body, mimetype='application/json', headers=headers)
+
+def cache_json(key, payload, headers=None):
+    response = jsonify(payload)
+    if headers:
+        response.headers.update(headers)
+    news_cache.set(key, (response.get_data(), headers), version=g.pop('cache_version', None))
+    return response
+
+def init_worker(threads=1):
+    """Pregătește un worker al serverului WSGI (după fork): deschide conexiunile minime ale pool-ului"""
+    if db_pool.max_size < threads:
+        logger.warning(f"Pool-ul are cel mult {db_pool.max_size} conexiuni pentru {threads} fire; "
+                       f"cererile vor aștepta după conexiuni (DB_POOL_MAX)")
+    try:
+        db_pool.fill()
+    except PoolConnectionError as e:
+        # Worker-ul pornește oricum: conexiunile se reîncearcă la cereri
+        logger.error(f"Worker {os.getpid()}: nu s-a putut deschide pool-ul de conexiuni: {e}")
+        return
+    logger.info(f"Worker {os.getpid()} pregătit ({storage.describe()}, pool {db_pool.stats()['size']}/{db_pool.max_size})")
+
+def shutdown_worker():
+    """Oprirea unui worker: închide conexiunile libere ale pool-ului, ca serverul DB să nu aștepte după ele"""
+    db_pool.close_all()
+    logger.info(f"Worker {os.getpid()} oprit, conexiunile pool-ului au fost închise")
+
+def get_content_archive():
+    """Arhiva de conținut în modul doar citire sau None dacă nu este configurată ori nu a fost creată încă"""
+    global content_archive
+    if content_archive is None and CONTENT_ARCHIVE_PATH and os.path.exists(CONTENT_ARCHIVE_PATH):
+        content_archive = ContentArchive(CONTENT_ARCHIVE_PATH, read_only=True)
+    return content_archive
+
+def full_contents(urls):
+    """Textul integral din arhivă pentru URL-urile date (url -> text); articolele nearhivate lipsesc"""
+    archive = get_content_archive()
+    if archive is None:
+        return {}
     try:
-        server = os.getenv('DB_HOST', 'localhost\\SQLEXPRESS')
-        database = os.getenv('DB_NAME', 'news_scraper')
-        connection_string = (
-            f'DRIVER={{ODBC Driver 17 for SQL Server}};'
-            f'SERVER={server};'
-            f'DATABASE={database};'
-            f'Trusted_Connection=yes;'
-        )
-        conn = pyodbc.connect(connection_string)
-        return conn
+        with QUERY_SECONDS.time(endpoint='content_archive'):
+            return archive.get_contents(urls)
     except Exception as e:
-        logger.error(f"Eroare la conectarea la baza de date: {e}")
-        return None
+        logger.error(f"Eroare la citirea arhivei de conținut: {e}")
+        return {}
+
+def has_duplicates_column():
+    """Dacă dbo.news are coloana duplicate_of; un răspuns negativ se reverifică, migrarea poate rula oricând"""
+    global duplicates_column
+    if not duplicates_column:
+        with db_pool.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("SELECT duplicate_of FROM dbo.news WHERE 1 = 0")
+                cursor.fetchall()
+                duplicates_column = True
+            except Exception:
+                conn.rollback()
+            finally:
+                cursor.close()
+    return duplicates_column
+
+def query_fields(fields, full):
+    """Cu `full=1`, URL-ul se citește și când nu a fost cerut: după el se caută textul în arhivă"""
+    return fields + ['url'] if full and 'url' not in fields else fields
+
+def fill_content(item, row, contents):
+    if contents and row.url in contents:
+        item['content'] = contents[row.url]
+    return item
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+@app.after_request
+def record_request_metrics(response):
+    started = g.pop('request_started', None)
+    if started is not None:
+        endpoint = request.endpoint or 'unknown'
+        REQUEST_SECONDS.observe(time.perf_counter() - started, endpoint=endpoint)
+        REQUESTS.inc(endpoint=endpoint, status=str(response.status_code))
+    return response
+
+def row_to_dict(row, fields=NEWS_FIELDS):
+    item = {field: getattr(row, field) for field in fields}
+    if 'publishedAt' in item:
+        item['publishedAt'] = item['publishedAt'].isoformat() if item['publishedAt'] else None
+    return item
+
+@app.errorhandler(PoolTimeout)
+def handle_pool_timeout(e):
+    logger.error(f"Pool-ul de conexiuni este epuizat: {e}")
+    return jsonify({'error': 'Serverul este ocupat, reîncercați'}), 503
+
+@app.errorhandler(PoolConnectionError)
+def handle_pool_connection_error(e):
+    logger.error(f"Eroare la conectarea la baza de date: {e}")
+    return jsonify({'error': 'Nu s-a putut conecta la baza de date'}), 500
 
 @app.route('/api/news', methods=['GET'])
 def get_news():
-    """Returnează articole filtrate după parametri"""
+    """Returnează articole filtrate după parametri
+
+    Paginare: `limit` articole per pagină (între 1 și NEWS_MAX_LIMIT); dacă mai există rezultate, răspunsul are
+    header-ul `X-Next-Cursor`, a cărui valoare se trimite ca `?cursor=` pentru pagina următoare.
+    `fields=title,url,...` restrânge coloanele returnate.
+    `collapse=1` returnează un singur articol (primul publicat) din fiecare grup de duplicate.
+    `full=1` înlocuiește `content` (trunchiat în dbo.news) cu textul integral din arhiva de conținut.
+    """
+    # Parametri de filtrare
+    source = normalize_arg(request.args.get('source'))
+    category = normalize_arg(request.args.get('category'))
+    limit = min(max(request.args.get('limit', default=20, type=int), 1), NEWS_MAX_LIMIT)
+    start_date = normalize_arg(request.args.get('start_date'))  # Filtru dată
+    end_date = normalize_arg(request.args.get('end_date'))
+    cursor_token = normalize_arg(request.args.get('cursor'))
+    collapse = flag_arg('collapse')
     try:
-        conn = get_db_connection()
-        if not conn:
-            return jsonify({'error': 'Nu s-a putut conecta la baza de date'}), 500
-        
-        cursor = conn.cursor()
-        
-        # Parametri de filtrare
-        source = request.args.get('source')
-        category = request.args.get('category')
-        limit = request.args.get('limit', default=20, type=int)
-        start_date = request.args.get('start_date')  # Filtru dată
-        end_date = request.args.get('end_date')
-
-        # Construirea query-ului dinamic
-        query = """
-            SELECT id, title, source, category, author, url, keywords, 
-                   description, publishedAt, content, urlToImage 
-            FROM dbo.news 
-            WHERE 1=1
-        """
-        params = []
-        
-        if source:
-            query += " AND source = ?"
-            params.append(source)
-        if category:
-            query += " AND category = ?"
-            params.append(category)
-        if start_date:
-            query += " AND publishedAt >= ?"
-            params.append(start_date)
-        if end_date:
-            query += " AND publishedAt <= ?"
-            params.append(end_date)
-        
-        query += " ORDER BY publishedAt DESC"
-        if limit:
-            query += f" OFFSET 0 ROWS FETCH NEXT {limit} ROWS ONLY"
-        
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        
-        news = []
+        fields = parse_fields(request.args.get('fields'))
+        after = decode_cursor(cursor_token) if cursor_token else None
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    if collapse and not has_duplicates_column():
+        return jsonify({'error': 'collapse=1 necesită coloana duplicate_of (sql/near_duplicates.sql)'}), 400
+    full = flag_arg('full') and 'content' in fields
+
+    cache_key = ('news', source, category, limit, start_date, end_date, cursor_token, tuple(fields), collapse, full)
+    cached = cached_json(cache_key)
+    if cached is not None:
+        return cached
+
+    with db_pool.connection() as conn:
+        try:
+            cursor = conn.cursor()
+
+            # Se cere un rând în plus pentru a afla dacă există o pagină următoare
+            query, params = build_news_query(
+                query_fields(fields, full), source, category, start_date, end_date,
+                cursor=after, limit=limit + 1, dialect=storage.dialect,
+                collapse_duplicates=collapse
+            )
+            with QUERY_SECONDS.time(endpoint='get_news'):
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
+            cursor.close()
+
+            headers = {}
+            if len(rows) > limit:
+                rows = rows[:limit]
+                last = rows[-1]
+                if last.publishedAt:
+                    headers['X-Next-Cursor'] = encode_cursor(last.publishedAt, last.id)
+
+            ROWS_RETURNED.observe(len(rows), endpoint='get_news')
+            contents = full_contents([row.url for row in rows]) if full else {}
+            with SERIALIZE_SECONDS.time(endpoint='get_news'):
+                news = [fill_content(row_to_dict(row, fields), row, contents) for row in rows]
+                return cache_json(cache_key, news, headers)
+
+        except Exception as e:
+            logger.error(f"Eroare la obținerea articolelor: {e}")
+            return jsonify({'error': DATABASE_ERROR}), 500
+
+EXPORT_CHUNK_SIZE = int(os.getenv('API_EXPORT_CHUNK_SIZE', 500))
+
+def export_lines(cursor, fields, output_format, full=False):
+    """Produce exportul bucată cu bucată, citind cursorul cu fetchmany (și arhiva, câte o bucată, cu `full`)"""
+    first = True
+    exported = 0
+    if output_format == 'json':
+        yield '['
+    while True:
+        rows = cursor.fetchmany(EXPORT_CHUNK_SIZE)
+        if not rows:
+            break
+        exported += len(rows)
+        contents = full_contents([row.url for row in rows]) if full else {}
+        lines = []
         for row in rows:
-            news.append({
-                'id': row.id,
-                'title': row.title,
-                'source': row.source,
-                'category': row.category,
-                'author': row.author,
-                'url': row.url,
-                'keywords': row.keywords,
-                'description': row.description,
-                'publishedAt': row.publishedAt.isoformat() if row.publishedAt else None,
-                'content': row.content,
-                'urlToImage': row.urlToImage
-            })
-        
-        cursor.close()
-        conn.close()
-        
-        return jsonify(news)
-    
+            line = json.dumps(fill_content(row_to_dict(row, fields), row, contents), ensure_ascii=False)
+            if output_format == 'json':
+                line = line if first else ',' + line
+                first = False
+            else:
+                line += '\n'
+            lines.append(line)
+        yield ''.join(lines)
+    if output_format == 'json':
+        yield ']'
+    ROWS_RETURNED.observe(exported, endpoint='export_news')
+
+def gzip_chunks(chunks):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode('utf-8'))
+        if data:
+            yield data
+    yield compressor.flush()
+
+@app.route('/api/news/export', methods=['GET'])
+def export_news():
+    """Exportă în flux toate articolele care corespund filtrelor (NDJSON implicit, `format=json` pentru listă JSON)
+
+    Memoria folosită nu depinde de numărul de rânduri: cursorul este citit în bucăți de
+    EXPORT_CHUNK_SIZE rânduri. Cu `gzip=1` răspunsul este comprimat incremental; `full=1` exportă textul integral.
+    """
+    source = normalize_arg(request.args.get('source'))
+    category = normalize_arg(request.args.get('category'))
+    limit = request.args.get('limit', type=int)
+    start_date = normalize_arg(request.args.get('start_date'))
+    end_date = normalize_arg(request.args.get('end_date'))
+    output_format = request.args.get('format', 'ndjson')
+    use_gzip = flag_arg('gzip')
+    collapse = flag_arg('collapse')
+    if output_format not in ('ndjson', 'json'):
+        return jsonify({'error': 'Format invalid, folosiți ndjson sau json'}), 400
+    if limit is not None and limit < 1:
+        return jsonify({'error': 'Parametrul limit trebuie să fie pozitiv'}), 400
+    try:
+        fields = parse_fields(request.args.get('fields'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    if collapse and not has_duplicates_column():
+        return jsonify({'error': 'collapse=1 necesită coloana duplicate_of (sql/near_duplicates.sql)'}), 400
+    full = flag_arg('full') and 'content' in fields
+
+    conn = db_pool.acquire()
+    cursor = None
+    released = []
+
+    def release():
+        """Închide cursorul și întoarce conexiunea în pool, o singură dată, oricare dintre căi ajunge prima"""
+        if released:
+            return
+        released.append(True)
+        try:
+            if cursor is not None:
+                cursor.close()
+        except Exception as e:
+            logger.warning(f"Eroare la închiderea cursorului de export: {e}")
+        finally:
+            db_pool.release(conn)
+
+    try:
+        cursor = conn.cursor()
+        query, params = build_news_query(query_fields(fields, full), source, category, start_date, end_date,
+                                         limit=limit, dialect=storage.dialect, collapse_duplicates=collapse)
+        with QUERY_SECONDS.time(endpoint='export_news'):
+            cursor.execute(query, params)
     except Exception as e:
-        logger.error(f"Eroare la obținerea articolelor: {e}")
-        return jsonify({'error': str(e)}), 500
+        release()
+        logger.error(f"Eroare la exportul articolelor: {e}")
+        return jsonify({'error': DATABASE_ERROR}), 500
+
+    def generate():
+        try:
+            chunks = export_lines(cursor, fields, output_format, full)
+            yield from (gzip_chunks(chunks) if use_gzip else chunks)
+        except Exception as e:
+            logger.error(f"Eroare în timpul exportului: {e}")
+            raise
+        finally:
+            release()
+
+    mimetype = 'application/x-ndjson' if output_format == 'ndjson' else 'application/json'
+    response = app.response_class(generate(), mimetype=mimetype)
+    if use_gzip:
+        response.headers['Content-Encoding'] = 'gzip'
+    # Dacă răspunsul este închis înainte de a fi parcurs, generatorul nu pornește: cursorul se închide și
+    # conexiunea se întoarce în pool tot aici
+    response.call_on_close(release)
+    return response
+
+@app.route('/api/news/search', methods=['GET'])
+def search_news():
+    """Caută articole după cuvinte în titlu, descriere și cuvintele cheie, ordonate după relevanță (BM25)
+
+    Parametri: `q` (obligatoriu), `source`, `fields`, `limit` (maxim 100) și `page` (de la 1). Dacă mai
+    există rezultate, răspunsul are header-ul `X-Next-Page`. Fiecare articol primește câmpul `score`.
+    `full=1` returnează textul integral din arhiva de conținut în `content`.
+    """
+    search_query = normalize_arg(request.args.get('q'))
+    source = normalize_arg(request.args.get('source'))
+    limit = min(max(request.args.get('limit', default=20, type=int), 1), SEARCH_MAX_LIMIT)
+    page = max(request.args.get('page', default=1, type=int), 1)
+    if not search_query:
+        return jsonify({'error': 'Parametrul q este obligatoriu'}), 400
+    try:
+        fields = parse_fields(request.args.get('fields'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    if search_index is None:
+        return jsonify({'error': 'Căutarea nu este disponibilă'}), 503
+    full = flag_arg('full') and 'content' in fields
+
+    cache_key = ('search', search_query, source, limit, page, tuple(fields), full)
+    cached = cached_json(cache_key)
+    if cached is not None:
+        return cached
+
+    # Se cere un rezultat în plus pentru a afla dacă există o pagină următoare
+    with QUERY_SECONDS.time(endpoint='search_index'):
+        hits = search_index.search(search_query, limit=limit + 1, offset=(page - 1) * limit, source=source)
+    headers = {}
+    if len(hits) > limit:
+        hits = hits[:limit]
+        headers['X-Next-Page'] = str(page + 1)
+    if not hits:
+        return cache_json(cache_key, [], headers)
+
+    select_fields = fields if 'url' in fields else fields + ['url']
+    with db_pool.connection() as conn:
+        try:
+            cursor = conn.cursor()
+            with QUERY_SECONDS.time(endpoint='search_news'):
+                cursor.execute(
+                    f"SELECT {', '.join(select_fields)} FROM dbo.news WHERE url IN ({', '.join('?' * len(hits))})",
+                    [url for url, _ in hits]
+                )
+                rows = {row.url: row for row in cursor.fetchall()}
+            cursor.close()
+        except Exception as e:
+            logger.error(f"Eroare la căutarea articolelor: {e}")
+            return jsonify({'error': DATABASE_ERROR}), 500
+
+    # Ordinea relevanței vine din index; URL-urile care nu mai există în baza de date se omit
+    ROWS_RETURNED.observe(len(rows), endpoint='search_news')
+    contents = full_contents(list(rows)) if full else {}
+    with SERIALIZE_SECONDS.time(endpoint='search_news'):
+        news = []
+        for url, score in hits:
+            if url in rows:
+                item = fill_content(row_to_dict(rows[url], fields), rows[url], contents)
+                item['score'] = round(score, 4)
+                news.append(item)
+        return cache_json(cache_key, news, headers)
 
 @app.route('/api/news/<int:id>', methods=['GET'])
 def get_news_by_id(id):
-    """Returnează un articol specific după ID"""
-    try:
-        conn = get_db_connection()
-        if not conn:
-            return jsonify({'error': 'Nu s-a putut conecta la baza de date'}), 500
-        
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT id, title, source, category, author, url, keywords, 
-                   description, publishedAt, content, urlToImage
-            FROM dbo.news
-            WHERE id = ?
-            """,
-            (id,)
-        )
-        row = cursor.fetchone()
-        
-        if not row:
-            return jsonify({'error': 'Articolul nu a fost găsit'}), 404
-        
-        news_item = {
-            'id': row.id,
-            'title': row.title,
-            'source': row.source,
-            'category': row.category,
-            'author': row.author,
-            'url': row.url,
-            'keywords': row.keywords,
-            'description': row.description,
-            'publishedAt': row.publishedAt.isoformat() if row.publishedAt else None,
-            'content': row.content,
-            'urlToImage': row.urlToImage
-        }
-        
-        cursor.close()
-        conn.close()
+    """Returnează un articol specific după ID, cu textul integral din arhiva de conținut (dacă există)
+
+    `html=1` returnează HTML-ul brut al paginii, dacă scraper-ul l-a arhivat (CONTENT_ARCHIVE_HTML=true).
+    """
+    raw_html = flag_arg('html')
+    cache_key = ('news_by_id', id)
+    cached = None if raw_html else cached_json(cache_key)
+    if cached is not None:
+        return cached
+
+    with db_pool.connection() as conn:
+        try:
+            cursor = conn.cursor()
+            started = time.perf_counter()
+            cursor.execute(
+                """
+                SELECT id, title, source, category, author, url, keywords, 
+                       description, publishedAt, content, urlToImage
+                FROM dbo.news
+                WHERE id = ?
+                """,
+                (id,)
+            )
+            row = cursor.fetchone()
+            QUERY_SECONDS.observe(time.perf_counter() - started, endpoint='get_news_by_id')
+            cursor.close()
+            
+            if not row:
+                return jsonify({'error': 'Articolul nu a fost găsit'}), 404
+
+            if raw_html:
+                archive = get_content_archive()
+                html = archive.get_html(row.url) if archive is not None else None
+                if html is None:
+                    return jsonify({'error': 'HTML-ul articolului nu este arhivat'}), 404
+                return app.response_class(html, mimetype='text/html')
+
+            contents = full_contents([row.url])
+            with SERIALIZE_SECONDS.time(endpoint='get_news_by_id'):
+                return cache_json(cache_key, fill_content(row_to_dict(row), row, contents))
         
-        return jsonify(news_item)
-    
-    except Exception as e:
-        logger.error(f"Eroare la obținerea articolului cu ID {id}: {e}")
-        return jsonify({'error': str(e)}), 500
+        except Exception as e:
+            logger.error(f"Eroare la obținerea articolului cu ID {id}: {e}")
+            return jsonify({'error': DATABASE_ERROR}), 500
+
+@app.route('/api/pool', methods=['GET'])
+def get_pool_stats():
+    """Returnează metricile pool-ului de conexiuni"""
+    return jsonify(db_pool.stats())
+
+@app.route('/api/cache', methods=['GET'])
+def get_cache_stats():
+    """Returnează metricile cache-ului de răspunsuri"""
+    return jsonify(news_cache.stats())
+
+@app.route('/metrics', methods=['GET'])
+def get_metrics():
+    """Metricile procesului în formatul text Prometheus"""
+    return app.response_class(REGISTRY.render(), mimetype=None, content_type=CONTENT_TYPE)
 
 if __name__ == "__main__":
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    from logging_config import configure_logging
+    configure_logging('api_server.log')
+    app.run(debug=True, host='0.0.0.0', port=5000)
@@ -0,0 +1,76 @@
+import threading
+import time
+import logging
+
+from metrics import REGISTRY, SIZE_BUCKETS
+
+logger = logging.getLogger(__name__)
+
+INSERT_SECONDS = REGISTRY.histogram('scraper_db_insert_seconds', 'Durata scrierii unui lot în baza de date')
+INSERT_BATCH_SIZE = REGISTRY.histogram('scraper_db_insert_batch_size', 'Articole per lot scris', buckets=SIZE_BUCKETS)
+
+
+class BufferedArticleWriter:
+    """Adună articolele scrape-uite și le scrie în loturi, cu un singur commit per lot
+
+    Lotul se golește când atinge `batch_size` articole sau când au trecut `flush_interval`
+    secunde de la ultima scriere (verificat la fiecare `add`), plus la `close()`. `on_insert`, dacă este dat,
+    primește lista articolelor inserate după fiecare lot (de ex. pentru indexul de căutare).
+    """
+
+    def __init__(self, db, batch_size=50, flush_interval=10.0, on_insert=None):
+        self.db = db
+        self.on_insert = on_insert
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = flush_interval
+        self.buffer = []
+        self.last_flush = time.monotonic()
+        self.lock = threading.Lock()
+        self.inserted = 0
+        self.failed = 0
+        # URL-urile scrise efectiv; orice alt articol primit nu a ajuns în baza de date
+        self.inserted_urls = []
+        self.seconds = 0.0
+
+    def add(self, article_data):
+        with self.lock:
+            self.buffer.append(article_data)
+            due = (len(self.buffer) >= self.batch_size
+                   or time.monotonic() - self.last_flush >= self.flush_interval)
+        if due:
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            batch, self.buffer = self.buffer, []
+            self.last_flush = time.monotonic()
+        if not batch:
+            return [], []
+        started = time.perf_counter()
+        try:
+            inserted, failed = self.db.insert_articles(batch)
+        except Exception as e:
+            logger.error(f"Eroare la scrierea lotului de {len(batch)} articole: {e}")
+            inserted, failed = [], batch
+        elapsed = time.perf_counter() - started
+        self.seconds += elapsed
+        INSERT_SECONDS.observe(elapsed)
+        INSERT_BATCH_SIZE.observe(len(batch))
+        self.inserted += len(inserted)
+        self.failed += len(failed)
+        self.inserted_urls.extend(article['url'] for article in inserted)
+        if inserted and self.on_insert is not None:
+            try:
+                self.on_insert(inserted)
+            except Exception as e:
+                logger.error(f"Eroare după inserarea lotului: {e}")
+        return inserted, failed
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
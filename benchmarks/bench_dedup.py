@@ -0,0 +1,69 @@
+"""Benchmark: verificarea URL-urilor existente, per URL vs. în lot vs. cu cache-ul cald
+
+Rulare: python -m benchmarks.bench_dedup --stored 5000 --candidates 40 --latency 0.002
+"""
+import argparse
+import time
+
+from benchmarks.standins import SqliteNewsDatabase
+
+
+def seed(db, count):
+    rows = [
+        (f'Titlu {i}', 'HotNews', 'General', 'Autor', f'https://hotnews.ro/stiri/articol-{i}', '', '',
+         '2099-01-01 00:00:00', '', None)
+        for i in range(count)
+    ]
+    cursor = db.connection.cursor()
+    cursor.executemany(
+        "INSERT INTO dbo.news (title, source, category, author, url, keywords, description, publishedAt, content, urlToImage) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    db.connection.commit()
+
+
+def per_url(db, urls):
+    """Comportamentul vechi: câte un SELECT COUNT(*) pentru fiecare link"""
+    found = set()
+    for url in urls:
+        cursor = db.connection.cursor()
+        cursor.execute("SELECT COUNT(*) FROM dbo.news WHERE url = ?", (url,))
+        if cursor.fetchone()[0] > 0:
+            found.add(url)
+        cursor.close()
+    return found
+
+
+def measure(label, db, func, urls):
+    db.connection.round_trips = 0
+    start = time.perf_counter()
+    found = func(urls)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f'{label:28s} {len(found):3d} găsite  {db.connection.round_trips:3d} drumuri  {elapsed:8.2f} ms')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pentru deduplicarea URL-urilor')
+    parser.add_argument('--stored', type=int, default=5000)
+    parser.add_argument('--candidates', type=int, default=40)
+    parser.add_argument('--latency', type=float, default=0.002, help='Latența simulată per drum dus-întors (secunde)')
+    args = parser.parse_args()
+
+    db = SqliteNewsDatabase(latency=args.latency)
+    db.connect()
+    seed(db, args.stored)
+    # Jumătate din candidați sunt deja stocați, jumătate sunt noi
+    half = args.candidates // 2
+    urls = [f'https://hotnews.ro/stiri/articol-{i}' for i in range(half)]
+    urls += [f'https://hotnews.ro/stiri/nou-{i}' for i in range(args.candidates - half)]
+
+    measure('per URL', db, lambda u: per_url(db, u), urls)
+    measure('lot, cache gol', db, db.existing_urls, urls)
+    measure('lot, cache cald', db, db.existing_urls, urls)
+    db.known_urls = type(db.known_urls)()
+    db.warm_url_cache()
+    measure('lot, după warm_url_cache', db, db.existing_urls, urls)
+    db.disconnect()
+
+
+if __name__ == '__main__':
+    main()
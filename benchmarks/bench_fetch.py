@@ -0,0 +1,43 @@
+"""Benchmark: durata unui ciclu de scraping, secvențial vs. concurent, pe servere locale cu latență
+
+Rulare: python -m benchmarks.bench_fetch --latency 0.2 --workers 8 --rate 5
+"""
+import argparse
+import time
+
+from benchmarks.fixture_server import FixtureServer
+from benchmarks.standins import MemoryNewsDatabase
+from news_scraper import NewsScraper
+from site_adapters import ADAPTERS
+
+
+def run_cycle(hotnews_url, digi24_url, fetch_config):
+    scraper = NewsScraper({}, None, fetch_config)
+    scraper.db = MemoryNewsDatabase()
+    scraper.adapters = [ADAPTERS['hotnews'].with_homepage(hotnews_url), ADAPTERS['digi24'].with_homepage(digi24_url)]
+    start = time.perf_counter()
+    scraper.run_scraping()
+    return time.perf_counter() - start, len(scraper.db.articles)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pentru descărcarea concurentă')
+    parser.add_argument('--latency', type=float, default=0.2, help='Latența adăugată per cerere (secunde)')
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--rate', type=float, default=5.0, help='Cereri pe secundă per host')
+    parser.add_argument('--burst', type=int, default=4)
+    args = parser.parse_args()
+
+    with FixtureServer('hotnews', args.latency) as hotnews, FixtureServer('digi24', args.latency) as digi24:
+        configs = [
+            ('secvențial (1 fir, 1 cerere/s)', {'max_workers': 1, 'rate_per_host': 1.0, 'burst': 1}),
+            (f'concurent ({args.workers} fire, {args.rate} cereri/s/host)',
+             {'max_workers': args.workers, 'rate_per_host': args.rate, 'burst': args.burst}),
+        ]
+        for label, config in configs:
+            elapsed, count = run_cycle(hotnews.url, digi24.url, config)
+            print(f'{label:45s} {count:3d} articole în {elapsed:6.2f}s ({count / elapsed:6.2f} articole/s)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark: rânduri/s la inserare, câte un commit per articol vs. BufferedArticleWriter
+
+Rulare: python -m benchmarks.bench_insert --rows 2000 --batch-size 50
+"""
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+from article_writer import BufferedArticleWriter
+from benchmarks.standins import SqliteNewsDatabase
+
+
+def make_articles(prefix, count, bad_every=0):
+    articles = []
+    for i in range(count):
+        articles.append({
+            'title': f'Titlu {i}', 'source': 'HotNews', 'category': 'General', 'author': 'Autor',
+            # Un URL duplicat încalcă constrângerea UNIQUE și simulează un rând invalid
+            'url': f'https://hotnews.ro/stiri/{prefix}-{0 if bad_every and i % bad_every == 0 else i}',
+            'keywords': 'guvern, buget', 'description': 'Descriere scurtă', 'publishedAt': '2026-10-16 10:00:00',
+            'content': 'Conținut ' * 100, 'urlToImage': None
+        })
+    return articles
+
+
+def run(label, path, insert):
+    db = SqliteNewsDatabase(path)
+    db.connect()
+    db.connection.execute("PRAGMA dbo.synchronous = FULL")
+    start = time.perf_counter()
+    inserted = insert(db)
+    elapsed = time.perf_counter() - start
+    print(f'{label:38s} {inserted:6d} rânduri  {elapsed:7.2f}s  {inserted / elapsed:10.1f} rânduri/s  '
+          f'{db.connection.round_trips:6d} drumuri')
+    db.disconnect()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pentru inserarea în loturi')
+    parser.add_argument('--rows', type=int, default=2000)
+    parser.add_argument('--batch-size', type=int, default=50)
+    args = parser.parse_args()
+    logging.disable(logging.ERROR)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'news.db')
+
+        def one_by_one(db):
+            return sum(db.insert_article(a) for a in make_articles('single', args.rows))
+
+        def buffered(db, prefix, bad_every=0):
+            with BufferedArticleWriter(db, batch_size=args.batch_size) as writer:
+                for article in make_articles(prefix, args.rows, bad_every):
+                    writer.add(article)
+            return writer.inserted
+
+        run('insert_article (commit per rând)', path, one_by_one)
+        run(f'BufferedArticleWriter (lot {args.batch_size})', path, lambda db: buffered(db, 'batch'))
+        run('BufferedArticleWriter, 1% rânduri invalide', path, lambda db: buffered(db, 'bad', 100))
+
+
+if __name__ == '__main__':
+    main()
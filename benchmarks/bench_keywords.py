@@ -0,0 +1,71 @@
+"""Benchmark: articole/s pentru extragerea cuvintelor cheie - vechiul Counter, TF-IDF per articol și pe loturi
+
+Rulare: python -m benchmarks.bench_keywords --articles 20000 --batch-size 5000
+"""
+import argparse
+import re
+import time
+from collections import Counter
+
+from benchmarks.bench_search import ArticleGenerator, make_vocabulary
+from keyword_engine import KeywordExtractor, DocumentFrequencies, NUMPY_AVAILABLE
+
+
+def counter_keywords(title, content):
+    """Implementarea inițială din NewsScraper.extract_keywords, ca referință"""
+    text = f"{title} {content}".lower()
+    stop_words = {
+        'și', 'sau', 'dar', 'care', 'pentru', 'din', 'cu', 'la', 'pe', 'de', 'în', 'să', 'că', 'nu',
+        'se', 'au', 'este', 'sunt', 'era', 'vor', 'poate', 'toate', 'foarte', 'mai', 'după', 'până'
+    }
+    words = re.findall(r'\b[a-zA-ZăâîșțĂÂÎȘȚ]{3,}\b', text)
+    keywords = [word for word in words if word not in stop_words]
+    return ', '.join(word for word, count in Counter(keywords).most_common(10))
+
+
+def timed(label, func, count):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f'{label:38s} {elapsed:7.2f}s {count / elapsed:10,.0f} articole/s')
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pentru extragerea cuvintelor cheie')
+    parser.add_argument('--articles', type=int, default=20000)
+    parser.add_argument('--batch-size', type=int, default=5000)
+    parser.add_argument('--words', type=int, default=300, help='cuvinte per articol')
+    args = parser.parse_args()
+
+    generator = ArticleGenerator(make_vocabulary(20000))
+    articles = [(generator.words(8), generator.words(args.words)) for _ in range(args.articles)]
+    batches = [articles[i:i + args.batch_size] for i in range(0, len(articles), args.batch_size)]
+
+    timed('Counter (implementarea inițială)', lambda: [counter_keywords(*article) for article in articles],
+          len(articles))
+
+    single = KeywordExtractor(DocumentFrequencies(), vectorized=False)
+    # Costul fix comun tuturor variantelor: expresia regulată precompilată și filtrarea stop words
+    timed('doar tokenizare', lambda: [single.terms(*article) for article in articles], len(articles))
+    timed('TF-IDF per articol (cu actualizare DF)', lambda: [single.extract(*article) for article in articles],
+          len(articles))
+
+    # Loturile se scorează cu aceleași frecvențe de document, ca rezultatele să fie comparabile
+    python_batch = KeywordExtractor(single.frequencies, vectorized=False)
+    expected = timed('TF-IDF pe loturi, Python',
+                     lambda: [words for batch in batches for words in python_batch.extract_batch(batch, update=False)],
+                     len(articles))
+    if NUMPY_AVAILABLE:
+        numpy_batch = KeywordExtractor(single.frequencies, vectorized=True, min_vectorized_batch=1)
+        result = timed('TF-IDF pe loturi, NumPy',
+                       lambda: [words for batch in batches for words in numpy_batch.extract_batch(batch, update=False)],
+                       len(articles))
+        same = sum(1 for a, b in zip(expected, result) if a == b)
+        print(f'rezultate identice Python/NumPy: {same}/{len(articles)}')
+    else:
+        print('NumPy nu este instalat: modul vectorizat nu a fost măsurat')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark: generarea descrierilor, inline și secvențial vs. DescriptionPipeline, pe un LLM simulat local
+
+Rulare: python -m benchmarks.bench_llm --articles 40 --latency 0.5 --workers 4 --batch-size 4
+"""
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+from benchmarks.mock_llm_server import MockLLMServer
+from description_pipeline import CircuitBreaker, DescriptionCache, DescriptionPipeline
+from news_scraper import LLMDescriptionGenerator
+
+
+def make_articles(count, duplicate_ratio):
+    unique = max(1, int(count * (1 - duplicate_ratio)))
+    return [{'title': f'Știrea {i % unique}', 'content': f'Conținutul știrii {i % unique}. ' * 20}
+            for i in range(count)]
+
+
+def run(label, server, func):
+    server.requests = 0
+    start = time.perf_counter()
+    described = func()
+    elapsed = time.perf_counter() - start
+    print(f'{label:40s} {described:4d} descrieri  {elapsed:6.2f}s  {server.requests:4d} cereri LLM')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pentru etapa de descrieri LLM')
+    parser.add_argument('--articles', type=int, default=40)
+    parser.add_argument('--duplicates', type=float, default=0.25, help='Proporția de articole duplicate')
+    parser.add_argument('--latency', type=float, default=0.5)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--batch-size', type=int, default=4)
+    args = parser.parse_args()
+    logging.disable(logging.ERROR)
+
+    with MockLLMServer(args.latency) as server, tempfile.TemporaryDirectory() as tmp:
+        generator = LLMDescriptionGenerator(api_url=server.url, api_key='mock')
+
+        def inline():
+            articles = make_articles(args.articles, args.duplicates)
+            for article in articles:
+                article['description'] = generator.generate_description(article['title'], article['content'])
+            return len(articles)
+
+        def pipeline(batch_size, cache):
+            p = DescriptionPipeline(generator, cache, max_workers=args.workers, batch_size=batch_size, backoff=0.1)
+            return sum(1 for _ in p.process(iter(make_articles(args.articles, args.duplicates))))
+
+        cache = DescriptionCache(os.path.join(tmp, 'cache.db'))
+        run('inline, secvențial (comportamentul vechi)', server, inline)
+        run(f'pipeline, {args.workers} fire, fără lot', server, lambda: pipeline(1, None))
+        run(f'pipeline, {args.workers} fire, lot {args.batch_size}', server, lambda: pipeline(args.batch_size, None))
+        run(f'pipeline + cache (rece), lot {args.batch_size}', server, lambda: pipeline(args.batch_size, cache))
+        run('pipeline + cache (cald)', server, lambda: pipeline(args.batch_size, cache))
+
+        server.failure_rate = 1.0
+        p = DescriptionPipeline(generator, None, max_workers=args.workers, max_retries=2, backoff=0.05,
+                                breaker=CircuitBreaker(failure_threshold=3, reset_timeout=60))
+        run('LLM căzut, cu circuit breaker', server,
+            lambda: sum(1 for _ in p.process(iter(make_articles(args.articles, 0)))))
+        cache.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""Benchmark: detectarea duplicatelor aproximative (MinHash + LSH) - viteză, cost per căutare, precizie/recall
+
+Colecția este sintetică: articole originale plus copii republicate cu o parte din cuvinte schimbate și alt
+titlu, ca preluările dintre HotNews și Digi24. Căutarea LSH este comparată cu o comparație exhaustivă cu
+toate semnăturile indexate.
+
+Rulare: python -m benchmarks.bench_near_duplicates --sizes 1000 10000 50000 --edit-rate 0.05
+"""
+import argparse
+import random
+import time
+
+from benchmarks.bench_search import ArticleGenerator, make_vocabulary
+from near_duplicates import NearDuplicateDetector, estimated_similarity
+
+CONTENT_WORDS = 150
+PROBES = 500
+
+
+def republish(article, vocabulary, rng, edit_rate):
+    """Copia unui articol cu `edit_rate` din cuvinte înlocuite și titlul ușor schimbat"""
+    words = article['content'].split()
+    for i in range(len(words)):
+        if rng.random() < edit_rate:
+            words[i] = rng.choice(vocabulary)
+    title = article['title'].split()
+    title[rng.randrange(len(title))] = rng.choice(vocabulary)
+    return {'url': article['url'] + '?republicat', 'title': ' '.join(title), 'content': ' '.join(words)}
+
+
+def make_articles(size, vocabulary):
+    generator = ArticleGenerator(vocabulary)
+    return [{'url': f'https://hotnews.ro/stiri/{i}.html', 'title': generator.words(8),
+             'content': generator.words(CONTENT_WORDS)} for i in range(size)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pentru detectarea duplicatelor aproximative')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 50000])
+    parser.add_argument('--edit-rate', type=float, default=0.05)
+    parser.add_argument('--threshold', type=float, default=0.7)
+    args = parser.parse_args()
+
+    vocabulary = make_vocabulary(20000)
+    rng = random.Random(4)
+    print(f'{"indexate":>9s} {"semnături/s":>12s} {"LSH ms":>8s} {"exhaustiv ms":>13s} {"recall":>7s} {"fals poz.":>10s}')
+    for size in args.sizes:
+        articles = make_articles(size + PROBES, vocabulary)
+        indexed, unrelated = articles[:size], articles[size:]
+        detector = NearDuplicateDetector(policy='keep', threshold=args.threshold, max_size=size + 2 * PROBES)
+
+        start = time.perf_counter()
+        detector.warm(indexed)
+        signatures_per_second = size / (time.perf_counter() - start)
+
+        copies = [republish(article, vocabulary, rng, args.edit_rate) for article in rng.sample(indexed, PROBES)]
+        probes = [(detector.hasher.signature(detector.article_text(article)), expected)
+                  for article, expected in [(copy, True) for copy in copies] + [(other, False) for other in unrelated]]
+
+        start = time.perf_counter()
+        found = [detector.index.find(signature) is not None for signature, _ in probes]
+        lsh_ms = (time.perf_counter() - start) * 1000 / len(probes)
+
+        # Comparația exhaustivă pe un eșantion, altfel durează minute la 50000 de articole
+        sample = probes[:50]
+        signatures = [signature for signature, _ in detector.index.documents.values()]
+        start = time.perf_counter()
+        for signature, _ in sample:
+            any(estimated_similarity(signature, other) >= args.threshold for other in signatures)
+        exhaustive_ms = (time.perf_counter() - start) * 1000 / len(sample)
+
+        recall = sum(hit for hit, (_, expected) in zip(found, probes) if expected) / PROBES
+        false_positives = sum(hit for hit, (_, expected) in zip(found, probes) if not expected)
+        print(f'{size:9d} {signatures_per_second:12.0f} {lsh_ms:8.3f} {exhaustive_ms:13.3f} '
+              f'{recall:7.1%} {false_positives:10d}')
+
+
+if __name__ == '__main__':
+    main()
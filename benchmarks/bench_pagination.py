@@ -0,0 +1,75 @@
+"""Benchmark: latența per pagină, paginare OFFSET vs. keyset, pe măsură ce tabela crește
+
+Rulare: python -m benchmarks.bench_pagination --sizes 10000 100000 500000 --page-size 20
+"""
+import argparse
+import sqlite3
+import time
+from datetime import datetime, timedelta
+
+from benchmarks.standins import NEWS_SCHEMA
+from news_queries import build_news_query, encode_cursor, decode_cursor
+
+LIST_FIELDS = ['id', 'title', 'source', 'category', 'url', 'publishedAt']
+
+
+def create_table(rows):
+    conn = sqlite3.connect(':memory:')
+    conn.execute("ATTACH DATABASE ':memory:' AS dbo")
+    conn.execute(NEWS_SCHEMA)
+    # Indexul din sql/indexes.sql
+    conn.execute("CREATE INDEX dbo.IX_news_publishedAt_id ON news (publishedAt DESC, id DESC)")
+    start = datetime(2020, 1, 1)
+    conn.executemany(
+        "INSERT INTO dbo.news (title, source, category, author, url, keywords, description, publishedAt, content, urlToImage) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        ((f'Titlu {i}', 'HotNews', 'General', 'Autor', f'https://hotnews.ro/stiri/{i}', '', '',
+          (start + timedelta(minutes=i // 3)).strftime('%Y-%m-%d %H:%M:%S'), 'x' * 200, None)
+         for i in range(rows)))
+    conn.commit()
+    return conn
+
+
+def timed(conn, query, params, repeat=20):
+    best = float('inf')
+    rows = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = conn.execute(query, params).fetchall()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, rows
+
+
+def cursor_at(conn, position):
+    """Cursorul care pornește exact după rândul `position` (ca și cum clientul ar fi paginat până acolo)"""
+    published_at, article_id = conn.execute(
+        "SELECT publishedAt, id FROM dbo.news ORDER BY publishedAt DESC, id DESC LIMIT 1 OFFSET ?",
+        (position - 1,)).fetchone()
+    return encode_cursor(published_at.replace(' ', 'T'), article_id)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pentru paginarea keyset')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 500000])
+    parser.add_argument('--page-size', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f'{"rânduri":>9s} {"poziție":>9s} {"OFFSET ms":>10s} {"keyset ms":>10s}')
+    for size in args.sizes:
+        conn = create_table(size)
+        for position in (args.page_size, size // 2, size - args.page_size):
+            offset_query, params = build_news_query(LIST_FIELDS, dialect='sqlite')
+            offset_query += f" LIMIT {args.page_size} OFFSET {position}"
+            offset_ms, _ = timed(conn, offset_query, params)
+
+            published_at, article_id = decode_cursor(cursor_at(conn, position))
+            keyset_query, params = build_news_query(
+                LIST_FIELDS, cursor=(published_at.strftime('%Y-%m-%d %H:%M:%S'), article_id),
+                limit=args.page_size, dialect='sqlite')
+            keyset_ms, _ = timed(conn, keyset_query, params)
+            print(f'{size:9d} {position:9d} {offset_ms:10.3f} {keyset_ms:10.3f}')
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
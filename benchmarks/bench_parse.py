@@ -0,0 +1,83 @@
+"""Benchmark: timpul de parsare și memoria de vârf per pagină, pe paginile salvate HotNews/Digi24
+
+Fiecare variantă rulează într-un proces separat, ca vârful de RSS să nu fie influențat de celelalte.
+Rulare: python -m benchmarks.bench_parse --repeat 50
+"""
+import argparse
+import multiprocessing
+import resource
+import time
+import tracemalloc
+
+from benchmarks.fixture_server import load_fixture, render_article
+from html_parsing import LINK_STRAINER, LXML_AVAILABLE, SELECTOLAX_AVAILABLE, extract_links, make_soup
+from site_adapters import ADAPTERS
+
+ARTICLE_TAGS = {name: adapter.strainer for name, adapter in ADAPTERS.items()}
+
+
+def variants():
+    homepage = [
+        ('html.parser, arbore complet', lambda c, site: make_soup(c, parser='html.parser').find_all('a', href=True)),
+        ('html.parser + SoupStrainer', lambda c, site: make_soup(c, LINK_STRAINER, 'html.parser').find_all('a', href=True)),
+    ]
+    article = [
+        ('html.parser, arbore complet', lambda c, site: make_soup(c, parser='html.parser').find('h1')),
+        ('html.parser + SoupStrainer', lambda c, site: make_soup(c, ARTICLE_TAGS[site], 'html.parser').find('h1')),
+    ]
+    if LXML_AVAILABLE:
+        homepage += [
+            ('lxml + SoupStrainer', lambda c, site: make_soup(c, LINK_STRAINER, 'lxml').find_all('a', href=True)),
+            ('lxml XPath (extract_links)', lambda c, site: extract_links(c, 'lxml')),
+        ]
+        article += [
+            ('lxml, arbore complet', lambda c, site: make_soup(c, parser='lxml').find('h1')),
+            ('lxml + SoupStrainer', lambda c, site: make_soup(c, ARTICLE_TAGS[site], 'lxml').find('h1')),
+        ]
+    if SELECTOLAX_AVAILABLE:
+        homepage.append(('selectolax (extract_links)', lambda c, site: extract_links(c, 'selectolax')))
+    return {'homepage': homepage, 'article': article}
+
+
+def page_content(site, kind):
+    if kind == 'homepage':
+        return load_fixture(site, 'index.html').encode('utf-8')
+    return render_article(load_fixture(site, 'article.html'), '/stiri/guvernul-aproba-bugetul').encode('utf-8')
+
+
+def measure(args):
+    kind, index, site, repeat = args
+    label, func = variants()[kind][index]
+    content = page_content(site, kind)
+    func(content, site)
+    baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(content, site)
+    elapsed = (time.perf_counter() - start) / repeat
+    rss_delta = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline_rss
+    # Memoria se măsoară separat: tracemalloc încetinește alocările și ar distorsiona timpul
+    tracemalloc.start()
+    func(content, site)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return label, elapsed * 1000, peak / 1024, rss_delta
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pentru parsarea HTML')
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context('spawn')
+    print(f'{"pagină":18s} {"variantă":30s} {"ms/pagină":>10s} {"vârf heap KiB":>14s} {"+RSS KiB":>9s}')
+    for site in ('hotnews', 'digi24'):
+        for kind, items in variants().items():
+            for index in range(len(items)):
+                with context.Pool(1) as pool:
+                    label, ms, peak_kib, rss = pool.apply(measure, ((kind, index, site, args.repeat),))
+                print(f'{site + " " + kind:18s} {label:30s} {ms:10.2f} {peak_kib:14.0f} {rss:9d}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark: pagini parsate pe secundă, pe fire și în pool-ul de procese, de la 1 la N nuclee
+
+Paginile sunt articolele de fixture HotNews/Digi24, fiecare cu alt titlu. Pe fire debitul rămâne cel al unui
+singur nucleu (parsarea ține GIL-ul); în procese ar trebui să crească aproape liniar până la numărul de nuclee
+fizice. Se afișează și timpul de pornire și încălzire al fiecărui pool.
+
+Rulare: python -m benchmarks.bench_parse_scaling --pages 2000 --max-workers 8
+"""
+import argparse
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from benchmarks.fixture_server import load_fixture, render_article
+from parse_pool import ParsePool, parse_page
+from site_adapters import ADAPTERS
+
+
+def make_pages(count):
+    templates = {site: load_fixture(site, 'article.html') for site in ('hotnews', 'digi24')}
+    pages = []
+    for i in range(count):
+        site = 'hotnews' if i % 2 else 'digi24'
+        url = f'{ADAPTERS[site].homepage}/stire/articol-de-test-{i}.html'
+        pages.append((site, url, render_article(templates[site], url).encode('utf-8')))
+    return pages
+
+
+def measure(submit, pages):
+    start = time.perf_counter()
+    futures = [submit(*page) for page in pages]
+    wait(futures)
+    elapsed = time.perf_counter() - start
+    parsed = sum(1 for future in futures if future.result() is not None)
+    return elapsed, parsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pentru parsarea pe fire și în procese')
+    parser.add_argument('--pages', type=int, default=2000)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    logging.disable(logging.ERROR)
+
+    pages = make_pages(args.pages)
+    print(f'{args.pages} pagini, {os.cpu_count()} nuclee disponibile')
+    print(f'{"mod":10s} {"worker-i":>8s} {"încălzire s":>12s} {"pagini/s":>10s} {"accelerare":>11s} {"parsate":>8s}')
+
+    baseline = None
+    for workers in range(1, args.max_workers + 1):
+        with ThreadPoolExecutor(workers) as executor:
+            elapsed, parsed = measure(lambda *page: executor.submit(parse_page, *page), pages)
+        rate = len(pages) / elapsed
+        baseline = baseline or rate
+        print(f'{"fire":10s} {workers:8d} {0.0:12.2f} {rate:10.0f} {rate / baseline:10.2f}x {parsed:8d}')
+
+    for workers in range(1, args.max_workers + 1):
+        start = time.perf_counter()
+        pool = ParsePool(workers)
+        warm_up = time.perf_counter() - start
+        try:
+            elapsed, parsed = measure(pool.submit, pages)
+        finally:
+            pool.shutdown()
+        rate = len(pages) / elapsed
+        print(f'{"procese":10s} {workers:8d} {warm_up:12.2f} {rate:10.0f} {rate / baseline:10.2f}x {parsed:8d}')
+
+
+if __name__ == '__main__':
+    main()
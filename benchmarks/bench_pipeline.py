@@ -0,0 +1,66 @@
+"""Benchmark: articole/minut end-to-end pentru pipeline-ul de scraping, cu toate etapele simulate local
+
+Paginile vin de la serverele de fixture (cu latență), descrierile de la un LLM simulat, iar scrierea merge
+într-o bază SQLite cu latență de rețea adăugată. Se compară o configurație cu câte un worker per etapă
+(etapele nu se suprapun) cu configurația concurentă, și se afișează metricile fiecărei etape.
+
+Rulare: python -m benchmarks.bench_pipeline --page-latency 0.1 --llm-latency 0.3 --db-latency 0.005
+"""
+import argparse
+import logging
+import time
+
+from benchmarks.fixture_server import FixtureServer
+from benchmarks.mock_llm_server import MockLLMServer
+from benchmarks.standins import SqliteNewsDatabase
+from news_scraper import NewsScraper
+from site_adapters import ADAPTERS
+
+
+def run_cycle(urls, llm_url, db_latency, fetch_config, description_config, writer_config, pipeline_config):
+    scraper = NewsScraper({}, {'api_url': llm_url, 'api_key': 'benchmark'}, fetch_config, writer_config,
+                          description_config, pipeline_config=pipeline_config)
+    scraper.db = SqliteNewsDatabase(latency=db_latency)
+    scraper.adapters = []
+    for name, url in urls.items():
+        adapter = ADAPTERS[name].with_homepage(url)
+        adapter.max_links = 30
+        scraper.adapters.append(adapter)
+    start = time.perf_counter()
+    scraper.run_scraping()
+    return time.perf_counter() - start, scraper.pipeline.stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pentru pipeline-ul de scraping pe etape')
+    parser.add_argument('--page-latency', type=float, default=0.1)
+    parser.add_argument('--llm-latency', type=float, default=0.3)
+    parser.add_argument('--db-latency', type=float, default=0.005)
+    parser.add_argument('--workers', type=int, default=8)
+    args = parser.parse_args()
+    logging.disable(logging.ERROR)
+
+    no_cache = {'cache_path': None}
+    configs = [
+        ('câte un worker per etapă', {'max_workers': 1, 'rate_per_host': 0},
+         {'max_workers': 1, 'batch_size': 1, **no_cache}, {'batch_size': 1}, {'parse_workers': 1, 'queue_size': 1}),
+        ('etape concurente', {'max_workers': args.workers, 'rate_per_host': 0},
+         {'max_workers': 4, 'batch_size': 4, **no_cache}, {'batch_size': 50}, {'parse_workers': None, 'queue_size': 100}),
+    ]
+    with FixtureServer('hotnews', args.page_latency) as hotnews, \
+            FixtureServer('digi24', args.page_latency) as digi24, \
+            MockLLMServer(args.llm_latency) as llm:
+        urls = {'hotnews': hotnews.url, 'digi24': digi24.url}
+        for label, fetch_config, description_config, writer_config, pipeline_config in configs:
+            elapsed, stats = run_cycle(urls, llm.url, args.db_latency, fetch_config, description_config,
+                                       writer_config, pipeline_config)
+            print(f'\n{label}: {stats["stages"]["write"]["emitted"]} articole în {elapsed:.2f}s, '
+                  f'{stats["items_per_minute"]:.0f} articole/minut (pipeline)')
+            print(f'{"etapă":10s} {"worker-i":>8s} {"ieșite":>7s} {"coadă max":>10s} {"ocupat s":>9s} {"/s":>7s}')
+            for name, stage in stats['stages'].items():
+                print(f'{name:10s} {stage["concurrency"]:8d} {stage["emitted"]:7d} {stage["max_queue_depth"]:10d} '
+                      f'{stage["busy_seconds"]:9.2f} {stage["throughput_per_second"]:7.1f}')
+
+
+if __name__ == '__main__':
+    main()
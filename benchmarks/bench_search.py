@@ -0,0 +1,157 @@
+"""Benchmark: latența căutării în indexul FTS5 (p50/p99) față de LIKE pe dbo.news, pe măsură ce crește colecția
+
+Textele sunt sintetice, cu un vocabular românesc generat (cu diacritice) și frecvențe Zipf, ca să existe
+atât termeni rari cât și termeni foarte frecvenți. Înainte de măsurători se verifică paginarea: parcurgând
+toate paginile unei interogări, fiecare articol care se potrivește apare exact o dată, atât cu fereastra
+recentă cât și fără ea.
+
+Rulare: python -m benchmarks.bench_search --sizes 100000 1000000 --queries 200
+"""
+import argparse
+import itertools
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+
+from benchmarks.standins import NEWS_SCHEMA
+from search_index import SearchIndex
+
+SYLLABLES = ['ma', 'ră', 'ști', 'țe', 'lo', 'ca', 'pre', 'în', 'gu', 'ver', 'nul', 'bu', 'cu', 'reș',
+             'ti', 'co', 'mi', 'sie', 'ța', 'ne', 'ro', 'mâ', 'ni', 'a', 'li', 'ber', 'tă', 'de', 'pu', 'tat']
+INSERT_BATCH = 1000
+
+
+def make_vocabulary(size, seed=1):
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < size:
+        words.add(''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+class ArticleGenerator:
+    def __init__(self, vocabulary, seed=2):
+        self.vocabulary = vocabulary
+        self.rng = random.Random(seed)
+        # Frecvențe Zipf: cuvântul de rang r apare proporțional cu 1/r
+        self.cum_weights = list(itertools.accumulate(1 / rank for rank in range(1, len(vocabulary) + 1)))
+
+    def words(self, count):
+        return ' '.join(self.rng.choices(self.vocabulary, cum_weights=self.cum_weights, k=count))
+
+    def article(self, i):
+        return {
+            'url': f'https://hotnews.ro/stiri/{i}.html',
+            'source': 'HotNews' if i % 2 else 'Digi24',
+            'title': self.words(8),
+            'description': self.words(30),
+            'keywords': ', '.join(self.words(10).split()),
+        }
+
+
+def build(size, vocabulary, directory):
+    generator = ArticleGenerator(vocabulary)
+    index = SearchIndex(os.path.join(directory, f'search_{size}.db'))
+    table = sqlite3.connect(':memory:')
+    table.execute("ATTACH DATABASE ':memory:' AS dbo")
+    table.execute(NEWS_SCHEMA)
+    start = time.perf_counter()
+    for offset in range(0, size, INSERT_BATCH):
+        batch = [generator.article(i) for i in range(offset, min(size, offset + INSERT_BATCH))]
+        index.add_articles(batch)
+        table.executemany(
+            "INSERT INTO dbo.news (url, source, title, description, keywords) VALUES (?, ?, ?, ?, ?)",
+            [(a['url'], a['source'], a['title'], a['description'], a['keywords']) for a in batch])
+    index.optimize()
+    table.commit()
+    return index, table, time.perf_counter() - start
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    return statistics.median(samples), samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+
+
+def timed(func, queries):
+    samples = []
+    for query in queries:
+        start = time.perf_counter()
+        func(query)
+        samples.append((time.perf_counter() - start) * 1000)
+    return percentiles(samples)
+
+
+def check_pagination(vocabulary, size=300, limit=20):
+    """Parcurge toate paginile fiecărei interogări și compară cu toate documentele care se potrivesc"""
+    generator = ArticleGenerator(vocabulary)
+    articles = [generator.article(i) for i in range(size)]
+    rng = random.Random(4)
+    queries = [query for query in vocabulary[:10] + [rng.choice(vocabulary[10:500]) for _ in range(20)]
+               if SearchIndex.match_expression(query)]
+    # Un prag mic ca termenii frecvenți să folosească fereastra, iar cei rari să caute în toată colecția
+    for recent_min_hits in (1, 10, size + 1):
+        index = SearchIndex(':memory:', recent_window=size // 2, recent_min_hits=recent_min_hits)
+        index.add_articles(articles)
+        for query, source in itertools.product(queries, (None, 'HotNews')):
+            expected = {url for url, _ in index._search(index.match_expression(query), -1, 0, source)}
+            seen, page = [], 0
+            while True:
+                hits = index.search(query, limit=limit, offset=page * limit, source=source)
+                seen += [url for url, _ in hits]
+                if len(hits) < limit:
+                    break
+                page += 1
+            if len(seen) != len(set(seen)) or set(seen) != expected:
+                raise AssertionError(f"Paginare greșită pentru {query!r} (sursa {source}, prag {recent_min_hits}): "
+                                     f"{len(seen)} rezultate, {len(set(seen))} unice, {len(expected)} așteptate")
+    print(f'Paginare verificată: {len(queries)} interogări, {size} articole, pagini de {limit}')
+
+
+def like_search(table, query, limit=20):
+    clauses = ' AND '.join("(title LIKE ? OR description LIKE ? OR keywords LIKE ?)" for _ in query.split())
+    params = [f'%{word}%' for word in query.split() for _ in range(3)]
+    return table.execute(f"SELECT url FROM dbo.news WHERE {clauses} LIMIT {limit}", params).fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pentru căutarea full-text')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100000, 1000000])
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--vocabulary', type=int, default=20000)
+    parser.add_argument('--like-max-size', type=int, default=200000,
+                        help='LIKE se măsoară doar până la această dimensiune (scanează toată tabela)')
+    args = parser.parse_args()
+
+    vocabulary = make_vocabulary(args.vocabulary)
+    check_pagination(vocabulary)
+    rng = random.Random(3)
+    # Rangul în vocabular dă frecvența: primele cuvinte sunt foarte frecvente, cele din coadă rare
+    mixes = {
+        'termen rar': [rng.choice(vocabulary[5000:]) for _ in range(args.queries)],
+        'termen frecvent': [rng.choice(vocabulary[:20]) for _ in range(args.queries)],
+        'doi termeni': [f'{rng.choice(vocabulary[:200])} {rng.choice(vocabulary[200:2000])}'
+                        for _ in range(args.queries)],
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            index, table, build_seconds = build(size, vocabulary, directory)
+            print(f'\n{size} articole: indexare {build_seconds:.1f}s ({size / build_seconds:,.0f} articole/s), '
+                  f'{os.path.getsize(index.path) / 1e6:.0f} MB')
+            print(f'{"interogare":18s} {"FTS p50":>9s} {"FTS p99":>9s} {"pag.10 p50":>11s} {"LIKE p50":>10s}')
+            for name, queries in mixes.items():
+                fts_p50, fts_p99 = timed(lambda q: index.search(q, limit=21), queries)
+                deep_p50, _ = timed(lambda q: index.search(q, limit=21, offset=180), queries)
+                like = '-'
+                if size <= args.like_max_size:
+                    like_p50, _ = timed(lambda q: like_search(table, q), queries[:10])
+                    like = f'{like_p50:.2f}'
+                print(f'{name:18s} {fts_p50:9.2f} {fts_p99:9.2f} {deep_p50:11.2f} {like:>10s}')
+            table.close()
+
+
+if __name__ == '__main__':
+    main()
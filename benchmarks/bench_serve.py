@@ -0,0 +1,114 @@
+"""Benchmark: debitul API-ului sub serverul de dezvoltare Flask față de `python main.py serve` (gunicorn, waitress)
+
+Fiecare configurație pornește `main.py` într-un proces separat, peste aceeași bază SQLite generată (cu
+indexul de căutare), și primește același amestec de cereri ca scenariul `api` din suită
+(`benchmarks/load_generator.py`). Cache-ul de răspunsuri este dezactivat implicit, ca fiecare cerere să
+ajungă la baza de date.
+
+Rulare: python -m benchmarks.bench_serve --workers 1 2 4 --threads 4 --concurrency 16 --requests 2000
+"""
+import argparse
+import importlib.util
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import requests
+
+from benchmarks.load_generator import run_load
+from benchmarks.suite import api_paths, create_api_database
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def configurations(workers, threads):
+    """(nume, comanda main.py, variabile de mediu) pentru serverele disponibile"""
+    configs = [('flask (api)', 'api', {'API_DEBUG': 'false'})]
+    if importlib.util.find_spec('waitress') is not None:
+        configs.append((f'waitress 1x{threads}', 'serve', {'API_SERVER': 'waitress', 'API_THREADS': str(threads)}))
+    if sys.platform != 'win32' and importlib.util.find_spec('gunicorn') is not None:
+        for count in workers:
+            configs.append((f'gunicorn {count}x{threads}', 'serve',
+                            {'API_SERVER': 'gunicorn', 'API_WORKERS': str(count), 'API_THREADS': str(threads)}))
+    return configs
+
+
+def wait_until_ready(base_url, process, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Serverul s-a oprit la pornire (cod {process.returncode})")
+        try:
+            if requests.get(f'{base_url}/api/pool', timeout=1).status_code == 200:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Serverul nu a răspuns în {timeout}s")
+
+
+def measure(command, extra_env, env, workdir, paths, concurrency, total_requests):
+    port = free_port()
+    env = dict(env, API_HOST='127.0.0.1', API_PORT=str(port), **extra_env)
+    with open(os.path.join(workdir, f'{command}_{port}.log'), 'w') as log:
+        process = subprocess.Popen([sys.executable, os.path.join(ROOT, 'main.py'), command], cwd=workdir, env=env,
+                                   stdout=log, stderr=subprocess.STDOUT)
+        base_url = f'http://127.0.0.1:{port}'
+        try:
+            wait_until_ready(base_url, process)
+            return run_load(base_url, paths, concurrency, total_requests)
+        finally:
+            # SIGTERM: gunicorn așteaptă cererile în curs, waitress și Flask se opresc imediat
+            process.terminate()
+            try:
+                process.wait(15)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pentru serverul de dezvoltare față de serve')
+    parser.add_argument('--articles', type=int, default=5000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2 * (os.cpu_count() or 1) + 1])
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--cache-size', type=int, default=0)
+    args = parser.parse_args()
+
+    from search_index import SearchIndex
+
+    workdir = tempfile.mkdtemp(prefix='bench_serve_')
+    try:
+        db_path = os.path.join(workdir, 'news.db')
+        articles = create_api_database(db_path, args.articles)
+        index_path = os.path.join(workdir, 'search_index.db')
+        SearchIndex(index_path).add_articles(articles)
+        env = dict(os.environ, DB_BACKEND='sqlite', SQLITE_PATH=db_path, DB_READ_ONLY='true',
+                   DB_POOL_MAX=str(max(args.threads, args.concurrency)), SEARCH_INDEX_PATH=index_path,
+                   CONTENT_ARCHIVE_PATH='', API_CACHE_SIZE=str(args.cache_size))
+        paths = api_paths(articles)
+
+        print(f'{args.articles} articole, {args.requests} cereri, concurență {args.concurrency}, '
+              f'{os.cpu_count()} nuclee disponibile')
+        print(f'{"server":18s} {"cereri/s":>9s} {"p50 ms":>8s} {"p99 ms":>8s} {"erori":>6s}')
+        for name, command, extra_env in configurations(args.workers, args.threads):
+            result = measure(command, extra_env, env, workdir, paths, args.concurrency, args.requests)
+            print(f'{name:18s} {result["requests_per_second"]:9.1f} {result["p50_ms"]:8.1f} '
+                  f'{result["p99_ms"]:8.1f} {result["errors"]:6d}')
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""Benchmark: timpul de pornire al fiecărei comenzi din main.py, cu importuri per comandă față de importuri la pornire
+
+Pentru fiecare comandă, un proces nou importă `main` și modulele pe care le încarcă funcția comenzii înainte
+de a începe lucrul (`COMMAND_IMPORTS`, oglinda importurilor din main.py). Varianta „eager” importă toate
+modulele, cum făcea main.py înainte. Se raportează:
+
+- timpul de import măsurat de `python -X importtime` (modulele de la nivelul de sus, fără pornirea interpretorului)
+- durata totală a procesului, mediana din `--runs` rulări
+
+Procesele rulează într-un director temporar, cu backend-ul SQLite, ca importul lui api_server să nu aibă
+nevoie de SQL Server.
+
+Rulare: python -m benchmarks.bench_startup --runs 10
+"""
+import argparse
+import importlib.util
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+COMMAND_IMPORTS = {
+    'test': [],
+    'index': ['search_index'],
+    'keywords': ['keyword_engine', 'numpy'],
+    'scrape': ['news_scraper'],
+    'scheduler': ['news_scraper', 'source_scheduler'],
+    'reprocess': ['news_scraper', 'reprocessor', 'site_adapters', 'parse_pool', 'numpy'],
+    'api': ['api_server'],
+}
+EAGER_IMPORTS = ['news_scraper', 'news_queries', 'storage', 'search_index', 'keyword_engine', 'numpy',
+                 'site_adapters', 'source_scheduler', 'reprocessor', 'api_server']
+
+
+def available(modules):
+    # NumPy este opțional
+    return [module for module in modules if module != 'numpy' or importlib.util.find_spec('numpy')]
+
+
+def import_seconds(stderr):
+    """Suma timpilor cumulați ai importurilor de la nivelul de sus din ieșirea `-X importtime`"""
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line.split('|')
+        if not name.startswith(' ') or name.startswith('  '):
+            continue
+        if name.strip() in ('site', 'encodings') or not cumulative.strip().isdigit():
+            continue
+        total += int(cumulative)
+    return total / 1e6
+
+
+def measure(modules, runs, workdir, env):
+    code = '; '.join(f'import {module}' for module in ['main', *modules])
+    imports, wall = [], []
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=workdir, env=env,
+                                capture_output=True, text=True)
+        wall.append(time.perf_counter() - started)
+        if result.returncode:
+            raise RuntimeError(f"Importul a eșuat ({code}):\n{result.stderr[-2000:]}")
+        imports.append(import_seconds(result.stderr))
+    return statistics.median(imports), statistics.median(wall)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pentru timpul de pornire al comenzilor')
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.getenv('PYTHONPATH')])),
+                   DB_BACKEND='sqlite', SQLITE_PATH=os.path.join(workdir, 'news.db'))
+        eager_imports, eager_wall = measure(available(EAGER_IMPORTS), args.runs, workdir, env)
+        print(f'{args.runs} rulări per comandă; eager: import {eager_imports * 1000:.0f} ms, '
+              f'proces {eager_wall * 1000:.0f} ms')
+        print(f'{"comandă":10s} {"import ms":>10s} {"proces ms":>10s} {"câștig ms":>10s}')
+        for command, modules in COMMAND_IMPORTS.items():
+            imports, wall = measure(available(modules), args.runs, workdir, env)
+            print(f'{command:10s} {imports * 1000:10.0f} {wall * 1000:10.0f} '
+                  f'{(eager_wall - wall) * 1000:10.0f}')
+
+
+if __name__ == '__main__':
+    main()
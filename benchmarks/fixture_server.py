@@ -0,0 +1,97 @@
+"""Server HTTP local care servește paginile salvate HotNews/Digi24 cu latență adăugată
+
+Răspunsurile au ETag (hash-ul corpului) și se respectă If-None-Match, ca în cazul site-urilor reale.
+"""
+import hashlib
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def load_fixture(site, name):
+    with open(os.path.join(FIXTURES_DIR, site, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def render_article(template, path):
+    """Completează șablonul de articol cu un titlu derivat din URL, ca fiecare pagină să fie distinctă"""
+    slug = path.rstrip('/').rsplit('/', 1)[-1].replace('.html', '')
+    title = slug.replace('-', ' ').capitalize()
+    return template.replace('{title}', title).replace('{slug}', slug)
+
+
+class FixtureServer:
+    """Rulează un ThreadingHTTPServer pe un port liber, într-un fir separat"""
+
+    def __init__(self, site, latency=0.0, host='127.0.0.1', port=0):
+        self.site = site
+        self.latency = latency
+        self.requests = 0
+        self.lock = threading.Lock()
+        self.index = load_fixture(site, 'index.html')
+        self.article = load_fixture(site, 'article.html')
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                with server.lock:
+                    server.requests += 1
+                if server.latency:
+                    time.sleep(server.latency)
+                path = self.path.split('?', 1)[0]
+                if path in ('', '/'):
+                    body = server.index
+                elif '/stiri/' in path:
+                    body = render_article(server.article, path)
+                else:
+                    self.send_error(404)
+                    return
+                payload = body.encode('utf-8')
+                etag = '"' + hashlib.md5(payload).hexdigest() + '"'
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('ETag', etag)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,102 @@
+"""Generator de încărcare pentru API: clienți concurenți cu sesiuni keep-alive, latențe p50/p99 și cereri/s
+
+Fiecare client parcurge lista de căi în ordine, pornind de la alt index, până la numărul total de cereri.
+Se poate folosi și singur, împotriva unui server pornit separat:
+
+Rulare: python -m benchmarks.load_generator --url http://127.0.0.1:5000 --concurrency 16 --requests 2000 \\
+            --path "/api/news?limit=20" --path "/api/news/search?q=guvern"
+"""
+import argparse
+import json
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+
+def percentile(values, fraction):
+    """Percentila prin rangul cel mai apropiat, pe o listă sortată"""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, math.ceil(fraction * len(values)) - 1))
+    return values[index]
+
+
+def latency_stats(latencies):
+    latencies = sorted(latencies)
+    return {
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 3),
+        'p90_ms': round(percentile(latencies, 0.90) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 3),
+        'max_ms': round(latencies[-1] * 1000, 3) if latencies else 0.0
+    }
+
+
+def run_load(base_url, paths, concurrency=8, total_requests=1000, warm_up=50, timeout=30):
+    """Trimite `total_requests` cereri din `concurrency` fire; returnează latențele per cale și per total"""
+    paths = list(paths)
+    counter = iter(range(total_requests))
+    lock = threading.Lock()
+    results = {path: [] for path in paths}
+    errors = {path: 0 for path in paths}
+
+    def client(offset):
+        session = requests.Session()
+        latencies, failed = {path: [] for path in paths}, {path: 0 for path in paths}
+        for i in range(warm_up // concurrency + 1):
+            session.get(base_url + paths[(offset + i) % len(paths)], timeout=timeout)
+        step = offset
+        while True:
+            with lock:
+                if next(counter, None) is None:
+                    break
+            path = paths[step % len(paths)]
+            step += 1
+            started = time.perf_counter()
+            try:
+                response = session.get(base_url + path, timeout=timeout)
+                response.content
+                ok = response.status_code < 400
+            except requests.RequestException:
+                ok = False
+            latencies[path].append(time.perf_counter() - started)
+            failed[path] += not ok
+        session.close()
+        with lock:
+            for path in paths:
+                results[path].extend(latencies[path])
+                errors[path] += failed[path]
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as executor:
+        list(executor.map(client, range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    everything = [latency for latencies in results.values() for latency in latencies]
+    return {
+        'requests': len(everything),
+        'errors': sum(errors.values()),
+        'concurrency': concurrency,
+        'elapsed_seconds': round(elapsed, 3),
+        'requests_per_second': round(len(everything) / elapsed, 1) if elapsed else 0.0,
+        **latency_stats(everything),
+        'paths': {path: {'requests': len(results[path]), 'errors': errors[path], **latency_stats(results[path])}
+                  for path in paths}
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generator de încărcare pentru API')
+    parser.add_argument('--url', default='http://127.0.0.1:5000')
+    parser.add_argument('--path', action='append', dest='paths', help='cale de cerut (se poate repeta)')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=1000)
+    args = parser.parse_args()
+    result = run_load(args.url.rstrip('/'), args.paths or ['/api/news?limit=20'], args.concurrency, args.requests)
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""Server HTTP local care imită endpoint-ul chat/completions, cu latență și rată de erori configurabile"""
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class MockLLMServer:
+    def __init__(self, latency=0.5, failure_rate=0.0, host='127.0.0.1', port=0):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.requests = 0
+        self.lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}/v1/chat/completions'
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_POST(self):
+                with server.lock:
+                    server.requests += 1
+                payload = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+                time.sleep(server.latency)
+                if random.random() < server.failure_rate:
+                    self._reply(500, {'error': 'mock failure'})
+                    return
+                prompt = payload['messages'][-1]['content']
+                batch = re.search(r'listă JSON de (\d+)', prompt)
+                if batch:
+                    titles = re.findall(r'Titlu: (.*)', prompt)
+                    content = json.dumps([f'Rezumat: {title.strip()}' for title in titles[:int(batch.group(1))]],
+                                         ensure_ascii=False)
+                else:
+                    title = re.search(r'Titlu: (.*)', prompt)
+                    content = f'Rezumat: {title.group(1).strip() if title else ""}'
+                self._reply(200, {'choices': [{'message': {'role': 'assistant', 'content': content}}]})
+
+            def _reply(self, status, body):
+                data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,113 @@
+"""Înlocuitori locali pentru NewsDatabase, folosiți de benchmark-uri"""
+import threading
+import time
+
+from news_scraper import NewsDatabase
+from storage import SqliteBackend
+from url_cache import KnownUrlCache
+
+NEWS_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS dbo.news (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT, source TEXT, category TEXT, author TEXT,
+        url TEXT UNIQUE, keywords TEXT, description TEXT,
+        publishedAt TEXT, content TEXT, urlToImage TEXT
+    )
+"""
+
+
+class MemoryNewsDatabase:
+    """Aceeași interfață ca NewsDatabase, dar păstrează articolele în memorie"""
+
+    def __init__(self):
+        self.articles = {}
+        self.known_urls = KnownUrlCache()
+        self.lock = threading.Lock()
+
+    def connect(self):
+        return True
+
+    def disconnect(self):
+        pass
+
+    def warm_url_cache(self):
+        pass
+
+    def existing_urls(self, urls):
+        with self.lock:
+            return {url for url in urls if url in self.articles}
+
+    def article_exists(self, url):
+        return url in self.existing_urls([url])
+
+    def insert_article(self, article_data):
+        with self.lock:
+            self.articles[article_data['url']] = article_data
+        return True
+
+    def insert_articles(self, articles):
+        for article_data in articles:
+            self.insert_article(article_data)
+        return list(articles), []
+
+
+class CountingCursor:
+    """Cursor care numără drumurile dus-întors și simulează latența rețelei spre server"""
+
+    def __init__(self, cursor, owner):
+        self._cursor = cursor
+        self._owner = owner
+
+    def _round_trip(self):
+        self._owner.round_trips += 1
+        if self._owner.latency:
+            time.sleep(self._owner.latency)
+
+    def execute(self, *args):
+        self._round_trip()
+        self._cursor.execute(*args)
+        return self
+
+    def executemany(self, *args):
+        self._round_trip()
+        self._cursor.executemany(*args)
+        return self
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class CountingConnection:
+    def __init__(self, connection, latency=0.0):
+        self._connection = connection
+        self.latency = latency
+        self.round_trips = 0
+
+    def cursor(self):
+        return CountingCursor(self._connection.cursor(), self)
+
+    def commit(self):
+        self.round_trips += 1
+        if self.latency:
+            time.sleep(self.latency)
+        self._connection.commit()
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+
+class SqliteNewsDatabase(NewsDatabase):
+    """NewsDatabase peste backend-ul SQLite, cu drumurile dus-întors numărate și latență de rețea simulată"""
+
+    def __init__(self, path=':memory:', latency=0.0, **kwargs):
+        super().__init__(storage=SqliteBackend(path), **kwargs)
+        self.latency = latency
+
+    def connect(self):
+        self.connection = CountingConnection(self.storage.connect(), self.latency)
+        return True
+
+    def disconnect(self):
+        if self.connection:
+            self.connection.close()
+
@@ -0,0 +1,311 @@
+"""Suita de benchmark-uri offline: scraper, parsare și API, cu rezultate JSON comparabile între commit-uri
+
+Totul rulează local, fără SQL Server și fără internet: paginile vin de la serverele de fixture HotNews/Digi24
+(cu latență), descrierile de la LLM-ul simulat, articolele se scriu în SQLite (`SqliteNewsDatabase`), iar
+API-ul servește o bază SQLite generată, sub încărcarea din `load_generator.py`. Fiecare scenariu rulează
+într-un proces separat, ca memoria maximă (peak RSS) să fie a scenariului respectiv. Datele generate folosesc
+seed-uri fixe.
+
+Rezultatele se salvează în `benchmarks/results/<dată>_<commit>.json`. Cu `--compare` se compară cu o rulare
+anterioară (un fișier sau `latest`). Orice metrică mai slabă cu peste `--tolerance` este raportată ca
+regresie, iar codul de ieșire devine 1.
+
+Rulare: python -m benchmarks.suite
+        python -m benchmarks.suite --quick --scenarios parse api --compare latest
+"""
+import argparse
+import glob
+import json
+import logging
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 1: mai mare este mai bine, -1: mai mic este mai bine; doar aceste metrici intră în comparație
+DIRECTIONS = {
+    'articles_per_second': 1,
+    'pages_per_second': 1,
+    'requests_per_second': 1,
+    'p50_ms': -1,
+    'p99_ms': -1,
+    'peak_rss_mb': -1
+}
+
+DEFAULTS = {
+    'scrape': {'page_latency': 0.05, 'llm_latency': 0.1, 'db_latency': 0.002, 'max_links': 30, 'workers': 8},
+    'parse': {'pages': 1000},
+    'api': {'articles': 50000, 'requests': 3000, 'concurrency': 8, 'cache_size': 0}
+}
+QUICK = {
+    'scrape': {'page_latency': 0.01, 'llm_latency': 0.02, 'db_latency': 0.0, 'max_links': 10},
+    'parse': {'pages': 200},
+    'api': {'articles': 5000, 'requests': 500}
+}
+
+
+def peak_rss_mb():
+    """Memoria rezidentă maximă a procesului curent; None unde modulul resource lipsește (Windows)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux raportează KB, macOS octeți
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def scenario_scrape(params):
+    """Un ciclu complet de scraping pe ambele surse; articole inserate pe secundă"""
+    from benchmarks.fixture_server import FixtureServer
+    from benchmarks.mock_llm_server import MockLLMServer
+    from benchmarks.standins import SqliteNewsDatabase
+    from news_scraper import NewsScraper
+    from site_adapters import ADAPTERS
+
+    with FixtureServer('hotnews', params['page_latency']) as hotnews, \
+            FixtureServer('digi24', params['page_latency']) as digi24, \
+            MockLLMServer(params['llm_latency']) as llm:
+        # Articolele de fixture au același șablon: fără politică de duplicate, toate se inserează
+        scraper = NewsScraper({}, {'api_url': llm.url, 'api_key': 'benchmark'},
+                              {'max_workers': params['workers'], 'rate_per_host': 0},
+                              description_config={'cache_path': None, 'batch_size': 4},
+                              dedup_config=None, metrics_config={'summary_path': None})
+        scraper.db = SqliteNewsDatabase(latency=params['db_latency'])
+        scraper.adapters = []
+        for name, url in (('hotnews', hotnews.url), ('digi24', digi24.url)):
+            adapter = ADAPTERS[name].with_homepage(url)
+            adapter.max_links = params['max_links']
+            scraper.adapters.append(adapter)
+        started = time.perf_counter()
+        inserted = sum(scraper.run_scraping().values())
+        elapsed = time.perf_counter() - started
+    stages = scraper.last_run_summary['pipeline']['stages']
+    return {
+        'articles': inserted,
+        'elapsed_seconds': round(elapsed, 3),
+        'articles_per_second': round(inserted / elapsed, 2),
+        'stage_busy_seconds': {name: stage['busy_seconds'] for name, stage in stages.items()}
+    }
+
+
+def scenario_parse(params):
+    """Parsarea paginilor de articol de fixture pe un singur fir"""
+    from benchmarks.bench_parse_scaling import make_pages
+    from parse_pool import parse_page
+
+    pages = make_pages(params['pages'])
+    started = time.perf_counter()
+    parsed = sum(1 for page in pages if parse_page(*page) is not None)
+    elapsed = time.perf_counter() - started
+    return {
+        'pages': len(pages),
+        'parsed': parsed,
+        'elapsed_seconds': round(elapsed, 3),
+        'pages_per_second': round(len(pages) / elapsed, 1)
+    }
+
+
+def create_api_database(path, count):
+    """dbo.news cu `count` articole sintetice, în backend-ul SQLite (cu indexurile lui); returnează articolele"""
+    from benchmarks.bench_search import ArticleGenerator, make_vocabulary
+    from storage import SqliteBackend
+
+    generator = ArticleGenerator(make_vocabulary(5000))
+    start = datetime(2024, 1, 1)
+    articles = []
+    for i in range(count):
+        articles.append({
+            'title': generator.words(8).capitalize(),
+            'source': 'HotNews' if i % 2 else 'Digi24',
+            'category': ('Politică', 'Economie', 'Sport', 'Externe')[i % 4],
+            'author': f'Autor {i % 50}',
+            'url': f'https://www.example.ro/stiri/articol-{i}.html',
+            'keywords': generator.words(10).replace(' ', ', '),
+            'description': generator.words(25),
+            'publishedAt': (start + timedelta(minutes=i)).strftime('%Y-%m-%d %H:%M:%S'),
+            'content': generator.words(300),
+            'urlToImage': None
+        })
+    conn = SqliteBackend(path).connect()
+    columns = list(articles[0])
+    conn.executemany(f"INSERT INTO dbo.news ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                     ([article[column] for column in columns] for article in articles))
+    conn.commit()
+    conn.close()
+    return articles
+
+
+def api_paths(articles):
+    """Amestecul de cereri al scenariului api: listări, paginare cu cursor, căutări și articole după id"""
+    from news_queries import encode_cursor
+
+    rng = random.Random(0)
+    middle = articles[len(articles) // 2]
+    cursor = encode_cursor(datetime.fromisoformat(middle['publishedAt']), len(articles) // 2)
+    frequent, rare = articles[0]['title'].split()[0], articles[-1]['title'].split()[-1]
+    return [
+        '/api/news?limit=20',
+        '/api/news?limit=20&source=HotNews',
+        f'/api/news?limit=20&cursor={cursor}',
+        '/api/news?limit=100&fields=id,title,url,publishedAt',
+        f'/api/news/search?q={frequent}',
+        f'/api/news/search?q={rare}',
+        *(f'/api/news/{rng.randint(1, len(articles))}' for _ in range(4))
+    ]
+
+
+def scenario_api(params):
+    """Încărcare mixtă pe /api/news, /api/news/<id> și /api/news/search, servite de Werkzeug cu fire"""
+    from werkzeug.serving import make_server
+    from benchmarks.load_generator import run_load
+
+    workdir = tempfile.mkdtemp(prefix='bench_api_')
+    db_path = os.path.join(workdir, 'news.db')
+    articles = create_api_database(db_path, params['articles'])
+    # api_server citește configurația la import
+    os.environ.update({
+        'DB_BACKEND': 'sqlite',
+        'SQLITE_PATH': db_path,
+        'DB_POOL_MAX': str(params['concurrency']),
+        'SEARCH_INDEX_PATH': os.path.join(workdir, 'search_index.db'),
+        'API_CACHE_SIZE': str(params['cache_size'])
+    })
+    import api_server
+
+    if api_server.search_index is not None:
+        api_server.search_index.add_articles(articles)
+
+    paths = api_paths(articles)
+    server = make_server('127.0.0.1', 0, api_server.app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        result = run_load(f'http://127.0.0.1:{server.server_port}', paths, params['concurrency'], params['requests'])
+    finally:
+        server.shutdown()
+        shutil.rmtree(workdir, ignore_errors=True)
+    return result
+
+
+SCENARIOS = {'scrape': scenario_scrape, 'parse': scenario_parse, 'api': scenario_api}
+
+
+def run_in_process(name, params):
+    """Rulează scenariul într-un proces nou; ultimul rând din stdout este rezultatul JSON"""
+    completed = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.suite', '--run-scenario', name, '--params', json.dumps(params)],
+        cwd=ROOT_DIR, capture_output=True, text=True, encoding='utf-8'
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Scenariul {name} a eșuat:\n{completed.stderr.strip()}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def find_latest(exclude=None):
+    paths = sorted(path for path in glob.glob(os.path.join(RESULTS_DIR, '*.json')) if path != exclude)
+    return paths[-1] if paths else None
+
+
+def compare(current, baseline, tolerance):
+    """Afișează diferențele față de `baseline`; returnează lista regresiilor"""
+    regressions = []
+    print(f'\nComparație cu {baseline.get("commit") or "?"} ({baseline.get("timestamp")}):')
+    for name, result in current['scenarios'].items():
+        previous = baseline.get('scenarios', {}).get(name)
+        if not previous:
+            continue
+        for metric, direction in DIRECTIONS.items():
+            new, old = result.get(metric), previous.get(metric)
+            if not new or not old:
+                continue
+            change = (new - old) / old
+            worse = -change * direction > tolerance
+            label = 'REGRESIE' if worse else ''
+            print(f'  {name:7s} {metric:20s} {old:>12} -> {new:>12} {change:+7.1%} {label}')
+            if worse:
+                regressions.append((name, metric, old, new))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Suita de benchmark-uri offline')
+    parser.add_argument('--scenarios', nargs='+', choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument('--quick', action='store_true', help='dimensiuni mici, pentru o verificare rapidă')
+    parser.add_argument('--set', nargs='+', default=[], metavar='SCENARIU.PARAM=VALOARE',
+                        help='suprascrie parametri, de ex. api.concurrency=16')
+    parser.add_argument('--output', default=None, help='fișierul de rezultate (implicit în benchmarks/results)')
+    parser.add_argument('--compare', default=None, help='fișier de rezultate anterior sau `latest`')
+    parser.add_argument('--tolerance', type=float, default=0.10)
+    parser.add_argument('--run-scenario', help=argparse.SUPPRESS)
+    parser.add_argument('--params', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_scenario:
+        logging.disable(logging.CRITICAL)
+        random.seed(0)
+        result = SCENARIOS[args.run_scenario](json.loads(args.params))
+        result['peak_rss_mb'] = peak_rss_mb()
+        print(json.dumps(result, ensure_ascii=False))
+        return
+
+    params = {name: {**DEFAULTS[name], **(QUICK[name] if args.quick else {})} for name in args.scenarios}
+    for override in args.set:
+        key, value = override.split('=', 1)
+        scenario, name = key.split('.', 1)
+        if scenario in params:
+            params[scenario][name] = json.loads(value)
+
+    commit = git_commit()
+    results = {
+        'commit': commit,
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'params': params,
+        'scenarios': {}
+    }
+    for name in args.scenarios:
+        print(f'{name}: {json.dumps(params[name])}', flush=True)
+        result = results['scenarios'][name] = run_in_process(name, params[name])
+        summary = {metric: result[metric] for metric in DIRECTIONS if metric in result}
+        print(f'  {json.dumps(summary)}', flush=True)
+
+    baseline_path = find_latest() if args.compare == 'latest' else args.compare
+    output = args.output or os.path.join(
+        RESULTS_DIR, f'{datetime.now().strftime("%Y%m%d-%H%M%S")}_{commit or "necunoscut"}.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    print(f'\nRezultate salvate în {output}')
+
+    if args.compare:
+        if not baseline_path or not os.path.exists(baseline_path):
+            print('Nu există o rulare anterioară pentru comparație')
+            return
+        with open(baseline_path, encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,178 @@
+"""Arhiva comprimată cu textul integral al articolelor (și opțional HTML-ul brut), separată de dbo.news
+
+Tabela dbo.news păstrează doar primele `content_length` caractere din conținut, ca listările să citească rânduri
+mici. Textul integral se scrie aici, comprimat cu zstd (dacă pachetul `zstandard` este instalat) sau gzip:
+
+- `blobs`: conținutul comprimat, cheia fiind hash-ul conținutului (textele identice se stochează o singură dată)
+- `articles`: URL-ul articolului (unic și în dbo.news) -> hash-ul textului și, opțional, al HTML-ului brut
+
+Codec-ul se reține pentru fiecare blob, deci arhiva rămâne lizibilă după schimbarea `CONTENT_ARCHIVE_CODEC`.
+Fișierul este în modul WAL: scraper-ul scrie, iar API-ul citește în paralel, cu câte o conexiune per fir.
+"""
+import gzip
+import hashlib
+import sqlite3
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+CODECS = ('zstd', 'gzip')
+# Limita de parametri SQLite pentru `IN (...)` în versiunile mai vechi
+LOOKUP_BATCH_SIZE = 500
+
+
+def content_hash(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class ContentArchive:
+    def __init__(self, path='content_archive.db', codec=None, level=None, store_html=False, read_only=False):
+        codec = codec or ('zstd' if ZSTD_AVAILABLE else 'gzip')
+        if codec not in CODECS:
+            raise ValueError(f"Codec necunoscut: {codec} (disponibile: {', '.join(CODECS)})")
+        if codec == 'zstd' and not ZSTD_AVAILABLE:
+            logger.warning("Pachetul zstandard nu este instalat, arhiva folosește gzip")
+            codec = 'gzip'
+        self.path = path
+        self.codec = codec
+        self.level = level if level is not None else (10 if codec == 'zstd' else 6)
+        self.store_html = store_html
+        self.read_only = read_only
+        self.local = threading.local()
+        self.write_lock = threading.Lock()
+        # O bază în memorie există doar pe conexiunea care a creat-o, deci aceasta se partajează între fire
+        self.shared = self._connect() if path == ':memory:' else None
+        if not read_only:
+            connection = self.connection
+            if path != ':memory:':
+                connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS blobs (
+                    hash TEXT PRIMARY KEY,
+                    codec TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    data BLOB NOT NULL
+                )
+            """)
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS articles (
+                    url TEXT PRIMARY KEY,
+                    content_hash TEXT NOT NULL,
+                    html_hash TEXT,
+                    stored_at REAL NOT NULL
+                )
+            """)
+            connection.commit()
+
+    def _connect(self):
+        if self.read_only and self.path != ':memory:':
+            connection = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False, timeout=10)
+        else:
+            connection = sqlite3.connect(self.path, check_same_thread=False, timeout=10)
+            connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    @property
+    def connection(self):
+        if self.shared is not None:
+            return self.shared
+        connection = getattr(self.local, 'connection', None)
+        if connection is None:
+            connection = self.local.connection = self._connect()
+        return connection
+
+    def compress(self, data):
+        if self.codec == 'zstd':
+            return zstandard.ZstdCompressor(level=self.level).compress(data)
+        # mtime=0: același text produce aceiași octeți
+        return gzip.compress(data, compresslevel=self.level, mtime=0)
+
+    @staticmethod
+    def decompress(codec, data):
+        if codec == 'zstd':
+            if not ZSTD_AVAILABLE:
+                raise RuntimeError("Arhiva conține blob-uri zstd, dar pachetul zstandard nu este instalat")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return gzip.decompress(data)
+
+    def _blob(self, data):
+        digest = content_hash(data)
+        return digest, (digest, self.codec, len(data), self.compress(data))
+
+    def add_articles(self, articles):
+        """Arhivează `full_content` (și `raw_html`, cu `store_html`) pentru fiecare articol; returnează câte s-au scris"""
+        blobs, rows = {}, []
+        now = time.time()
+        for article in articles:
+            text = article.get('full_content') or article.get('content')
+            if not text:
+                continue
+            text_hash, blob = self._blob(text.encode('utf-8'))
+            blobs[text_hash] = blob
+            html_hash = None
+            if self.store_html and article.get('raw_html'):
+                html_hash, blob = self._blob(article['raw_html'])
+                blobs[html_hash] = blob
+            rows.append((article['url'], text_hash, html_hash, now))
+        if not rows:
+            return 0
+        with self.write_lock:
+            with self.connection as connection:
+                connection.executemany("INSERT OR IGNORE INTO blobs (hash, codec, size, data) VALUES (?, ?, ?, ?)",
+                                       blobs.values())
+                connection.executemany("""
+                    INSERT INTO articles (url, content_hash, html_hash, stored_at) VALUES (?, ?, ?, ?)
+                    ON CONFLICT(url) DO UPDATE SET content_hash = excluded.content_hash,
+                        html_hash = COALESCE(excluded.html_hash, articles.html_hash), stored_at = excluded.stored_at
+                """, rows)
+        return len(rows)
+
+    def _load(self, urls, column):
+        found = {}
+        urls = list(dict.fromkeys(urls))
+        for i in range(0, len(urls), LOOKUP_BATCH_SIZE):
+            chunk = urls[i:i + LOOKUP_BATCH_SIZE]
+            rows = self.connection.execute(f"""
+                SELECT articles.url, blobs.codec, blobs.data FROM articles
+                JOIN blobs ON blobs.hash = articles.{column}
+                WHERE articles.url IN ({', '.join('?' * len(chunk))})
+            """, chunk).fetchall()
+            for url, codec, data in rows:
+                found[url] = self.decompress(codec, data)
+        return found
+
+    def get_contents(self, urls):
+        """Textul integral pentru fiecare URL arhivat din `urls` (dicționar url -> text)"""
+        return {url: data.decode('utf-8') for url, data in self._load(urls, 'content_hash').items()}
+
+    def get_content(self, url):
+        return self.get_contents([url]).get(url)
+
+    def get_htmls(self, urls):
+        """HTML-ul brut (octeți) pentru fiecare URL din `urls` arhivat împreună cu pagina"""
+        return self._load(urls, 'html_hash')
+
+    def get_html(self, url):
+        """HTML-ul brut (octeți) al articolului sau None dacă nu a fost arhivat"""
+        return self.get_htmls([url]).get(url)
+
+    def stats(self):
+        blobs, stored, original = self.connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(data)), 0), COALESCE(SUM(size), 0) FROM blobs").fetchone()
+        articles = self.connection.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+        return {
+            'articles': articles,
+            'blobs': blobs,
+            'stored_bytes': stored,
+            'original_bytes': original,
+            'ratio': round(original / stored, 2) if stored else 0.0,
+            'codec': self.codec
+        }
@@ -0,0 +1,120 @@
+import sqlite3
+import threading
+import time
+import logging
+import xml.etree.ElementTree as ElementTree
+
+logger = logging.getLogger(__name__)
+
+PENDING, DONE, FAILED = 'pending', 'done', 'failed'
+
+
+class CrawlFrontier:
+    """Frontiera persistentă (SQLite) a URL-urilor de articole, per sursă
+
+    Fiecare URL descoperit este ținut minte împreună cu adâncimea la care a fost găsit și poziția din
+    pagină. La fiecare ciclu se programează doar URL-urile încă neprocesate (sau eșuate de mai puțin de
+    `max_attempts` ori), în ordinea adâncimii și a poziției, deci cele mai vizibile articole noi primele.
+    Poziția unui URL care nu mai apare în pagini este veche, deci URL-urile regăsite în ciclul curent trec
+    înaintea celor rămase din ciclurile anterioare.
+    """
+
+    def __init__(self, path='crawl_frontier.db', max_attempts=3):
+        self.path = path
+        self.max_attempts = max_attempts
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS frontier (
+                source TEXT NOT NULL,
+                url TEXT NOT NULL,
+                depth INTEGER NOT NULL,
+                position INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL,
+                PRIMARY KEY (source, url)
+            )
+        """)
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS ix_frontier_schedule ON frontier (source, status, depth, position)")
+        self.connection.commit()
+
+    def discover(self, source, urls, depth=0):
+        """Înregistrează link-urile găsite pe o pagină, în ordinea din pagină; returnează câte sunt noi"""
+        now = time.time()
+        with self.lock:
+            count_query = "SELECT COUNT(*) FROM frontier WHERE source = ?"
+            before = self.connection.execute(count_query, (source,)).fetchone()[0]
+            self.connection.executemany("""
+                INSERT INTO frontier (source, url, depth, position, status, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(source, url) DO UPDATE SET
+                    depth = MIN(depth, excluded.depth),
+                    position = excluded.position,
+                    last_seen = excluded.last_seen
+            """, [(source, url, depth, position, PENDING, now, now) for position, url in enumerate(urls)])
+            self.connection.commit()
+            return self.connection.execute(count_query, (source,)).fetchone()[0] - before
+
+    def next_batch(self, source, limit, seen_since=0):
+        """URL-urile de procesat în acest ciclu, cel mult `limit`; cele văzute de la `seen_since` au prioritate"""
+        with self.lock:
+            rows = self.connection.execute("""
+                SELECT url FROM frontier
+                WHERE source = ? AND (status = ? OR (status = ? AND attempts < ?))
+                ORDER BY last_seen < ?, depth, position, first_seen DESC
+                LIMIT ?
+            """, (source, PENDING, FAILED, self.max_attempts, seen_since, limit)).fetchall()
+        return [row[0] for row in rows]
+
+    def _mark(self, urls, status, increment):
+        urls = list(urls)
+        if not urls:
+            return
+        with self.lock:
+            self.connection.executemany(
+                "UPDATE frontier SET status = ?, attempts = attempts + ? WHERE url = ?",
+                [(status, increment, url) for url in urls])
+            self.connection.commit()
+
+    def mark_done(self, urls):
+        self._mark(urls, DONE, 1)
+
+    def mark_failed(self, urls):
+        self._mark(urls, FAILED, 1)
+
+    def prune(self, max_age_days=30):
+        """Uită URL-urile (procesate sau nu) care nu au mai apărut pe nicio pagină de `max_age_days` zile"""
+        cutoff = time.time() - max_age_days * 86400
+        with self.lock:
+            deleted = self.connection.execute("DELETE FROM frontier WHERE last_seen < ?", (cutoff,)).rowcount
+            self.connection.commit()
+        return deleted
+
+    def stats(self, source=None):
+        query = "SELECT status, COUNT(*) FROM frontier"
+        params = ()
+        if source:
+            query += " WHERE source = ?"
+            params = (source,)
+        with self.lock:
+            return dict(self.connection.execute(query + " GROUP BY status", params).fetchall())
+
+
+def extract_feed_links(content):
+    """Link-urile dintr-un feed RSS/Atom sau dintr-un sitemap XML, în ordinea din document"""
+    try:
+        root = ElementTree.fromstring(content)
+    except ElementTree.ParseError as e:
+        logger.warning(f"Feed invalid: {e}")
+        return []
+    links = []
+    for element in root.iter():
+        tag = element.tag.rsplit('}', 1)[-1]
+        if tag in ('link', 'loc'):
+            link = (element.text or '').strip() or element.get('href', '')
+            if link:
+                links.append(link)
+    return links
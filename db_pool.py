@@ -0,0 +1,193 @@
+import threading
+import time
+import logging
+from collections import deque
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class PoolError(Exception):
+    pass
+
+
+class PoolTimeout(PoolError):
+    """Nicio conexiune nu s-a eliberat în timpul de așteptare permis"""
+
+
+class PoolConnectionError(PoolError):
+    """Nu s-a putut deschide o conexiune nouă"""
+
+
+class ConnectionPool:
+    """Pool thread-safe de conexiuni DB-API
+
+    - cel mult `max_size` conexiuni deschise; la epuizare, `acquire` așteaptă până la `timeout` secunde
+    - conexiunile neutilizate de peste `idle_timeout` secunde se închid (fără a coborî sub `min_size`)
+    - o conexiune care a stat nefolosită peste `health_check_interval` secunde este verificată
+      cu `health_check_query` înainte de a fi dată mai departe
+    """
+
+    def __init__(self, factory, min_size=1, max_size=10, timeout=5.0, idle_timeout=300.0,
+                 health_check_interval=30.0, health_check_query="SELECT 1"):
+        self.factory = factory
+        self.min_size = max(0, min_size)
+        self.max_size = max(1, max_size, self.min_size)
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.health_check_query = health_check_query
+        self.idle = deque()
+        self.size = 0
+        self.in_use = 0
+        self.cond = threading.Condition()
+        self.waits = 0
+        self.timeouts = 0
+        self.created = 0
+        self.closed = 0
+        self.health_check_failures = 0
+
+    def _open(self):
+        try:
+            conn = self.factory()
+        except Exception as e:
+            with self.cond:
+                self.size -= 1
+                self.cond.notify()
+            raise PoolConnectionError(str(e)) from e
+        with self.cond:
+            self.created += 1
+        return conn
+
+    def _close(self, conn):
+        try:
+            conn.close()
+        except Exception as e:
+            logger.warning(f"Eroare la închiderea conexiunii din pool: {e}")
+        with self.cond:
+            self.size -= 1
+            self.closed += 1
+            self.cond.notify()
+
+    def _evict_idle(self, now):
+        """Scoate conexiunile expirate din pool; se apelează cu lock-ul deținut"""
+        expired = []
+        while self.idle and self.size - len(expired) > self.min_size:
+            conn, last_used = self.idle[0]
+            if now - last_used < self.idle_timeout:
+                break
+            self.idle.popleft()
+            expired.append(conn)
+        return expired
+
+    def _healthy(self, conn):
+        try:
+            cursor = conn.cursor()
+            cursor.execute(self.health_check_query)
+            cursor.fetchall()
+            cursor.close()
+            return True
+        except Exception as e:
+            logger.warning(f"Conexiune invalidă eliminată din pool: {e}")
+            with self.cond:
+                self.health_check_failures += 1
+            return False
+
+    def acquire(self):
+        deadline = time.monotonic() + self.timeout
+        while True:
+            with self.cond:
+                waited = False
+                while True:
+                    now = time.monotonic()
+                    expired = self._evict_idle(now)
+                    if expired:
+                        break
+                    if self.idle:
+                        conn, last_used = self.idle.pop()
+                        self.in_use += 1
+                        break
+                    if self.size < self.max_size:
+                        self.size += 1
+                        self.in_use += 1
+                        conn, last_used = None, None
+                        break
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        self.timeouts += 1
+                        raise PoolTimeout(f"Nicio conexiune disponibilă după {self.timeout}s")
+                    if not waited:
+                        self.waits += 1
+                        waited = True
+                    self.cond.wait(remaining)
+            if expired:
+                for old in expired:
+                    self._close(old)
+                continue
+            if conn is None:
+                try:
+                    return self._open()
+                except PoolConnectionError:
+                    with self.cond:
+                        self.in_use -= 1
+                    raise
+            if now - last_used < self.health_check_interval or self._healthy(conn):
+                return conn
+            with self.cond:
+                self.in_use -= 1
+            self._close(conn)
+
+    def release(self, conn, discard=False):
+        if not discard:
+            try:
+                conn.rollback()
+            except Exception:
+                discard = True
+        with self.cond:
+            self.in_use -= 1
+            if not discard:
+                self.idle.append((conn, time.monotonic()))
+                self.cond.notify()
+                return
+        self._close(conn)
+
+    @contextmanager
+    def connection(self):
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def fill(self):
+        """Deschide conexiuni până la `min_size`"""
+        while True:
+            with self.cond:
+                if self.size >= self.min_size:
+                    return
+                self.size += 1
+            conn = self._open()
+            with self.cond:
+                self.idle.append((conn, time.monotonic()))
+                self.cond.notify()
+
+    def close_all(self):
+        with self.cond:
+            idle, self.idle = list(self.idle), deque()
+        for conn, _ in idle:
+            self._close(conn)
+
+    def stats(self):
+        with self.cond:
+            return {
+                'size': self.size,
+                'idle': len(self.idle),
+                'in_use': self.in_use,
+                'min_size': self.min_size,
+                'max_size': self.max_size,
+                'waits': self.waits,
+                'timeouts': self.timeouts,
+                'created': self.created,
+                'closed': self.closed,
+                'health_check_failures': self.health_check_failures
+            }
@@ -0,0 +1,260 @@
+import hashlib
+import random
+import sqlite3
+import threading
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from metrics import REGISTRY, SIZE_BUCKETS
+
+logger = logging.getLogger(__name__)
+
+LLM_SECONDS = REGISTRY.histogram('scraper_llm_seconds', 'Durata cererilor LLM după rezultat', ('outcome',))
+LLM_BATCH_SIZE = REGISTRY.histogram('scraper_llm_batch_size', 'Articole per cerere LLM', buckets=SIZE_BUCKETS)
+DESCRIPTIONS = REGISTRY.counter('scraper_descriptions_total', 'Descrieri după proveniență', ('source',))
+
+
+def content_key(title, content):
+    """Cheia de cache: hash-ul textului pe care îl vede LLM-ul"""
+    text = f"{title}\n{(content or '')[:1500]}"
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class DescriptionCache:
+    """Cache persistent (SQLite) pentru descrierile generate, indexat după hash-ul conținutului"""
+
+    def __init__(self, path='descriptions_cache.db'):
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS descriptions (key TEXT PRIMARY KEY, description TEXT NOT NULL, created REAL)"
+        )
+        self.connection.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self.lock:
+            row = self.connection.execute("SELECT description FROM descriptions WHERE key = ?", (key,)).fetchone()
+            if row:
+                self.hits += 1
+                return row[0]
+            self.misses += 1
+            return None
+
+    def set(self, key, description):
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO descriptions (key, description, created) VALUES (?, ?, ?)",
+                (key, description, time.time())
+            )
+            self.connection.commit()
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+
+class CircuitBreaker:
+    """După `failure_threshold` eșecuri consecutive se deschide pentru `reset_timeout` secunde,
+    apoi lasă o singură cerere de probă (half-open)"""
+
+    def __init__(self, failure_threshold=5, reset_timeout=60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+        self.lock = threading.Lock()
+
+    def allow(self):
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at >= self.reset_timeout and not self.probing:
+                self.probing = True
+                return True
+            return False
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.probing = False
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.probing or self.failures >= self.failure_threshold:
+                if self.opened_at is None or self.probing:
+                    logger.warning("Circuit breaker LLM deschis, se folosesc descrierile de rezervă")
+                self.opened_at = time.monotonic()
+                self.probing = False
+
+    @property
+    def is_open(self):
+        with self.lock:
+            return self.opened_at is not None
+
+
+class DescriptionPipeline:
+    """Etapa de generare a descrierilor, separată de descărcarea articolelor
+
+    Articolele intră pe măsură ce sunt scrape-uite și ies cu `description` completat. Cererile către
+    LLM rulează pe un pool de `max_workers` fire, câte `batch_size` articole per cerere, cu reîncercări
+    cu backoff exponențial. Când circuit breaker-ul este deschis sau LLM-ul nu e configurat, se folosește
+    `fallback_description`.
+    """
+
+    def __init__(self, generator, cache=None, max_workers=4, batch_size=1, max_retries=3, backoff=1.0,
+                 breaker=None, max_length=200):
+        self.generator = generator
+        self.cache = cache
+        self.max_workers = max(1, max_workers)
+        self.batch_size = max(1, batch_size)
+        self.max_retries = max(1, max_retries)
+        self.backoff = backoff
+        self.breaker = breaker or CircuitBreaker()
+        self.max_length = max_length
+        self.requests = 0
+        self.fallbacks = 0
+
+    def _fallback(self, article):
+        self.fallbacks += 1
+        DESCRIPTIONS.inc(source='fallback')
+        return self.generator.fallback_description(article['title'], article['content'], self.max_length)
+
+    def _from_cache(self, article):
+        if self.cache is None:
+            return None
+        return self.cache.get(content_key(article['title'], article['content']))
+
+    def _call_with_retry(self, batch):
+        items = [(article['title'], article['content']) for article in batch]
+        for attempt in range(self.max_retries):
+            if not self.breaker.allow():
+                return None
+            started = time.perf_counter()
+            try:
+                self.requests += 1
+                LLM_BATCH_SIZE.observe(len(items))
+                descriptions = self.generator.generate_batch(items, self.max_length)
+                LLM_SECONDS.observe(time.perf_counter() - started, outcome='ok')
+                self.breaker.record_success()
+                return descriptions
+            except Exception as e:
+                LLM_SECONDS.observe(time.perf_counter() - started, outcome='error')
+                self.breaker.record_failure()
+                status_code = getattr(e, 'status_code', None)
+                # Erorile 4xx (în afară de 429) nu se rezolvă prin reîncercare
+                if status_code and 400 <= status_code < 500 and status_code != 429:
+                    logger.warning(f"Cererea LLM a fost respinsă: {e}")
+                    return None
+                if attempt + 1 < self.max_retries:
+                    delay = self.backoff * (2 ** attempt) * (1 + random.random() * 0.5)
+                    logger.warning(f"Cererea LLM a eșuat ({e}), reîncercare în {delay:.1f}s")
+                    time.sleep(delay)
+                else:
+                    logger.error(f"Cererea LLM a eșuat după {self.max_retries} încercări: {e}")
+        return None
+
+    def _describe_batch(self, batch):
+        # Un duplicat poate fi fost generat între timp de alt fir
+        pending = []
+        for article in batch:
+            cached = self._from_cache(article)
+            if cached:
+                article['description'] = cached
+                DESCRIPTIONS.inc(source='cache')
+            else:
+                pending.append(article)
+        if not pending:
+            return batch
+
+        for article, description in zip(pending, self._generate(pending)):
+            article['description'] = description or self._fallback(article)
+        return batch
+
+    def _generate(self, batch):
+        """Descrierile LLM pentru lot, None unde LLM-ul nu a răspuns; cele generate se scriu în cache"""
+        descriptions = self._call_with_retry(batch)
+        if descriptions is None and len(batch) > 1 and not self.breaker.is_open:
+            # Răspunsul pe lot poate fi invalid chiar dacă API-ul funcționează: se încearcă individual
+            descriptions = [(self._call_with_retry([article]) or [None])[0] for article in batch]
+        results = []
+        for index, article in enumerate(batch):
+            description = descriptions[index] if descriptions else None
+            if description:
+                DESCRIPTIONS.inc(source='llm')
+                if self.cache is not None:
+                    self.cache.set(content_key(article['title'], article['content']), description)
+            results.append(description or None)
+        return results
+
+    def describe_batch(self, batch):
+        """Completează descrierea pentru un lot de articole, pe firul curent"""
+        if not self.generator.enabled:
+            for article in batch:
+                article['description'] = self._fallback(article)
+            return batch
+        return self._describe_batch(batch)
+
+    def regenerate(self, articles):
+        """Regenerează descrierile prin LLM, fără a citi cache-ul (ex. după schimbarea prompt-ului sau a modelului)
+
+        Cache-ul este indexat doar după conținut, deci ar returna descrierile vechi. Doar articolele pentru
+        care LLM-ul a răspuns primesc descrierea nouă și se returnează; celelalte își păstrează descrierea,
+        fără fallback.
+        """
+        articles = list(articles)
+        if not self.generator.enabled or not articles:
+            return []
+        batches = [articles[start:start + self.batch_size] for start in range(0, len(articles), self.batch_size)]
+        regenerated = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for batch, descriptions in zip(batches, executor.map(self._generate, batches)):
+                for article, description in zip(batch, descriptions):
+                    if description:
+                        article['description'] = description
+                        regenerated.append(article)
+        return regenerated
+
+    def process(self, articles):
+        """Consumă articolele pe măsură ce sosesc și le produce cu descrierea completată"""
+        if not self.generator.enabled:
+            for article in articles:
+                article['description'] = self._fallback(article)
+                yield article
+            return
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = set()
+            batch = []
+            for article in articles:
+                cached = self._from_cache(article)
+                if cached:
+                    article['description'] = cached
+                    yield article
+                    continue
+                batch.append(article)
+                if len(batch) >= self.batch_size:
+                    pending.add(executor.submit(self._describe_batch, batch))
+                    batch = []
+                for future in [f for f in pending if f.done()]:
+                    pending.remove(future)
+                    yield from future.result()
+            if batch:
+                pending.add(executor.submit(self._describe_batch, batch))
+            for future in as_completed(pending):
+                yield from future.result()
+
+    def stats(self):
+        return {
+            'requests': self.requests,
+            'fallbacks': self.fallbacks,
+            'cache_hits': self.cache.hits if self.cache else 0,
+            'cache_misses': self.cache.misses if self.cache else 0,
+            'breaker_open': self.breaker.is_open
+        }
@@ -0,0 +1,164 @@
+import threading
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
+
+from metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+FETCH_SECONDS = REGISTRY.histogram('scraper_fetch_seconds', 'Durata cererilor HTTP (fără așteptarea la rate limit)',
+                                   ('host',))
+FETCH_BYTES = REGISTRY.counter('scraper_fetch_bytes_total', 'Octeți primiți de la fiecare host', ('host',))
+FETCH_RESPONSES = REGISTRY.counter('scraper_fetch_responses_total', 'Răspunsuri HTTP după host și rezultat',
+                                   ('host', 'outcome'))
+
+
+class TokenBucket:
+    """Token bucket thread-safe: `rate` cereri pe secundă, cu rafală de până la `capacity`"""
+
+    def __init__(self, rate, capacity=1):
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(capacity))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self, now):
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated = now
+
+    def acquire(self):
+        """Blochează până când un token este disponibil"""
+        if self.rate <= 0:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class HostRateLimiter:
+    """Păstrează câte un TokenBucket pentru fiecare host (netloc)"""
+
+    def __init__(self, rate_per_host=2.0, burst=2, host_rates=None):
+        self.rate_per_host = rate_per_host
+        self.burst = burst
+        self.host_rates = host_rates or {}
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def bucket_for(self, host):
+        with self.lock:
+            bucket = self.buckets.get(host)
+            if bucket is None:
+                rate = self.host_rates.get(host, self.rate_per_host)
+                bucket = TokenBucket(rate, self.burst)
+                self.buckets[host] = bucket
+            return bucket
+
+    def acquire(self, url):
+        self.bucket_for(urlparse(url).netloc).acquire()
+
+
+class ConcurrentFetcher:
+    """Descarcă pagini în paralel, cu un număr limitat de fire și rate limit per host"""
+
+    def __init__(self, session, max_workers=8, rate_per_host=2.0, burst=2, host_rates=None, timeout=30, cache=None):
+        self.session = session
+        self.max_workers = max(1, int(max_workers))
+        self.timeout = timeout
+        self.limiter = HostRateLimiter(rate_per_host, burst, host_rates)
+        self.cache = cache
+        self.host_stats = {}
+        self.stats_lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        """GET cu respectarea limitei pentru host-ul URL-ului
+
+        Cu un HttpCache, cererea devine condiționată (If-None-Match / If-Modified-Since); la 304 se
+        returnează corpul din cache cu status 200 și `response.from_cache = True`.
+        """
+        host = urlparse(url).netloc
+        self.limiter.bucket_for(host).acquire()
+        started = time.perf_counter()
+        try:
+            response = self._get(url, **kwargs)
+        except Exception:
+            self.record(host, time.perf_counter() - started, 'error')
+            raise
+        outcome = 'cached' if getattr(response, 'from_cache', False) else str(response.status_code)
+        # Corpul din cache nu a trecut prin rețea
+        self.record(host, time.perf_counter() - started, outcome, 0 if outcome == 'cached' else len(response.content))
+        return response
+
+    def record(self, host, seconds, outcome, size=0):
+        FETCH_SECONDS.observe(seconds, host=host)
+        FETCH_RESPONSES.inc(host=host, outcome=outcome)
+        if size:
+            FETCH_BYTES.inc(size, host=host)
+        with self.stats_lock:
+            stats = self.host_stats.setdefault(host, {'requests': 0, 'errors': 0, 'bytes': 0, 'seconds': 0.0})
+            stats['requests'] += 1
+            stats['errors'] += outcome == 'error' or outcome[0] in '45'
+            stats['bytes'] += size
+            stats['seconds'] += seconds
+
+    def stats(self):
+        """Cererile, erorile, octeții și timpul mediu per host de la ultimul reset_stats()"""
+        with self.stats_lock:
+            return {host: {**stats, 'seconds': round(stats['seconds'], 3),
+                           'avg_seconds': round(stats['seconds'] / stats['requests'], 4) if stats['requests'] else 0.0}
+                    for host, stats in self.host_stats.items()}
+
+    def reset_stats(self):
+        with self.stats_lock:
+            self.host_stats = {}
+
+    def _get(self, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        if self.cache is None:
+            return self.session.get(url, **kwargs)
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        response = self.session.get(url, headers={**headers, **self.cache.validators(url)}, **kwargs)
+        response.from_cache = False
+        if response.status_code == 304:
+            body = self.cache.load(url)
+            if body is not None:
+                response._content = body
+                response.status_code = 200
+                response.from_cache = True
+                return response
+            # Copia din cache a dispărut: se cere din nou pagina întreagă
+            response = self.session.get(url, headers=headers, **kwargs)
+            response.from_cache = False
+        if response.status_code == 200:
+            try:
+                self.cache.store(url, response)
+            except Exception as e:
+                logger.warning(f"Nu s-a putut salva în cache {url}: {e}")
+        return response
+
+    def map(self, func, items):
+        """Aplică `func` pe fiecare element în paralel; produce (item, rezultat) în ordinea terminării"""
+        items = list(items)
+        if not items:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as executor:
+            futures = {executor.submit(func, item): item for item in items}
+            for future in as_completed(futures):
+                item = futures[future]
+                try:
+                    yield item, future.result()
+                except Exception as e:
+                    logger.error(f"Eroare la procesarea {item}: {e}")
+                    yield item, None
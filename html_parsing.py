@@ -0,0 +1,52 @@
+"""Stratul de parsare HTML folosit de NewsScraper
+
+- BeautifulSoup rulează cu backend-ul lxml când este instalat (mult mai rapid decât html.parser);
+  `HTML_PARSER` din mediu forțează un anumit backend
+- `extract_links` extrage doar atributele href, fără a construi arborele BeautifulSoup:
+  selectolax dacă este disponibil, altfel XPath cu lxml, altfel SoupStrainer
+- `make_soup(..., parse_only=...)` construiește doar elementele de interes ale unei pagini
+"""
+import os
+import logging
+from bs4 import BeautifulSoup, SoupStrainer
+
+logger = logging.getLogger(__name__)
+
+try:
+    import lxml.html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+PARSER = os.getenv('HTML_PARSER') or ('lxml' if LXML_AVAILABLE else 'html.parser')
+
+LINK_STRAINER = SoupStrainer('a', href=True)
+
+
+def make_soup(content, parse_only=None, parser=None):
+    return BeautifulSoup(content, parser or PARSER, parse_only=parse_only)
+
+
+def strainer_for(tags):
+    """SoupStrainer care păstrează doar elementele cu numele date (cu tot conținutul lor)"""
+    return SoupStrainer(list(tags)) if tags else None
+
+
+def extract_links(content, backend=None):
+    """Returnează valorile href ale tuturor link-urilor, în ordinea din pagină"""
+    backend = backend or ('selectolax' if SELECTOLAX_AVAILABLE else 'lxml' if LXML_AVAILABLE else 'soup')
+    if backend == 'selectolax':
+        return [node.attributes['href'] for node in HTMLParser(content).css('a[href]') if node.attributes.get('href')]
+    if backend == 'lxml':
+        try:
+            return [str(href) for href in lxml.html.fromstring(content).xpath('//a/@href')]
+        except Exception as e:
+            logger.warning(f"lxml nu a putut parsa pagina ({e}), se folosește BeautifulSoup")
+    soup = make_soup(content, parse_only=LINK_STRAINER)
+    return [link['href'] for link in soup.find_all('a', href=True)]
@@ -0,0 +1,153 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class HttpCache:
+    """Cache HTTP pe disc pentru ConcurrentFetcher
+
+    Corpurile răspunsurilor se păstrează ca fișiere în `directory`, iar ETag/Last-Modified și ora ultimei
+    accesări într-un index SQLite. Când dimensiunea totală depășește `max_bytes`, se șterg intrările
+    folosite cel mai demult (LRU). Tot aici se ține hash-ul ultimului conținut văzut pentru fiecare URL,
+    ca scraper-ul să poată sări peste o pagină principală neschimbată.
+    """
+
+    def __init__(self, directory='.http_cache', max_bytes=200 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(os.path.join(directory, 'index.db'), check_same_thread=False)
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY, url TEXT, etag TEXT, last_modified TEXT,
+                size INTEGER, accessed REAL, content_hash TEXT
+            )
+        """)
+        self.connection.commit()
+        self.total_bytes = self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.requests = 0
+        self.revalidated = 0
+        self.stored = 0
+        self.evicted = 0
+        self.bytes_saved = 0
+        self.unchanged_pages = 0
+
+    @staticmethod
+    def key_for(url):
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key)
+
+    def validators(self, url):
+        """Header-ele condiționale pentru URL, dacă avem o copie validă în cache"""
+        with self.lock:
+            self.requests += 1
+            row = self.connection.execute(
+                "SELECT etag, last_modified FROM entries WHERE key = ? AND size IS NOT NULL", (self.key_for(url),)
+            ).fetchone()
+        headers = {}
+        if row:
+            if row[0]:
+                headers['If-None-Match'] = row[0]
+            if row[1]:
+                headers['If-Modified-Since'] = row[1]
+        return headers
+
+    def load(self, url):
+        """Corpul din cache după un 304; None dacă fișierul a dispărut între timp"""
+        key = self.key_for(url)
+        try:
+            with open(self._path(key), 'rb') as f:
+                body = f.read()
+        except OSError:
+            return None
+        with self.lock:
+            self.connection.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+            self.connection.commit()
+            self.revalidated += 1
+            self.bytes_saved += len(body)
+        return body
+
+    def store(self, url, response):
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        body = response.content
+        if len(body) > self.max_bytes:
+            return
+        key = self.key_for(url)
+        temp_path = f"{self._path(key)}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(body)
+        os.replace(temp_path, self._path(key))
+        with self.lock:
+            row = self.connection.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            self.total_bytes -= (row[0] or 0) if row else 0
+            self.connection.execute("""
+                INSERT INTO entries (key, url, etag, last_modified, size, accessed) VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET etag = excluded.etag, last_modified = excluded.last_modified,
+                    size = excluded.size, accessed = excluded.accessed
+            """, (key, url, etag, last_modified, len(body), time.time()))
+            self.total_bytes += len(body)
+            self.stored += 1
+            self._evict()
+            self.connection.commit()
+
+    def _evict(self):
+        """Șterge corpurile folosite cel mai demult până sub `max_bytes`; se apelează cu lock-ul deținut"""
+        while self.total_bytes > self.max_bytes:
+            row = self.connection.execute(
+                "SELECT key, size FROM entries WHERE size IS NOT NULL ORDER BY accessed LIMIT 1"
+            ).fetchone()
+            if not row:
+                break
+            key, size = row
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+            # Rândul rămâne pentru hash-ul de conținut, dar fără validatori
+            self.connection.execute(
+                "UPDATE entries SET etag = NULL, last_modified = NULL, size = NULL WHERE key = ?", (key,))
+            self.total_bytes -= size
+            self.evicted += 1
+
+    def content_changed(self, url, content):
+        """Compară hash-ul conținutului cu cel de la ultima vizită și îl memorează pe cel nou"""
+        content_hash = hashlib.sha256(content).hexdigest()
+        key = self.key_for(url)
+        with self.lock:
+            row = self.connection.execute("SELECT content_hash FROM entries WHERE key = ?", (key,)).fetchone()
+            if row and row[0] == content_hash:
+                self.unchanged_pages += 1
+                return False
+            self.connection.execute("""
+                INSERT INTO entries (key, url, content_hash, accessed) VALUES (?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET content_hash = excluded.content_hash
+            """, (key, url, content_hash, time.time()))
+            self.connection.commit()
+            return True
+
+    def stats(self):
+        with self.lock:
+            return {
+                'requests': self.requests,
+                'revalidated': self.revalidated,
+                'hit_rate': round(self.revalidated / self.requests, 3) if self.requests else 0.0,
+                'bytes_saved': self.bytes_saved,
+                'stored': self.stored,
+                'evicted': self.evicted,
+                'unchanged_pages': self.unchanged_pages,
+                'total_bytes': self.total_bytes
+            }
@@ -0,0 +1,174 @@
+"""Extragerea cuvintelor cheie prin TF-IDF
+
+- `DocumentFrequencies` ține numărul de documente în care apare fiecare termen, actualizat incremental la
+  fiecare articol nou și salvat opțional într-un fișier SQLite între rulări
+- `KeywordExtractor.extract` scorează un articol, `extract_batch` un lot întreg; cu NumPy instalat, loturile
+  de cel puțin `VECTORIZE_MIN_BATCH` articole se scorează vectorizat (matrice rară termeni x documente)
+- fără documente în corpus IDF-ul este 1 pentru toți termenii, deci rezultatul coincide cu vechiul
+  clasament după frecvență
+"""
+import heapq
+import importlib.util
+import math
+import sqlite3
+import threading
+import logging
+from collections import Counter, defaultdict
+from itertools import chain, count
+from operator import itemgetter
+
+from text_processing import keyword_terms
+
+logger = logging.getLogger(__name__)
+
+# NumPy se importă doar la prima scorare vectorizată: scraping-ul scorează articole individuale și nu plătește
+# importul la pornire
+NUMPY_AVAILABLE = importlib.util.find_spec('numpy') is not None
+
+# Câștigul NumPy este mic (20k articole sintetice de 300 de cuvinte, doar scorarea): 4.5-5.7k articole/s în
+# Python la orice lot; NumPy ~5.7k/s la loturi de 10, ~6.2k/s la 100-2000 și ~7.7k/s la 5000, plus ~80 ms
+# pentru import. Cu tokenizarea (~5.7k/s, comună), end-to-end: ≈3.0k față de ≈2.7k articole/s la loturi de
+# 5000, iar la loturi de 1000 (python -m benchmarks.bench_keywords --articles 5000 --batch-size 1000) NumPy
+# este chiar mai lent, cu importul inclus. De aceea modul vectorizat se folosește doar pe loturile de
+# `python main.py keywords` (5000), nu la scraping sau la re-procesare (loturi implicite de 500).
+VECTORIZE_MIN_BATCH = 5000
+
+
+class DocumentFrequencies:
+    """Frecvențele de document ale termenilor; `path=None` le ține doar în memorie"""
+
+    def __init__(self, path=None):
+        self.path = path
+        self.counts = Counter()
+        self.documents = 0
+        self.pending = Counter()
+        self.pending_documents = 0
+        self.lock = threading.Lock()
+        self.connection = None
+        if path:
+            self.connection = sqlite3.connect(path, check_same_thread=False)
+            self.connection.execute("CREATE TABLE IF NOT EXISTS terms (term TEXT PRIMARY KEY, df INTEGER NOT NULL)")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            self.connection.commit()
+            self.counts = Counter(dict(self.connection.execute("SELECT term, df FROM terms")))
+            row = self.connection.execute("SELECT value FROM meta WHERE key = 'documents'").fetchone()
+            self.documents = row[0] if row else 0
+
+    def add_documents(self, term_lists):
+        """Numără o dată fiecare termen distinct din fiecare document"""
+        distinct = [set(terms) for terms in term_lists]
+        with self.lock:
+            # Counter.update numără în C, fără o buclă Python pe fiecare termen
+            for terms in distinct:
+                self.counts.update(terms)
+                self.pending.update(terms)
+            self.documents += len(distinct)
+            self.pending_documents += len(distinct)
+
+    def get(self, term):
+        return self.counts[term]
+
+    def idf(self, term):
+        # IDF netezit: un termen prezent în toate documentele are tot pondere pozitivă
+        return math.log(1 + self.documents) - math.log(1 + self.counts[term]) + 1
+
+    def save(self):
+        """Scrie în fișier doar incrementele de la ultima salvare"""
+        if self.connection is None:
+            return
+        with self.lock:
+            pending, self.pending = self.pending, Counter()
+            pending_documents, self.pending_documents = self.pending_documents, 0
+            with self.connection:
+                self.connection.executemany("""
+                    INSERT INTO terms (term, df) VALUES (?, ?)
+                    ON CONFLICT(term) DO UPDATE SET df = df + excluded.df
+                """, pending.items())
+                self.connection.execute("""
+                    INSERT INTO meta (key, value) VALUES ('documents', ?)
+                    ON CONFLICT(key) DO UPDATE SET value = value + excluded.value
+                """, (pending_documents,))
+
+    def reset(self):
+        """Golește frecvențele (înaintea unei recalculări complete din arhivă)"""
+        with self.lock:
+            self.counts, self.documents = Counter(), 0
+            self.pending, self.pending_documents = Counter(), 0
+            if self.connection is not None:
+                with self.connection:
+                    self.connection.execute("DELETE FROM terms")
+                    self.connection.execute("DELETE FROM meta")
+
+
+class KeywordExtractor:
+    """Primii `top_n` termeni după TF-IDF, separați prin virgulă, ca în coloana `keywords`"""
+
+    def __init__(self, frequencies=None, top_n=10, vectorized=None, min_vectorized_batch=VECTORIZE_MIN_BATCH):
+        self.frequencies = frequencies if frequencies is not None else DocumentFrequencies()
+        self.top_n = top_n
+        self.vectorized = NUMPY_AVAILABLE if vectorized is None else vectorized and NUMPY_AVAILABLE
+        self.min_vectorized_batch = min_vectorized_batch
+
+    @staticmethod
+    def terms(title, content):
+        return keyword_terms(f"{title} {content}")
+
+    def score(self, terms):
+        if not terms:
+            return ''
+        total = len(terms)
+        frequencies = self.frequencies
+        # Aceeași formulă ca DocumentFrequencies.idf, cu logaritmul numărului de documente calculat o singură dată
+        log_documents = math.log(1 + frequencies.documents)
+        df = frequencies.counts
+        log = math.log
+        scores = ((term, tf / total * (log_documents - log(1 + df[term]) + 1)) for term, tf in Counter(terms).items())
+        # nlargest este stabil: la egalitate rămâne ordinea primei apariții, ca la Counter.most_common
+        return ', '.join(term for term, _ in heapq.nlargest(self.top_n, scores, key=itemgetter(1)))
+
+    def extract(self, title, content, update=True):
+        terms = self.terms(title, content)
+        if update:
+            self.frequencies.add_documents([terms])
+        return self.score(terms)
+
+    def extract_batch(self, articles, update=True):
+        """Cuvintele cheie pentru o listă de (titlu, conținut), în aceeași ordine"""
+        term_lists = [self.terms(title, content) for title, content in articles]
+        if update:
+            self.frequencies.add_documents(term_lists)
+        if self.vectorized and len(term_lists) >= self.min_vectorized_batch:
+            return self._score_matrix(term_lists)
+        return [self.score(terms) for terms in term_lists]
+
+    def _score_matrix(self, term_lists):
+        """Scorarea vectorizată a unui lot: perechile (document, termen) se numără și se ordonează cu NumPy"""
+        import numpy as np
+        lengths = np.fromiter((len(terms) for terms in term_lists), dtype=np.int64, count=len(term_lists))
+        if not lengths.sum():
+            return [''] * len(term_lists)
+        # Fiecare termen nou primește următorul id; map + defaultdict rămân în C, fără cod Python per termen
+        vocabulary = defaultdict(count().__next__)
+        columns = np.fromiter(map(vocabulary.__getitem__, chain.from_iterable(term_lists)),
+                              dtype=np.int64, count=int(lengths.sum()))
+        rows = np.repeat(np.arange(len(term_lists), dtype=np.int64), lengths)
+
+        # Cheia row * V + col este ordonată după document, apoi după termen: echivalentul unei matrice CSR
+        size = len(vocabulary)
+        keys, first_position, counts = np.unique(rows * size + columns, return_index=True, return_counts=True)
+        rows, columns = keys // size, keys % size
+        terms = list(vocabulary)
+        df = np.fromiter(map(self.frequencies.counts.__getitem__, terms), dtype=np.float64, count=size)
+        idf = np.log(1 + self.frequencies.documents) - np.log(1 + df) + 1
+        scores = counts / lengths[rows] * idf[columns]
+
+        # Pe fiecare document: scor descrescător, la egalitate prima apariție
+        order = np.lexsort((first_position, -scores, rows))
+        rows, columns = rows[order], columns[order]
+        starts = np.searchsorted(rows, np.arange(len(term_lists)))
+        keep = np.arange(len(rows)) - starts[rows] < self.top_n
+
+        keywords = [[] for _ in term_lists]
+        for row, column in zip(rows[keep].tolist(), columns[keep].tolist()):
+            keywords[row].append(terms[column])
+        return [', '.join(words) for words in keywords]
@@ -0,0 +1,29 @@
+"""Configurarea logging-ului, o singură dată per proces, de către punctul de intrare (main.py sau api_server.py)
+
+Modulele de bibliotecă folosesc doar `logging.getLogger(__name__)` și nu adaugă handler-e la import.
+"""
+import sys
+import logging
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+_configured = False
+
+
+def configure_logging(filename='app.log', level=logging.INFO):
+    """Scrie log-urile în `filename` și la stdout; apelurile ulterioare nu mai schimbă nimic"""
+    global _configured
+    if _configured:
+        return
+    _configured = True
+    # Forțează codificarea UTF-8 pe Windows
+    if sys.platform == "win32":
+        sys.stdout.reconfigure(encoding='utf-8')
+    logging.basicConfig(
+        level=level,
+        format=LOG_FORMAT,
+        handlers=[
+            logging.FileHandler(filename, encoding='utf-8'),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
@@ -1,45 +1,23 @@
 import os
 import sys
 import argparse
-import schedule
-import time
-from datetime import datetime
 from dotenv import load_dotenv
 import logging
-import pyodbc
 
-# Forțează codificarea UTF-8 pe Windows
-if sys.platform == "win32":
-    sys.stdout.reconfigure(encoding='utf-8')
+from logging_config import configure_logging
+from reprocessor import STEPS as REPROCESS_STEPS
+from storage import bulk_cursor, create_storage, storage_config_from_env
 
 # Încarcă variabilele de mediu
 load_dotenv()
 
-# Import modulele proprii
-from news_scraper import NewsScraper
-from api_server import app
-
-# Configurare logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('app.log', encoding='utf-8'),
-        logging.StreamHandler(sys.stdout)
-    ],
-    encoding='utf-8'
-)
+# Modulele fiecărei comenzi (scraper, Flask, NumPy) se importă în funcția comenzii, nu la pornire:
+# `python -m benchmarks.bench_startup` măsoară costul per comandă
 logger = logging.getLogger(__name__)
 
 def get_db_config():
-    """Obține configurația bazei de date din variabilele de mediu"""
-    return {
-        'server': os.getenv('DB_HOST', 'localhost\\SQLEXPRESS'),
-        'database': os.getenv('DB_NAME', 'news_scraper'),
-        'username': os.getenv('DB_USER', 'your_username'),
-        'password': os.getenv('DB_PASSWORD', 'your_password'),
-        'trusted_connection': True
-    }
+    """Obține configurația bazei de date din variabilele de mediu (backend-ul și conexiunea, vezi storage.py)"""
+    return storage_config_from_env()
 
 def get_llm_config():
     """Obține configurația LLM din variabilele de mediu"""
@@ -51,45 +29,293 @@ def get_llm_config():
         }
     return None
 
-def run_scraper():
-    """Rulează procesul de scraping"""
+def get_description_config():
+    """Obține configurația etapei de generare a descrierilor din variabilele de mediu"""
+    return {
+        'max_workers': int(os.getenv('LLM_WORKERS', 4)),
+        'batch_size': int(os.getenv('LLM_BATCH_SIZE', 1)),
+        'max_retries': int(os.getenv('LLM_MAX_RETRIES', 3)),
+        'backoff': float(os.getenv('LLM_BACKOFF', 1.0)),
+        'cache_path': os.getenv('LLM_CACHE_PATH', 'descriptions_cache.db'),
+        'failure_threshold': int(os.getenv('LLM_BREAKER_THRESHOLD', 5)),
+        'reset_timeout': float(os.getenv('LLM_BREAKER_RESET', 60))
+    }
+
+def get_crawl_config():
+    """Obține configurația frontierei de crawl din variabilele de mediu"""
+    return {
+        'frontier_path': os.getenv('CRAWL_FRONTIER_PATH', 'crawl_frontier.db'),
+        'depth': int(os.getenv('CRAWL_DEPTH', 0)),
+        'max_attempts': int(os.getenv('CRAWL_MAX_ATTEMPTS', 3)),
+        'max_age_days': int(os.getenv('CRAWL_MAX_AGE_DAYS', 30))
+    }
+
+def get_search_config():
+    """Obține configurația indexului de căutare din variabilele de mediu"""
+    return {'index_path': os.getenv('SEARCH_INDEX_PATH', 'search_index.db') or None}
+
+def get_archive_config():
+    """Obține configurația arhivei cu textul integral al articolelor (cale goală = dezactivată)"""
+    return {
+        'path': os.getenv('CONTENT_ARCHIVE_PATH', 'content_archive.db') or None,
+        # Gol = zstd dacă pachetul zstandard este instalat, altfel gzip
+        'codec': os.getenv('CONTENT_ARCHIVE_CODEC') or None,
+        'store_html': os.getenv('CONTENT_ARCHIVE_HTML', 'false').lower() == 'true'
+    }
+
+def get_dedup_config():
+    """Obține configurația detectării duplicatelor din variabilele de mediu"""
+    return {
+        'policy': os.getenv('DEDUP_POLICY', 'skip') or None,
+        'threshold': float(os.getenv('DEDUP_THRESHOLD', 0.7)),
+        'num_perm': int(os.getenv('DEDUP_NUM_PERM', 64)),
+        'bands': int(os.getenv('DEDUP_BANDS', 16))
+    }
+
+def get_keyword_config():
+    """Obține configurația extragerii cuvintelor cheie din variabilele de mediu"""
+    return {
+        'df_path': os.getenv('KEYWORDS_DF_PATH', 'keyword_df.db') or None,
+        'top_n': int(os.getenv('KEYWORDS_TOP_N', 10))
+    }
+
+def get_fetch_config():
+    """Obține configurația pentru descărcarea concurentă din variabilele de mediu"""
+    return {
+        'max_workers': int(os.getenv('SCRAPER_MAX_WORKERS', 8)),
+        'rate_per_host': float(os.getenv('SCRAPER_RATE_PER_HOST', 2.0)),
+        'burst': int(os.getenv('SCRAPER_BURST', 2)),
+        'timeout': int(os.getenv('SCRAPER_TIMEOUT', 30)),
+        'cache_dir': os.getenv('HTTP_CACHE_DIR', '.http_cache') or None,
+        'cache_max_mb': float(os.getenv('HTTP_CACHE_MAX_MB', 200))
+    }
+
+def get_pipeline_config():
+    """Obține configurația etapelor pipeline-ului de scraping din variabilele de mediu"""
+    return {
+        'parse_workers': int(os.getenv('SCRAPER_PARSE_WORKERS', 0)) or None,
+        # 0 = parsare pe fire în procesul principal
+        'parse_processes': int(os.getenv('SCRAPER_PARSE_PROCESSES', 0)) or None,
+        'queue_size': int(os.getenv('SCRAPER_QUEUE_SIZE', 100))
+    }
+
+def get_writer_config():
+    """Obține configurația pentru scrierea în loturi din variabilele de mediu"""
+    return {
+        'batch_size': int(os.getenv('DB_BATCH_SIZE', 50)),
+        'flush_interval': float(os.getenv('DB_FLUSH_INTERVAL', 10.0))
+    }
+
+def get_metrics_config():
+    """Obține fișierul pentru rezumatele JSON ale rulărilor (gol = dezactivat)"""
+    return {
+        'summary_path': os.getenv('RUN_SUMMARY_PATH', 'scrape_runs.jsonl') or None
+    }
+
+def get_server_config():
+    """Obține configurația serverului WSGI de producție (comanda `serve`) din variabilele de mediu"""
+    return {
+        # Gol = gunicorn dacă este instalat, altfel waitress
+        'server': os.getenv('API_SERVER') or None,
+        'host': os.getenv('API_HOST', '0.0.0.0'),
+        'port': int(os.getenv('API_PORT', 5000)),
+        # 0 = 2 x nuclee + 1 (doar gunicorn)
+        'workers': int(os.getenv('API_WORKERS', 0)) or None,
+        'threads': int(os.getenv('API_THREADS', 4)),
+        'keepalive': int(os.getenv('API_KEEPALIVE', 5)),
+        'timeout': int(os.getenv('API_TIMEOUT', 30)),
+        'graceful_timeout': int(os.getenv('API_GRACEFUL_TIMEOUT', 30)),
+        # 0 = worker-ii nu se repornesc după un număr de cereri
+        'max_requests': int(os.getenv('API_MAX_REQUESTS', 0)),
+        'access_log': os.getenv('API_ACCESS_LOG') or None
+    }
+
+def get_reprocess_config():
+    """Obține configurația re-procesării articolelor stocate din variabilele de mediu"""
+    return {
+        'batch_size': int(os.getenv('REPROCESS_BATCH_SIZE', 500)),
+        'checkpoint_path': os.getenv('REPROCESS_CHECKPOINT_PATH', 'reprocess_checkpoint.json') or None
+    }
+
+def get_scheduler_config():
+    """Obține configurația scheduler-ului adaptiv din variabilele de mediu (intervale în minute)"""
+    return {
+        'interval': float(os.getenv('SCHEDULER_INTERVAL_MINUTES', 30)) * 60,
+        'min_interval': float(os.getenv('SCHEDULER_MIN_INTERVAL_MINUTES', 5)) * 60,
+        'max_interval': float(os.getenv('SCHEDULER_MAX_INTERVAL_MINUTES', 120)) * 60,
+        'target_articles': int(os.getenv('SCHEDULER_TARGET_ARTICLES', 10)),
+        'jitter': float(os.getenv('SCHEDULER_JITTER', 0.1))
+    }
+
+def create_scraper(sources=None):
+    """Construiește un NewsScraper cu configurația din variabilele de mediu"""
+    from news_scraper import NewsScraper
+    return NewsScraper(get_db_config(), get_llm_config(), get_fetch_config(), get_writer_config(),
+                       get_description_config(), sources=sources, crawl_config=get_crawl_config(),
+                       search_config=get_search_config(), dedup_config=get_dedup_config(),
+                       keyword_config=get_keyword_config(), pipeline_config=get_pipeline_config(),
+                       metrics_config=get_metrics_config(), archive_config=get_archive_config())
+
+def run_scraper(sources=None):
+    """Rulează procesul de scraping pentru sursele date (implicit toate)"""
     try:
         logger.info("=== Începe procesul de scraping ===")
-        db_config = get_db_config()
-        llm_config = get_llm_config()
-        scraper = NewsScraper(db_config, llm_config)
+        scraper = create_scraper(sources)
         scraper.run_scraping()
         logger.info("=== Procesul de scraping s-a terminat ===")
     except Exception as e:
         logger.error(f"Eroare în procesul de scraping: {e}")
 
-def run_api_server():
-    """Rulează serverul API"""
+def rebuild_search_index(batch_size=1000):
+    """Reconstruiește indexul de căutare din toate articolele din baza de date"""
+    try:
+        from search_index import SearchIndex
+        logger.info("Reconstruiește indexul de căutare...")
+        connection = create_storage(**get_db_config()).connect()
+        index = SearchIndex(get_search_config()['index_path'])
+        cursor = connection.cursor()
+        cursor.execute("SELECT url, source, title, description, keywords FROM dbo.news")
+        indexed = 0
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            indexed += index.add_articles(
+                {'url': row[0], 'source': row[1], 'title': row[2], 'description': row[3], 'keywords': row[4]}
+                for row in rows
+            )
+            logger.info(f"Indexate {indexed} articole")
+        cursor.close()
+        connection.close()
+        index.optimize()
+        logger.info(f"Indexul de căutare conține {index.count()} articole")
+    except Exception as e:
+        logger.error(f"Eroare la reconstruirea indexului de căutare: {e}")
+
+def iterate_articles(connection, dialect, columns, batch_size):
+    """Parcurge dbo.news în loturi, în ordinea id-ului (keyset), fără un cursor deschis între loturi"""
+    from news_queries import limit_clause
+    last_id = 0
+    while True:
+        cursor = connection.cursor()
+        cursor.execute(
+            f"SELECT id, {', '.join(columns)} FROM dbo.news WHERE id > ? ORDER BY id"
+            + limit_clause(batch_size, dialect),
+            (last_id,)
+        )
+        rows = cursor.fetchall()
+        cursor.close()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1][0]
+
+def rekeyword_archive(batch_size=5000):
+    """Recalculează cuvintele cheie pentru toată arhiva
+
+    Prima trecere reconstruiește frecvențele de document din toate articolele, a doua scorează fiecare lot
+    (vectorizat, dacă NumPy este instalat) și actualizează coloana `keywords`.
+    """
+    try:
+        from keyword_engine import KeywordExtractor, DocumentFrequencies
+        from response_cache import notify_data_changed
+        config = get_keyword_config()
+        frequencies = DocumentFrequencies(config['df_path'])
+        extractor = KeywordExtractor(frequencies, config['top_n'])
+        storage = create_storage(**get_db_config())
+        connection = storage.connect()
+        logger.info(f"Recalculează cuvintele cheie (vectorizat: {extractor.vectorized})...")
+        frequencies.reset()
+        for rows in iterate_articles(connection, storage.dialect, ['title', 'content'], batch_size):
+            frequencies.add_documents(extractor.terms(row[1], row[2]) for row in rows)
+        frequencies.save()
+        logger.info(f"Frecvențe de document calculate pentru {frequencies.documents} articole")
+
+        updated = 0
+        for rows in iterate_articles(connection, storage.dialect, ['title', 'content'], batch_size):
+            keywords = extractor.extract_batch([(row[1], row[2]) for row in rows], update=False)
+            cursor = bulk_cursor(connection)
+            cursor.executemany("UPDATE dbo.news SET keywords = ? WHERE id = ?",
+                               [(words, row[0]) for words, row in zip(keywords, rows)])
+            connection.commit()
+            cursor.close()
+            # Cache-urile API-ului trebuie să vadă cuvintele cheie noi
+            notify_data_changed()
+            updated += len(rows)
+            logger.info(f"Actualizate {updated} articole")
+        connection.close()
+    except Exception as e:
+        logger.error(f"Eroare la recalcularea cuvintelor cheie: {e}")
+
+def reprocess_archive(steps=None, restart=False):
+    """Re-procesează articolele stocate cu etapele date (implicit extragere, categorii și cuvinte cheie)"""
+    try:
+        from reprocessor import Reprocessor
+        # Aceleași componente ca la scraping: adaptoare, frecvențe de document, LLM, index și arhivă
+        scraper = create_scraper()
+        if steps and 'description' in steps and not scraper.llm_generator.enabled:
+            # Fără LLM etapa nu ar schimba nimic: descrierile se rescriu doar cu răspunsuri ale LLM-ului
+            logger.error("Etapa description are nevoie de LLM (LLM_API_KEY)")
+            return
+        if not scraper.db.connect():
+            return
+        pipeline_config = get_pipeline_config()
+        reprocessor = Reprocessor(scraper.db, steps or ('extract', 'category', 'keywords'), archive=scraper.archive,
+                                  keywords=scraper.keywords, descriptions=scraper.description_pipeline,
+                                  search_index=scraper.search_index, parse_workers=pipeline_config['parse_workers'],
+                                  parse_processes=pipeline_config['parse_processes'], **get_reprocess_config())
+        reprocessor.run(restart)
+        scraper.db.disconnect()
+    except Exception as e:
+        logger.error(f"Eroare la re-procesarea articolelor: {e}")
+
+def run_api_server(use_reloader=None):
+    """Rulează serverul API cu serverul de dezvoltare Flask (pentru producție: `serve`)"""
     try:
-        logger.info("Pornește serverul API...")
+        from api_server import app
+        logger.info("Pornește serverul API (server de dezvoltare; pentru producție folosiți comanda serve)...")
         host = os.getenv('API_HOST', '0.0.0.0')
         port = int(os.getenv('API_PORT', 5000))
-        debug = os.getenv('API_DEBUG', 'True').lower() == 'true'
-        app.run(debug=debug, host=host, port=port)
+        debug = os.getenv('API_DEBUG', 'false').lower() == 'true'
+        app.run(debug=debug, host=host, port=port, use_reloader=use_reloader)
+    except Exception as e:
+        logger.error(f"Eroare la pornirea serverului API: {e}")
+
+def run_production_server():
+    """Rulează serverul API cu un server WSGI de producție (gunicorn sau waitress, vezi wsgi_server.py)"""
+    try:
+        from wsgi_server import serve
+        serve(**get_server_config())
     except Exception as e:
         logger.error(f"Eroare la pornirea serverului API: {e}")
 
-def run_scheduler():
-    """Rulează scheduler-ul pentru scraping automat"""
+def run_scheduler(sources=None, with_api=False):
+    """Rulează scheduler-ul adaptiv pentru scraping automat, opțional împreună cu serverul API"""
+    from source_scheduler import SourceScheduler
     logger.info("Pornește scheduler-ul pentru scraping automat...")
-    schedule.every(30).minutes.do(run_scraper)
-    run_scraper()
-    while True:
-        schedule.run_pending()
-        time.sleep(60)
+    # Același scraper în toate ciclurile: cache-urile de URL-uri, duplicate și pool-urile rămân calde
+    scraper = create_scraper(sources)
+    scheduler = SourceScheduler(scraper.run_scraping, [adapter.name for adapter in scraper.adapters],
+                                **get_scheduler_config())
+    scheduler.start()
+    try:
+        if with_api:
+            # Reloader-ul Flask ar porni un al doilea proces, deci și un al doilea scheduler
+            run_api_server(use_reloader=False)
+        else:
+            scheduler.thread.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        scheduler.stop()
 
 def test_connection():
     """Testează conexiunea la baza de date"""
     try:
         logger.info("Testează conexiunea la baza de date...")
-        db_config = get_db_config()
-        connection_string = f"DRIVER={{ODBC Driver 17 for SQL Server}};SERVER={db_config['server']};DATABASE={db_config['database']};Trusted_Connection=yes;"
-        connection = pyodbc.connect(connection_string)
+        storage = create_storage(**get_db_config())
+        logger.info(f"Backend: {storage.describe()}")
+        connection = storage.connect()
         cursor = connection.cursor()
         cursor.execute("SELECT COUNT(*) FROM dbo.news")
         count = cursor.fetchone()[0]
@@ -102,22 +328,44 @@ def test_connection():
 def main():
     """Funcția principală"""
     parser = argparse.ArgumentParser(description='News Scraper Application')
-    parser.add_argument('command', choices=['scrape', 'api', 'scheduler', 'test'], 
+    parser.add_argument('command',
+                        choices=['scrape', 'api', 'serve', 'scheduler', 'test', 'index', 'keywords', 'reprocess'],
                         help='Comanda de executat')
+    # Fără `choices`: lista surselor ar importa adaptoarele (și BeautifulSoup) pentru orice comandă
     parser.add_argument('--sources', nargs='+', 
-                        choices=['hotnews', 'digi24', 'all'], 
                         default=['all'],
-                        help='Sursele pentru scraping')
+                        help='Sursele pentru scraping (ex. hotnews digi24; implicit all)')
+    parser.add_argument('--with-api', action='store_true',
+                        help='Cu scheduler: rulează și serverul API în același proces')
+    parser.add_argument('--steps', nargs='+', choices=REPROCESS_STEPS,
+                        help='Cu reprocess: etapele de rulat (implicit extract, category, keywords)')
+    parser.add_argument('--restart', action='store_true',
+                        help='Cu reprocess: ignoră checkpoint-ul și începe de la primul articol')
     args = parser.parse_args()
+    if args.command in ('scrape', 'scheduler'):
+        from site_adapters import get_adapters
+        try:
+            get_adapters(args.sources)
+        except ValueError as e:
+            parser.error(str(e))
+    configure_logging('app.log')
     logger.info(f"Rulează comanda: {args.command}")
     if args.command == 'scrape':
-        run_scraper()
+        run_scraper(args.sources)
     elif args.command == 'api':
         run_api_server()
+    elif args.command == 'serve':
+        run_production_server()
     elif args.command == 'scheduler':
-        run_scheduler()
+        run_scheduler(args.sources, args.with_api)
     elif args.command == 'test':
         test_connection()
+    elif args.command == 'index':
+        rebuild_search_index()
+    elif args.command == 'keywords':
+        rekeyword_archive()
+    elif args.command == 'reprocess':
+        reprocess_archive(args.steps, args.restart)
     else:
         print("Comandă nerecunoscută!")
         sys.exit(1)
@@ -0,0 +1,173 @@
+"""Metrici în proces (contoare, histograme, gauge-uri) exportate în formatul text Prometheus
+
+Fără dependențe externe. O observație înseamnă o căutare în dicționarul etichetelor, o căutare binară
+în limitele histogramei și o adunare sub un lock, deci instrumentarea poate rămâne activă în producție.
+Toate metricile procesului stau în `REGISTRY`, iar `/metrics` din api_server.py le expune. Când
+scheduler-ul și API-ul rulează în același proces, apar acolo și metricile scraper-ului.
+"""
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+# Limitele implicite (secunde): de la interogări de câteva ms până la cereri LLM de zeci de secunde
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = (1, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+
+def format_labels(names, values, extra=()):
+    pairs = [*zip(names, values), *extra]
+    if not pairs:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in pairs)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + '}'
+
+
+def format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def key(self, labels):
+        try:
+            if len(labels) == len(self.label_names):
+                return tuple([labels[name] for name in self.label_names])
+        except KeyError:
+            pass
+        raise ValueError(f"Metrica {self.name} are etichetele {self.label_names}, primite {tuple(labels)}")
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.kind}']
+        lines.extend(self.samples())
+        return lines
+
+
+class Counter(Metric):
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self.key(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def get(self, **labels):
+        return self.values.get(self.key(labels), 0)
+
+    def samples(self):
+        with self.lock:
+            items = sorted(self.values.items())
+        return [f'{self.name}{format_labels(self.label_names, key)} {format_value(value)}' for key, value in items]
+
+
+class Gauge(Counter):
+    """Valoare setată direct sau citită la export prin `callback` (fără etichete)"""
+    kind = 'gauge'
+
+    def __init__(self, name, documentation, labels=(), callback=None):
+        super().__init__(name, documentation, labels)
+        self.callback = callback
+
+    def set(self, value, **labels):
+        key = self.key(labels)
+        with self.lock:
+            self.values[key] = value
+
+    def samples(self):
+        if self.callback is not None:
+            try:
+                value = self.callback()
+            except Exception:
+                return []
+            return [f'{self.name} {format_value(value)}']
+        return super().samples()
+
+
+class Histogram(Metric):
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labels=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self.key(labels)
+        index = bisect_left(self.buckets, value)
+        with self.lock:
+            state = self.values.get(key)
+            if state is None:
+                # [numărul pe fiecare interval..., suma, numărul total]
+                state = self.values[key] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+            state[index] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def samples(self):
+        with self.lock:
+            items = sorted((key, list(state)) for key, state in self.values.items())
+        lines = []
+        for key, state in items:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float('inf')), state):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{format_labels(self.label_names, key, [("le", format_value(bound))])} '
+                             f'{cumulative}')
+            lines.append(f'{self.name}_sum{format_labels(self.label_names, key)} {format_value(state[-2])}')
+            lines.append(f'{self.name}_count{format_labels(self.label_names, key)} {state[-1]}')
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.metrics = {}
+        self.lock = threading.Lock()
+
+    def _register(self, cls, name, *args, **kwargs):
+        # Înregistrarea e idempotentă: modulele reîncărcate primesc aceeași metrică
+        with self.lock:
+            metric = self.metrics.get(name)
+            if metric is None:
+                metric = self.metrics[name] = cls(name, *args, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metrica {name} este deja înregistrată ca {metric.kind}")
+            return metric
+
+    def counter(self, name, documentation, labels=()):
+        return self._register(Counter, name, documentation, labels)
+
+    def gauge(self, name, documentation, labels=(), callback=None):
+        return self._register(Gauge, name, documentation, labels, callback)
+
+    def histogram(self, name, documentation, labels=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram, name, documentation, labels, buckets)
+
+    def render(self):
+        """Toate metricile, în formatul text de expunere Prometheus (version 0.0.4)"""
+        with self.lock:
+            metrics = list(self.metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = MetricsRegistry()
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
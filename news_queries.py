@@ -0,0 +1,88 @@
+"""Construirea query-urilor pentru listarea articolelor (filtre, proiecție, paginare keyset)
+
+Paginarea keyset se bazează pe indexul din sql/indexes.sql:
+    CREATE INDEX IX_news_publishedAt_id ON dbo.news (publishedAt DESC, id DESC)
+astfel încât fiecare pagină este o căutare în index urmată de `limit` rânduri,
+indiferent cât de adâncă este pagina.
+"""
+import base64
+import json
+from datetime import datetime
+
+NEWS_FIELDS = ['id', 'title', 'source', 'category', 'author', 'url', 'keywords',
+               'description', 'publishedAt', 'content', 'urlToImage']
+
+# Coloanele necesare pentru a construi cursorul paginii următoare
+CURSOR_FIELDS = ['publishedAt', 'id']
+
+
+def parse_fields(value):
+    """Transformă parametrul `fields=` într-o listă de coloane validă; ValueError pentru coloane necunoscute"""
+    if not value:
+        return list(NEWS_FIELDS)
+    fields = [field.strip() for field in value.split(',') if field.strip()]
+    unknown = [field for field in fields if field not in NEWS_FIELDS]
+    if unknown:
+        raise ValueError(f"Câmpuri necunoscute: {', '.join(unknown)}")
+    return list(dict.fromkeys(fields))
+
+
+def encode_cursor(published_at, article_id):
+    if isinstance(published_at, datetime):
+        published_at = published_at.isoformat()
+    payload = json.dumps([published_at, article_id], separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(payload).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token):
+    """Decodează un cursor opac în (publishedAt, id); ValueError dacă token-ul este invalid"""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        published_at, article_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        return datetime.fromisoformat(published_at), int(article_id)
+    except Exception:
+        raise ValueError("Cursor invalid")
+
+
+def limit_clause(limit, dialect='mssql'):
+    """Limitarea numărului de rânduri după ORDER BY, în dialectul backend-ului (storage.py)"""
+    if dialect == 'mssql':
+        return f" OFFSET 0 ROWS FETCH NEXT {int(limit)} ROWS ONLY"
+    return f" LIMIT {int(limit)}"
+
+
+def build_news_query(fields=None, source=None, category=None, start_date=None, end_date=None,
+                     cursor=None, limit=None, dialect='mssql', table='dbo.news', collapse_duplicates=False):
+    """Returnează (query, params) pentru listarea articolelor în ordinea (publishedAt, id) descrescătoare
+
+    Cu `collapse_duplicates` se returnează doar reprezentanții grupurilor de duplicate (sql/near_duplicates.sql).
+    """
+    fields = fields or NEWS_FIELDS
+    columns = list(dict.fromkeys(fields + CURSOR_FIELDS))
+    query = f"SELECT {', '.join(columns)} FROM {table} WHERE 1=1"
+    params = []
+
+    if collapse_duplicates:
+        query += " AND duplicate_of IS NULL"
+    if source:
+        query += " AND source = ?"
+        params.append(source)
+    if category:
+        query += " AND category = ?"
+        params.append(category)
+    if start_date:
+        query += " AND publishedAt >= ?"
+        params.append(start_date)
+    if end_date:
+        query += " AND publishedAt <= ?"
+        params.append(end_date)
+    if cursor:
+        published_at, article_id = cursor
+        # Condiția redundantă `publishedAt <= ?` permite căutarea pe interval în index
+        query += " AND publishedAt <= ? AND (publishedAt < ? OR (publishedAt = ? AND id < ?))"
+        params.extend([published_at, published_at, published_at, article_id])
+
+    query += " ORDER BY publishedAt DESC, id DESC"
+    if limit:
+        query += limit_clause(limit, dialect)
+    return query, params
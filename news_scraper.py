@@ -1,49 +1,63 @@
 import requests
-from bs4 import BeautifulSoup
-import pyodbc
 import json
 import re
 from datetime import datetime
 import time
 import logging
-from urllib.parse import urljoin, urlparse
-import hashlib
-import sys
-
-# Forțează codificarea UTF-8 pe Windows
-if sys.platform == "win32":
-    sys.stdout.reconfigure(encoding='utf-8')
-
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('scraper.log', encoding='utf-8'),
-        logging.StreamHandler(sys.stdout)
-    ],
-    encoding='utf-8'
-)
+import os
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from fetcher import ConcurrentFetcher
+from http_cache import HttpCache
+from url_cache import KnownUrlCache
+from article_writer import BufferedArticleWriter
+from response_cache import notify_data_changed
+from description_pipeline import DescriptionPipeline, DescriptionCache, CircuitBreaker
+from site_adapters import get_adapters
+from crawl_frontier import CrawlFrontier, extract_feed_links
+from search_index import SearchIndex, SearchIndexUnavailable
+from content_archive import ContentArchive
+from near_duplicates import NearDuplicateDetector
+from keyword_engine import KeywordExtractor, DocumentFrequencies
+from staged_pipeline import StagedPipeline, Stage
+from parse_pool import shared_parse_pool
+from metrics import REGISTRY
+from storage import create_storage, bulk_cursor
+from datetime import timedelta
+from collections import Counter
+
 logger = logging.getLogger(__name__)
 
+PARSE_SECONDS = REGISTRY.histogram('scraper_parse_seconds', 'Durata parsării unei pagini de articol', ('mode',))
+ARTICLES = REGISTRY.counter('scraper_articles_total', 'Articole după rezultat: new, existing, duplicate, failed',
+                            ('outcome',))
+RUN_SECONDS = REGISTRY.histogram('scraper_run_seconds', 'Durata unui ciclu complet de scraping',
+                                 buckets=(10, 30, 60, 120, 300, 600, 1200, 1800, 3600))
+LAST_RUN = REGISTRY.gauge('scraper_last_run_timestamp_seconds', 'Momentul terminării ultimului ciclu (epoch)')
+
 class NewsDatabase:
-    def __init__(self, server='localhost', database='news_scraper', trusted_connection=True, username=None, password=None):
-        self.server = server
-        self.database = database
-        self.trusted_connection = trusted_connection
-        self.username = username
-        self.password = password
+    """Accesul scraper-ului la dbo.news, peste un backend din storage.py
+
+    `storage` este un StorageBackend; fără el, restul argumentelor (`backend`, `server`, `path` etc.) se dau lui
+    `create_storage`, implicit SQL Server.
+    """
+    # SQL Server acceptă maxim 2100 de parametri per query
+    URL_BATCH_SIZE = 900
+
+    def __init__(self, storage=None, url_cache_size=50000, url_cache_days=7, track_duplicates=False,
+                 **storage_config):
+        self.storage = storage or create_storage(**storage_config)
         self.connection = None
+        self.known_urls = KnownUrlCache(url_cache_size)
+        self.url_cache_days = url_cache_days
+        # Coloana duplicate_of există doar după sql/near_duplicates.sql
+        self.track_duplicates = track_duplicates
 
     def connect(self):
         try:
-            if self.trusted_connection:
-                connection_string = f'DRIVER={{ODBC Driver 17 for SQL Server}};SERVER={self.server};DATABASE={self.database};Trusted_Connection=yes;'
-            else:
-                connection_string = f'DRIVER={{ODBC Driver 17 for SQL Server}};SERVER={self.server};DATABASE={self.database};UID={self.username};PWD={self.password};'
-            
-            self.connection = pyodbc.connect(connection_string)
-            logger.info("Conectat cu succes la baza de date SQL Server")
+            self.connection = self.storage.connect()
+            logger.info(f"Conectat cu succes la baza de date ({self.storage.describe()})")
             return True
         except Exception as e:
             logger.error(f"Eroare la conectarea la baza de date: {e}")
@@ -54,61 +68,181 @@ class NewsDatabase:
             self.connection.close()
             logger.info("Conexiunea la baza de date a fost închisă")
 
-    def article_exists(self, url):
+    def warm_url_cache(self):
+        """Încarcă în cache URL-urile articolelor recente, ca repetițiile să nu mai ajungă la baza de date"""
         try:
+            since = (datetime.now() - timedelta(days=self.url_cache_days)).strftime('%Y-%m-%d %H:%M:%S')
             cursor = self.connection.cursor()
-            cursor.execute("SELECT COUNT(*) FROM dbo.news WHERE url = ?", (url,))
-            result = cursor.fetchone()
+            cursor.execute("SELECT url FROM dbo.news WHERE publishedAt >= ?", (since,))
+            while not self.known_urls.is_full():
+                rows = cursor.fetchmany(1000)
+                if not rows:
+                    break
+                self.known_urls.update(row[0] for row in rows)
             cursor.close()
-            return result[0] > 0
+            logger.info(f"Cache-ul de URL-uri conține {len(self.known_urls)} intrări")
         except Exception as e:
-            logger.error(f"Eroare la verificarea articolului: {e}")
-            return False
+            logger.error(f"Eroare la încărcarea cache-ului de URL-uri: {e}")
+
+    def recent_articles(self, batch_size=1000):
+        """Titlul și conținutul articolelor din ultimele `url_cache_days` zile, pentru indexul de duplicate"""
+        since = (datetime.now() - timedelta(days=self.url_cache_days)).strftime('%Y-%m-%d %H:%M:%S')
+        columns = ['url', 'title', 'content'] + (['duplicate_of'] if self.track_duplicates else [])
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(
+                f"SELECT {', '.join(columns)} FROM dbo.news WHERE publishedAt >= ? ORDER BY publishedAt", (since,))
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(zip(columns, row))
+        finally:
+            cursor.close()
+
+    def existing_urls(self, urls):
+        """Returnează mulțimea URL-urilor din `urls` care sunt deja stocate, cu un singur query per lot"""
+        urls = list(dict.fromkeys(urls))
+        found = {url for url in urls if url in self.known_urls}
+        pending = [url for url in urls if url not in found]
+        try:
+            cursor = self.connection.cursor()
+            for i in range(0, len(pending), self.URL_BATCH_SIZE):
+                chunk = pending[i:i + self.URL_BATCH_SIZE]
+                placeholders = ', '.join('?' * len(chunk))
+                cursor.execute(f"SELECT url FROM dbo.news WHERE url IN ({placeholders})", chunk)
+                found.update(row[0] for row in cursor.fetchall())
+            cursor.close()
+        except Exception as e:
+            logger.error(f"Eroare la verificarea articolelor: {e}")
+        self.known_urls.update(found)
+        return found
+
+    def article_exists(self, url):
+        return url in self.existing_urls([url])
+
+    INSERT_QUERY = """
+        INSERT INTO dbo.news (title, source, category, author, url, keywords, description, publishedAt, content, urlToImage)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    CLUSTER_INSERT_QUERY = """
+        INSERT INTO dbo.news (title, source, category, author, url, keywords, description, publishedAt, content, urlToImage,
+                              duplicate_of)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @property
+    def insert_query(self):
+        return self.CLUSTER_INSERT_QUERY if self.track_duplicates else self.INSERT_QUERY
+
+    def insert_row(self, article_data):
+        row = self.article_row(article_data)
+        if self.track_duplicates:
+            row += (article_data.get('duplicate_of'),)
+        return row
+
+    @staticmethod
+    def article_row(article_data):
+        return (
+            article_data['title'],
+            article_data['source'],
+            article_data['category'],
+            article_data['author'],
+            article_data['url'],
+            article_data['keywords'],
+            article_data['description'],
+            article_data['publishedAt'],
+            article_data['content'],
+            article_data.get('urlToImage')
+        )
 
     def insert_article(self, article_data):
         try:
             cursor = self.connection.cursor()
-            insert_query = """
-                INSERT INTO dbo.news (title, source, category, author, url, keywords, description, publishedAt, content, urlToImage)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
-            cursor.execute(insert_query, (
-                article_data['title'],
-                article_data['source'],
-                article_data['category'],
-                article_data['author'],
-                article_data['url'],
-                article_data['keywords'],
-                article_data['description'],
-                article_data['publishedAt'],
-                article_data['content'],
-                article_data.get('urlToImage')
-            ))
+            cursor.execute(self.insert_query, self.insert_row(article_data))
             self.connection.commit()
             cursor.close()
+            self.known_urls.add(article_data['url'])
             logger.info(f"Articol insertat cu succes: {article_data['title'][:50]}...")
             return True
         except Exception as e:
             logger.error(f"Eroare la inserarea articolului: {e}")
             return False
 
+    def insert_articles(self, articles):
+        """Inserează un lot de articole într-o singură tranzacție; returnează (inserate, eșuate)"""
+        if not articles:
+            return [], []
+        rows = [self.insert_row(article) for article in articles]
+        cursor = bulk_cursor(self.connection)
+        try:
+            cursor.executemany(self.insert_query, rows)
+            self.connection.commit()
+            inserted, failed = list(articles), []
+        except Exception as e:
+            # Un rând invalid nu trebuie să piardă tot lotul: se reia rând cu rând, tot într-o singură tranzacție
+            logger.warning(f"Lotul de {len(rows)} articole a eșuat ({e}), se reîncearcă rând cu rând")
+            self.connection.rollback()
+            inserted, failed = [], []
+            for article, row in zip(articles, rows):
+                try:
+                    cursor.execute(self.insert_query, row)
+                    inserted.append(article)
+                except Exception as row_error:
+                    logger.error(f"Eroare la inserarea articolului {article.get('url')}: {row_error}")
+                    failed.append(article)
+            try:
+                self.connection.commit()
+            except Exception as commit_error:
+                logger.error(f"Eroare la commit-ul lotului: {commit_error}")
+                self.connection.rollback()
+                inserted, failed = [], list(articles)
+        finally:
+            cursor.close()
+        self.known_urls.update(article['url'] for article in inserted)
+        logger.info(f"Lot insertat: {len(inserted)} articole, {len(failed)} eșuate")
+        return inserted, failed
+
+class LLMAPIError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"Eroare API LLM: {status_code}")
+        self.status_code = status_code
+
 class LLMDescriptionGenerator:
-    def __init__(self, api_url="https://api.openai.com/v1/chat/completions", api_key="your_api_key"):
+    def __init__(self, api_url="https://api.openai.com/v1/chat/completions", api_key="your_api_key", timeout=30):
         self.api_url = api_url
         self.api_key = api_key
+        self.timeout = timeout
         self.headers = {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {api_key}"
         }
 
-    def generate_description(self, title, content, max_length=200):
-        try:
-            if not self.api_key or self.api_key == "your_api_key":
-                return self.fallback_description(title, content, max_length)
-            
-            truncated_content = content[:1500] if content else ""
-            
-            prompt = f"""
+    @property
+    def enabled(self):
+        return bool(self.api_key) and self.api_key != "your_api_key"
+
+    def request_completion(self, prompt, max_tokens=100):
+        """Trimite un prompt la API și returnează textul răspunsului; ridică excepție la orice eroare"""
+        payload = {
+            "model": "gpt-3.5-turbo",
+            "messages": [
+                {"role": "system", "content": "Ești un asistent care creează descrieri scurte pentru știri în limba română."},
+                {"role": "user", "content": prompt}
+            ],
+            "max_tokens": max_tokens,
+            "temperature": 0.7
+        }
+        response = requests.post(self.api_url, headers=self.headers, json=payload, timeout=self.timeout)
+        if response.status_code != 200:
+            raise LLMAPIError(response.status_code)
+        result = response.json()
+        return result['choices'][0]['message']['content'].strip()
+
+    def build_prompt(self, title, content, max_length=200):
+        truncated_content = content[:1500] if content else ""
+        return f"""
             Creează o descriere scurtă și concisă în română pentru următoarea știre:
             
             Titlu: {title}
@@ -116,27 +250,38 @@ class LLMDescriptionGenerator:
             
             Descrierea trebuie să fie între 50-{max_length} caractere și să rezume esențialul știrii.
             """
-            
-            payload = {
-                "model": "gpt-3.5-turbo",
-                "messages": [
-                    {"role": "system", "content": "Ești un asistent care creează descrieri scurte pentru știri în limba română."},
-                    {"role": "user", "content": prompt}
-                ],
-                "max_tokens": 100,
-                "temperature": 0.7
-            }
-            
-            response = requests.post(self.api_url, headers=self.headers, json=payload, timeout=30)
-            
-            if response.status_code == 200:
-                result = response.json()
-                description = result['choices'][0]['message']['content'].strip()
-                return description
-            else:
-                logger.warning(f"Eroare API LLM: {response.status_code}")
+
+    def build_batch_prompt(self, articles, max_length=200):
+        parts = []
+        for index, (title, content) in enumerate(articles, 1):
+            truncated_content = content[:1500] if content else ""
+            parts.append(f"Știrea {index}:\nTitlu: {title}\nConținut: {truncated_content}")
+        return (
+            "Creează câte o descriere scurtă și concisă în română pentru fiecare dintre următoarele știri.\n"
+            f"Fiecare descriere trebuie să fie între 50-{max_length} caractere și să rezume esențialul știrii.\n"
+            f"Răspunde doar cu o listă JSON de {len(articles)} șiruri, în ordinea știrilor.\n\n"
+            + "\n\n".join(parts)
+        )
+
+    def generate_batch(self, articles, max_length=200):
+        """Generează descrieri pentru o listă de (titlu, conținut) într-o singură cerere; ridică excepție la eșec"""
+        if len(articles) == 1:
+            title, content = articles[0]
+            return [self.request_completion(self.build_prompt(title, content, max_length))]
+        text = self.request_completion(self.build_batch_prompt(articles, max_length), max_tokens=100 * len(articles))
+        descriptions = json.loads(text[text.find('['):text.rfind(']') + 1])
+        if not isinstance(descriptions, list) or len(descriptions) != len(articles):
+            raise ValueError("Răspunsul LLM nu conține câte o descriere pentru fiecare știre")
+        return [str(description).strip() for description in descriptions]
+
+    def generate_description(self, title, content, max_length=200):
+        try:
+            if not self.enabled:
                 return self.fallback_description(title, content, max_length)
-                
+            return self.request_completion(self.build_prompt(title, content, max_length))
+        except LLMAPIError as e:
+            logger.warning(f"Eroare API LLM: {e.status_code}")
+            return self.fallback_description(title, content, max_length)
         except Exception as e:
             logger.error(f"Eroare la generarea descrierii: {e}")
             return self.fallback_description(title, content, max_length)
@@ -158,222 +303,325 @@ class LLMDescriptionGenerator:
             return title[:max_length] if len(title) <= max_length else title[:max_length-3] + "..."
 
 class NewsScraper:
-    def __init__(self, db_config, llm_config=None):
-        self.db = NewsDatabase(**db_config)
+    def __init__(self, db_config, llm_config=None, fetch_config=None, writer_config=None, description_config=None,
+                 sources=None, crawl_config=None, search_config=None, dedup_config=None, keyword_config=None,
+                 pipeline_config=None, metrics_config=None, archive_config=None):
+        dedup_config = dict(dedup_config or {})
+        self.duplicates = NearDuplicateDetector(**dedup_config) if dedup_config.get('policy') else None
+        track_duplicates = self.duplicates is not None and self.duplicates.policy == 'cluster'
+        self.db = NewsDatabase(**db_config, track_duplicates=track_duplicates)
+        self.adapters = get_adapters(sources)
+        crawl_config = crawl_config or {}
+        self.crawl_depth = crawl_config.get('depth', 0)
+        self.frontier_max_age_days = crawl_config.get('max_age_days', 30)
+        self.frontier = CrawlFrontier(crawl_config.get('frontier_path', ':memory:'), crawl_config.get('max_attempts', 3))
+        self.writer_config = writer_config or {}
+        self.pipeline_config = pipeline_config or {}
+        self.pipeline = None
+        self.inserted_by_source = Counter()
+        self.articles = Counter()
+        self.insert_seconds = 0.0
+        self.summary_path = (metrics_config or {}).get('summary_path')
+        self.last_run_summary = None
+        keyword_config = keyword_config or {}
+        self.keywords = KeywordExtractor(DocumentFrequencies(keyword_config.get('df_path')),
+                                         keyword_config.get('top_n', 10))
+        self.search_index = None
+        index_path = (search_config or {}).get('index_path')
+        if index_path:
+            try:
+                self.search_index = SearchIndex(index_path)
+            except SearchIndexUnavailable as e:
+                logger.warning(f"Indexul de căutare este dezactivat: {e}")
+        archive_config = dict(archive_config or {})
+        archive_path = archive_config.pop('path', None)
+        self.archive = ContentArchive(archive_path, **archive_config) if archive_path else None
         self.llm_generator = LLMDescriptionGenerator(**llm_config) if llm_config else LLMDescriptionGenerator()
+        description_config = dict(description_config or {})
+        cache_path = description_config.pop('cache_path', 'descriptions_cache.db')
+        breaker = CircuitBreaker(description_config.pop('failure_threshold', 5), description_config.pop('reset_timeout', 60.0))
+        cache = DescriptionCache(cache_path) if cache_path and self.llm_generator.enabled else None
+        self.description_pipeline = DescriptionPipeline(self.llm_generator, cache, breaker=breaker, **description_config)
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        fetch_config = dict(fetch_config or {})
+        cache_dir = fetch_config.pop('cache_dir', None)
+        cache_max_mb = fetch_config.pop('cache_max_mb', 200)
+        http_cache = HttpCache(cache_dir, int(cache_max_mb * 1024 * 1024)) if cache_dir else None
+        self.fetcher = ConcurrentFetcher(self.session, cache=http_cache, **fetch_config)
+        # Pool-ul de conexiuni HTTP trebuie să fie cel puțin cât numărul de fire
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=self.fetcher.max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
 
     def extract_keywords(self, title, content):
-        text = f"{title} {content}".lower()
-        stop_words = {
-            'și', 'sau', 'dar', 'care', 'pentru', 'din', 'cu', 'la', 'pe', 'de', 'în', 'să', 'că', 'nu',
-            'se', 'au', 'este', 'sunt', 'era', 'vor', 'poate', 'toate', 'foarte', 'mai', 'după', 'până'
-        }
-        words = re.findall(r'\b[a-zA-ZăâîșțĂÂÎȘȚ]{3,}\b', text)
-        keywords = [word for word in words if word not in stop_words]
-        from collections import Counter
-        word_freq = Counter(keywords)
-        top_keywords = [word for word, count in word_freq.most_common(10)]
-        return ', '.join(top_keywords)
-
-    def scrape_hotnews(self):
-        """Scrape articole de pe HotNews.ro"""
-        logger.info("Începe scraping-ul pentru HotNews.ro")
-        try:
-            response = self.session.get('https://hotnews.ro', timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            article_links = []
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                if '/stiri/' in href or '/articol/' in href:
-                    full_url = urljoin('https://hotnews.ro', href)
-                    if not full_url.startswith(('mailto:', 'https://www.facebook.com', 'https://twitter.com', 'https://whatsapp.com')):
-                        article_links.append(full_url)
-            
-            article_links = list(set(article_links))[:20]
-            
-            logger.info(f"Găsite {len(article_links)} articole pe HotNews")
-            
-            for article_url in article_links:
-                if self.db.article_exists(article_url):
-                    logger.info(f"Articolul există deja: {article_url}")
+        """Cuvintele cheie după TF-IDF; articolul intră și în frecvențele de document ale corpusului"""
+        return self.keywords.extract(title, content)
+
+    def get_links(self, adapter):
+        """Descoperă link-urile de articole ale unei surse și returnează ce trebuie descărcat în acest ciclu
+
+        Se parcurg prima pagină și, de la adâncimea 1, paginile de secțiune și feed-urile sursei. Link-urile
+        găsite intră în frontiera persistentă; se programează doar cele neprocesate, cel mult
+        `adapter.max_links`: întâi cele regăsite acum în pagini, în ordinea poziției, apoi cele rămase din
+        ciclurile anterioare.
+        """
+        logger.info(f"Începe scraping-ul pentru {adapter.source}")
+        discovery_started = time.time()
+        for page_url, depth, is_feed in adapter.crawl_pages(self.crawl_depth):
+            try:
+                response = self.fetcher.get(page_url)
+                response.raise_for_status()
+                cache = self.fetcher.cache
+                if cache is not None and not cache.content_changed(page_url, response.content):
+                    logger.info(f"Pagina {page_url} nu s-a schimbat de la ultima rulare")
                     continue
-                
-                article_data = self.scrape_single_article_hotnews(article_url)
-                if article_data and article_data['title'] not in ["JavaScript is not available.", "Share on WhatsApp"]:
-                    self.db.insert_article(article_data)
-                
-                time.sleep(1)
-                
-        except Exception as e:
-            logger.error(f"Eroare la scraping HotNews: {e}")
+                if is_feed:
+                    article_links = adapter.filter_article_links(extract_feed_links(response.content), page_url)
+                else:
+                    article_links = adapter.extract_article_links(response.content, page_url)
+                new_links = self.frontier.discover(adapter.name, article_links, depth)
+                logger.info(f"Găsite {len(article_links)} articole pe {page_url}, dintre care {new_links} noi")
+            except Exception as e:
+                logger.error(f"Eroare la scraping {adapter.source} ({page_url}): {e}")
+        return self.frontier.next_batch(adapter.name, adapter.max_links, seen_since=discovery_started)
 
-    def scrape_single_article_hotnews(self, url):
-        """Scrape un singur articol de pe HotNews"""
+    def fetch_article(self, job):
+        """Etapa de descărcare: (adaptor, url) -> (adaptor, url, conținut) sau None"""
+        adapter, url = job
         try:
-            response = self.session.get(url, timeout=30)
+            response = self.fetcher.get(url)
             response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            title_elem = soup.find('h1') or soup.find('title')
-            title = title_elem.get_text(strip=True) if title_elem else "Titlu nedisponibil"
-            if title in ["JavaScript is not available.", "Share on WhatsApp"] or not title:
-                logger.warning(f"Titlu invalid pentru {url}: {title}")
-                return None
-            
-            author_elem = soup.find('span', class_='author') or soup.find('div', class_='author')
-            author = author_elem.get_text(strip=True) if author_elem else "Autor nedisponibil"
-            
-            content_elem = soup.find('div', class_='article-content') or soup.find('div', class_='content') or soup.find('article')
-            content = ""
-            if content_elem:
-                for script in content_elem(["script", "style"]):
-                    script.decompose()
-                content = content_elem.get_text(strip=True)
-            
-            time_elem = soup.find('time') or soup.find('span', class_='date')
-            published_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            if time_elem and time_elem.get('datetime'):
-                try:
-                    published_at = datetime.fromisoformat(time_elem['datetime'].replace('Z', '+00:00')).strftime('%Y-%m-%d %H:%M:%S')
-                except:
-                    pass
-            
-            description = self.llm_generator.generate_description(title, content)
-            keywords = self.extract_keywords(title, content)
-            
-            image_elem = soup.find('meta', property='og:image')
-            url_to_image = image_elem['content'] if image_elem else None
-            
-            category = "General"
-            if any(word in title.lower() for word in ['politic', 'guvern', 'parlament']):
-                category = "Politică"
-            elif any(word in title.lower() for word in ['sport', 'fotbal', 'tenis']):
-                category = "Sport"
-            elif any(word in title.lower() for word in ['economic', 'bani', 'investiții']):
-                category = "Economie"
-            
-            return {
-                'title': title,
-                'source': 'HotNews',
-                'category': category,
-                'author': author,
-                'url': url,
-                'keywords': keywords,
-                'description': description,
-                'publishedAt': published_at,
-                'content': content[:1000],
-                'urlToImage': url_to_image
-            }
-            
+            return adapter, url, response.content
         except Exception as e:
-            logger.error(f"Eroare la scraping articol {url}: {e}")
+            logger.error(f"Eroare la descărcarea articolului {adapter.source} {url}: {e}")
             return None
 
-    def scrape_digi24(self):
-        """Scrape articole de pe Digi24.ro"""
-        logger.info("Începe scraping-ul pentru Digi24.ro")
+    @staticmethod
+    def parse_article(page):
+        """Etapa de parsare (CPU): (adaptor, url, conținut) -> articol sau None"""
+        adapter, url, content = page
         try:
-            response = self.session.get('https://www.digi24.ro', timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            article_links = []
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                if '/stiri/' in href:
-                    full_url = urljoin('https://www.digi24.ro', href)
-                    if not full_url.startswith(('mailto:', 'https://www.facebook.com', 'https://twitter.com', 'https://whatsapp.com')):
-                        article_links.append(full_url)
-            
-            article_links = list(set(article_links))[:20]
-            
-            logger.info(f"Găsite {len(article_links)} articole pe Digi24")
-            
-            for article_url in article_links:
-                if self.db.article_exists(article_url):
-                    continue
-                
-                article_data = self.scrape_single_article_digi24(article_url)
-                if article_data and article_data['title'] not in ["JavaScript is not available.", "Share on WhatsApp"]:
-                    self.db.insert_article(article_data)
-                
-                time.sleep(1)
-                
+            with PARSE_SECONDS.time(mode='thread'):
+                return adapter.parse_article(content, url)
         except Exception as e:
-            logger.error(f"Eroare la scraping Digi24: {e}")
+            logger.error(f"Eroare la parsarea articolului {adapter.source} {url}: {e}")
+            return None
 
-    def scrape_single_article_digi24(self, url):
-        """Scrape un singur articol de pe Digi24"""
+    @staticmethod
+    async def parse_in_process(pool, page):
+        """Etapa de parsare într-un proces separat: doar numele adaptorului, URL-ul și octeții trec granița"""
+        adapter, url, content = page
         try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            title_elem = soup.find('h1')
-            title = title_elem.get_text(strip=True) if title_elem else "Titlu nedisponibil"
-            if title in ["JavaScript is not available.", "Share on WhatsApp"] or not title:
-                logger.warning(f"Titlu invalid pentru {url}: {title}")
-                return None
-            
-            author_elem = soup.find('span', class_='author')
-            author = author_elem.get_text(strip=True) if author_elem else "Autor nedisponibil"
-            
-            content_elem = soup.find('div', class_='article-body')
-            content = content_elem.get_text(strip=True) if content_elem else ""
-            
-            published_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            
-            description = self.llm_generator.generate_description(title, content)
-            keywords = self.extract_keywords(title, content)
-            
-            image_elem = soup.find('meta', property='og:image')
-            url_to_image = image_elem['content'] if image_elem else None
-            
-            category = "General"
-            if any(word in title.lower() for word in ['politic', 'guvern']):
-                category = "Politică"
-            elif any(word in title.lower() for word in ['sport']):
-                category = "Sport"
-            
-            return {
-                'title': title,
-                'source': 'Digi24',
-                'category': category,
-                'author': author,
-                'url': url,
-                'keywords': keywords,
-                'description': description,
-                'publishedAt': published_at,
-                'content': content[:1000],
-                'urlToImage': url_to_image
-            }
-            
-            
+            # Include și transferul între procese
+            with PARSE_SECONDS.time(mode='process'):
+                return await asyncio.wrap_future(pool.submit(adapter.name, url, content))
         except Exception as e:
-            logger.error(f"Eroare la scraping articol Digi24 {url}: {e}")
+            logger.error(f"Eroare la parsarea articolului {adapter.source} {url}: {e}")
             return None
 
-    def run_scraping(self):
-        """Rulează procesul complet de scraping"""
+    def enrich_article(self, article_data):
+        """Cuvintele cheie și verificarea de duplicate; None dacă articolul se sare"""
+        article_data['keywords'] = self.extract_keywords(article_data['title'], article_data['content'])
+        # Completată de DescriptionPipeline, în etapa următoare
+        article_data['description'] = None
+        if self.duplicates is not None:
+            # Înaintea descrierilor, ca duplicatele sărite să nu mai coste un apel LLM
+            return next(self.duplicates.process([article_data]), None)
+        return article_data
+
+    def scrape_articles(self, jobs):
+        """Descarcă în paralel articolele noi din `jobs` (listă de (adaptor, url)) și le inserează
+
+        Etapele (descărcare, parsare, cuvinte cheie și duplicate, descriere, scriere) rulează simultan, legate
+        prin cozi limitate (vezi staged_pipeline.py); metricile ultimei rulări sunt în `self.pipeline.stats()`.
+        """
+        existing = self.db.existing_urls(url for _, url in jobs)
+        new_jobs = [(adapter, url) for adapter, url in jobs if url not in existing]
+        if existing:
+            logger.info(f"{len(existing)} articole există deja")
+
+        skipped_urls = set()
+
+        def enrich(article_data):
+            enriched = self.enrich_article(article_data)
+            if enriched is None:
+                # Duplicat sărit intenționat: nu se mai reîncearcă
+                skipped_urls.add(article_data['url'])
+            return enriched
+
+        # Indexul de căutare și arhiva primesc doar articolele inserate efectiv
+        callbacks = [store.add_articles for store in (self.search_index, self.archive) if store is not None]
+
+        def on_insert(articles):
+            for callback in callbacks:
+                try:
+                    callback(articles)
+                except Exception as e:
+                    logger.error(f"Eroare după inserarea lotului: {e}")
+
+        writer = BufferedArticleWriter(self.db, on_insert=on_insert if callbacks else None, **self.writer_config)
+        keep_html = self.archive is not None and self.archive.store_html
+
+        def with_html(article_data, page):
+            if article_data and keep_html:
+                article_data['raw_html'] = page[2]
+            return article_data
+
+        def write(article_data):
+            writer.add(article_data)
+            return article_data
+
+        queue_size = self.pipeline_config.get('queue_size', 100)
+        fetch_workers = self.fetcher.max_workers
+        parse_workers = self.pipeline_config.get('parse_workers') or os.cpu_count() or 1
+        parse_processes = self.pipeline_config.get('parse_processes')
+        describe_workers = self.description_pipeline.max_workers
+        # Conexiunea la baza de date nu se partajează: scrierea rulează pe un singur fir dedicat
+        with ThreadPoolExecutor(fetch_workers, thread_name_prefix='fetch') as fetch_pool, \
+                ThreadPoolExecutor(parse_workers, thread_name_prefix='parse') as parse_pool, \
+                ThreadPoolExecutor(1, thread_name_prefix='enrich') as enrich_pool, \
+                ThreadPoolExecutor(describe_workers, thread_name_prefix='describe') as describe_pool, \
+                ThreadPoolExecutor(1, thread_name_prefix='write') as write_pool:
+            if parse_processes:
+                # Procesele ocolesc GIL-ul; pool-ul rămâne pornit între cicluri, deci încălzirea se plătește o dată
+                process_pool = shared_parse_pool(parse_processes)
+
+                async def parse(page):
+                    return with_html(await self.parse_in_process(process_pool, page), page)
+
+                # Câte două pagini în lucru per proces, ca niciun proces să nu aștepte după bucla de evenimente
+                parse_stage = Stage('parse', parse, process_pool.workers * 2, queue_size)
+            else:
+                parse_stage = Stage('parse', lambda page: with_html(self.parse_article(page), page), parse_workers,
+                                    queue_size, parse_pool)
+            self.pipeline = StagedPipeline([
+                Stage('fetch', self.fetch_article, fetch_workers, queue_size, fetch_pool),
+                parse_stage,
+                Stage('enrich', enrich, 1, queue_size, enrich_pool),
+                Stage('describe', self.description_pipeline.describe_batch, describe_workers, queue_size,
+                      describe_pool, batch_size=self.description_pipeline.batch_size),
+                Stage('write', write, 1, queue_size, write_pool),
+            ])
+            asyncio.run(self.pipeline.run(new_jobs))
+            write_pool.submit(writer.close).result()
+
+        stats = self.pipeline.stats()
+        logger.info(
+            f"Pipeline: {stats['stages']['write']['emitted']} articole în {stats['elapsed_seconds']:.1f}s "
+            f"({stats['items_per_minute']:.0f} articole/minut)"
+        )
+        for name, stage in stats['stages'].items():
+            logger.info(
+                f"  {name}: {stage['emitted']}/{stage['received']} ieșite, coadă maximă {stage['max_queue_depth']}, "
+                f"ocupat {stage['busy_seconds']:.1f}s, {stage['throughput_per_second']:.1f}/s"
+            )
+
+        # Un articol pierdut în orice etapă (descărcare, parsare, excepție într-o etapă, scriere) se reîncearcă
+        done = set(writer.inserted_urls) | skipped_urls
+        failed = {url for _, url in new_jobs} - done
+        self.frontier.mark_failed(failed)
+        self.frontier.mark_done(set(existing) | done)
+        sources = {url: adapter.name for adapter, url in new_jobs}
+        self.inserted_by_source = Counter(sources[url] for url in writer.inserted_urls)
+        outcomes = {
+            'new': writer.inserted,
+            'existing': len(existing),
+            # Sărite de politica de duplicate în etapa de îmbogățire
+            'duplicate': stats['stages']['enrich']['dropped'],
+            'failed': len(failed)
+        }
+        for outcome, count in outcomes.items():
+            ARTICLES.inc(count, outcome=outcome)
+        self.articles.update(outcomes)
+        self.insert_seconds += writer.seconds
+        if writer.inserted:
+            # Cache-urile API-ului trebuie să vadă articolele noi
+            notify_data_changed()
+        return writer
+
+    def run_summary(self, adapters, started_at, elapsed):
+        """Rezumatul JSON al ultimului ciclu: unde s-a dus timpul și ce s-a întâmplat cu articolele"""
+        pipeline = self.pipeline.stats() if self.pipeline is not None else {}
+        summary = {
+            'started_at': started_at.isoformat(timespec='seconds'),
+            'duration_seconds': round(elapsed, 3),
+            'sources': [adapter.name for adapter in adapters],
+            'articles': dict(self.articles),
+            'inserted_by_source': dict(self.inserted_by_source),
+            'fetch': self.fetcher.stats(),
+            'parse_seconds': pipeline.get('stages', {}).get('parse', {}).get('busy_seconds', 0.0),
+            'db_insert_seconds': round(self.insert_seconds, 3),
+            'descriptions': self.description_pipeline.stats(),
+            'pipeline': pipeline
+        }
+        if self.fetcher.cache is not None:
+            summary['http_cache'] = self.fetcher.cache.stats()
+        if self.duplicates is not None:
+            summary['duplicates'] = self.duplicates.stats()
+        return summary
+
+    def write_run_summary(self, adapters, started_at, elapsed):
+        RUN_SECONDS.observe(elapsed)
+        LAST_RUN.set(time.time())
+        self.last_run_summary = self.run_summary(adapters, started_at, elapsed)
+        if not self.summary_path:
+            return
+        try:
+            # O linie JSON per ciclu, ușor de citit cu jq sau pandas
+            with open(self.summary_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(self.last_run_summary, ensure_ascii=False, default=str) + '\n')
+        except OSError as e:
+            logger.error(f"Nu s-a putut scrie rezumatul rulării în {self.summary_path}: {e}")
+
+    def run_scraping(self, sources=None):
+        """Rulează procesul complet de scraping pentru `sources` (nume de adaptori, implicit toți)
+
+        Returnează numărul de articole inserate pentru fiecare sursă (Counter, gol dacă rularea a eșuat).
+        """
+        self.inserted_by_source = Counter()
+        self.articles = Counter()
+        self.insert_seconds = 0.0
+        self.fetcher.reset_stats()
+        adapters = [adapter for adapter in self.adapters if sources is None or adapter.name in sources]
+        started_at, started = datetime.now(), time.perf_counter()
         if not self.db.connect():
             logger.error("Nu s-a putut conecta la baza de date")
-            return
+            return self.inserted_by_source
         try:
             logger.info("Începe procesul de scraping...")
-            self.scrape_hotnews()
-            self.scrape_digi24()
+            if not len(self.db.known_urls):
+                self.db.warm_url_cache()
+            self.frontier.prune(self.frontier_max_age_days)
+            if self.duplicates is not None and not len(self.duplicates.index):
+                try:
+                    self.duplicates.warm(self.db.recent_articles())
+                except Exception as e:
+                    logger.error(f"Eroare la încărcarea indexului de duplicate: {e}")
+            # Paginile principale se descarcă în paralel, apoi toate articolele intră în același pool,
+            # astfel încât durata ciclului depinde de cel mai lent host, nu de suma articolelor
+            jobs = []
+            for adapter, links in self.fetcher.map(self.get_links, adapters):
+                jobs.extend((adapter, url) for url in links or [])
+            self.scrape_articles(jobs)
+            self.keywords.frequencies.save()
+            self.write_run_summary(adapters, started_at, time.perf_counter() - started)
+            if self.fetcher.cache is not None:
+                stats = self.fetcher.cache.stats()
+                logger.info(
+                    f"Cache HTTP: {stats['revalidated']}/{stats['requests']} răspunsuri 304 "
+                    f"(rată {stats['hit_rate']:.0%}), {stats['bytes_saved']} bytes economisiți, "
+                    f"{stats['unchanged_pages']} prime pagini neschimbate"
+                )
+                self.fetcher.cache.reset_stats()
+            if self.duplicates is not None:
+                stats = self.duplicates.stats()
+                logger.info(f"Duplicate: {stats['duplicates']}/{stats['checked']} articole (politica {stats['policy']})")
             logger.info("Procesul de scraping s-a terminat cu succes")
         except Exception as e:
             logger.error(f"Eroare generală în procesul de scraping: {e}")
         finally:
-            self.db.disconnect()
\ No newline at end of file
+            self.db.disconnect()
+        return self.inserted_by_source
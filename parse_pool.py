@@ -0,0 +1,72 @@
+"""Parsarea articolelor într-un ProcessPoolExecutor, în afara GIL-ului procesului principal
+
+Între procese circulă doar numele adaptorului, URL-ul și octeții paginii la intrare, iar la ieșire
+dicționarul compact al articolului (aceleași câmpuri ca `SiteAdapter.parse_article`). Adaptorii se
+iau din registrul `site_adapters.ADAPTERS` al fiecărui worker. La pornire, fiecare worker importă
+modulele de parsare și parsează o pagină minimă, ca primele articole reale să nu plătească acest cost.
+"""
+import os
+import threading
+import logging
+from concurrent.futures import ProcessPoolExecutor, wait
+
+logger = logging.getLogger(__name__)
+
+WARM_UP_PAGE = b'<html><head><title>t</title></head><body><h1>t</h1><p>t</p></body></html>'
+
+
+def _init_worker():
+    from site_adapters import ADAPTERS
+    for adapter in ADAPTERS.values():
+        adapter.parse_article(WARM_UP_PAGE, adapter.homepage)
+
+
+def _ready():
+    return os.getpid()
+
+
+def parse_page(adapter_name, url, content):
+    """Rulează în worker: octeții paginii -> articol (dicționar) sau None"""
+    from site_adapters import ADAPTERS
+    adapter = ADAPTERS[adapter_name]
+    try:
+        return adapter.parse_article(content, url)
+    except Exception as e:
+        logger.error(f"Eroare la parsarea articolului {adapter.source} {url}: {e}")
+        return None
+
+
+class ParsePool:
+    def __init__(self, workers=None, warm_up=True):
+        self.workers = max(1, int(workers or os.cpu_count() or 1))
+        self.executor = ProcessPoolExecutor(self.workers, initializer=_init_worker)
+        if warm_up:
+            self.warm_up()
+
+    def warm_up(self):
+        """Pornește toate procesele acum, nu la primele articole; returnează câte procese au răspuns"""
+        # Câte o sarcină în plus per worker: procesele se creează la cerere, cât timp există sarcini în așteptare
+        futures = [self.executor.submit(_ready) for _ in range(self.workers * 2)]
+        wait(futures)
+        pids = {future.result() for future in futures}
+        logger.info(f"Pool-ul de parsare are {len(pids)} procese pornite")
+        return len(pids)
+
+    def submit(self, adapter_name, url, content):
+        return self.executor.submit(parse_page, adapter_name, url, content)
+
+    def shutdown(self):
+        self.executor.shutdown()
+
+
+_shared_pools = {}
+_shared_lock = threading.Lock()
+
+
+def shared_parse_pool(workers):
+    """Un singur pool per număr de worker-i, refolosit între ciclurile de scraping din același proces"""
+    with _shared_lock:
+        pool = _shared_pools.get(workers)
+        if pool is None:
+            pool = _shared_pools[workers] = ParsePool(workers)
+        return pool
@@ -0,0 +1,224 @@
+"""Re-procesarea articolelor deja stocate (backfill), după schimbarea regulilor de extragere sau de îmbogățire
+
+Etapele (`STEPS`) se aleg independent:
+
+- `extract`: re-parsează HTML-ul brut din arhiva de conținut cu adaptorul sursei (titlu, autor, conținut,
+  imagine); articolele fără HTML arhivat își păstrează câmpurile
+- `category`: reaplică regulile de categorii ale adaptorului pe titlu
+- `keywords`: recalculează cuvintele cheie cu frecvențele de document existente
+- `description`: regenerează descrierile prin LLM, fără cache; un articol pentru care LLM-ul nu răspunde își
+  păstrează descrierea (nu se folosește fallback-ul)
+
+Tabela se parcurge în loturi după id (keyset), deci memoria nu depinde de numărul de articole. Un lot se
+parsează în paralel (fire sau procese), apoi rândurile modificate se scriu cu un singur `executemany`. După
+fiecare lot confirmat, ultimul id se salvează în fișierul de checkpoint: o rulare întreruptă continuă de acolo.
+"""
+import json
+import os
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from news_queries import limit_clause
+from response_cache import notify_data_changed
+from storage import bulk_cursor
+
+logger = logging.getLogger(__name__)
+
+STEPS = ('extract', 'category', 'keywords', 'description')
+COLUMNS = ('url', 'source', 'title', 'author', 'category', 'content', 'urlToImage', 'keywords', 'description')
+# Coloanele scrise de fiecare etapă; publishedAt nu se rescrie: adaptorul pune data curentă când lipsește
+STEP_COLUMNS = {
+    'extract': ('title', 'author', 'content', 'urlToImage'),
+    'category': ('category',),
+    'keywords': ('keywords',),
+    'description': ('description',),
+}
+
+
+class ReprocessCheckpoint:
+    """Progresul unei re-procesări, într-un fișier JSON rescris atomic după fiecare lot"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self, steps):
+        """Starea salvată pentru aceleași etape sau None"""
+        if not self.path or not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Checkpoint-ul {self.path} nu poate fi citit ({e}), se începe de la zero")
+            return None
+        if state.get('steps') != list(steps):
+            logger.warning(f"Checkpoint-ul {self.path} este pentru etapele {state.get('steps')}, se începe de la zero")
+            return None
+        return state
+
+    def save(self, state):
+        if not self.path:
+            return
+        temporary = f"{self.path}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(temporary, self.path)
+
+    def clear(self):
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class Reprocessor:
+    def __init__(self, db, steps=STEPS, archive=None, keywords=None, descriptions=None, search_index=None,
+                 batch_size=500, parse_workers=None, parse_processes=None,
+                 checkpoint_path='reprocess_checkpoint.json'):
+        unknown = [step for step in steps if step not in STEPS]
+        if unknown:
+            raise ValueError(f"Etape necunoscute: {', '.join(unknown)} (disponibile: {', '.join(STEPS)})")
+        if 'keywords' in steps and keywords is None:
+            raise ValueError("Etapa keywords are nevoie de un KeywordExtractor")
+        if 'description' in steps and descriptions is None:
+            raise ValueError("Etapa description are nevoie de un DescriptionPipeline")
+        self.db = db
+        self.steps = [step for step in STEPS if step in steps]
+        self.archive = archive
+        self.keywords = keywords
+        self.descriptions = descriptions
+        self.search_index = search_index
+        self.batch_size = max(1, int(batch_size))
+        self.parse_workers = parse_workers or os.cpu_count() or 1
+        self.parse_processes = parse_processes
+        self.checkpoint = ReprocessCheckpoint(checkpoint_path)
+        self.columns = [column for step in self.steps for column in STEP_COLUMNS[step]]
+        # Adaptoarele și parse_pool se importă abia aici: main.py citește STEPS pentru argumentele din linia de
+        # comandă fără a încărca parserele HTML și multiprocessing
+        from site_adapters import ADAPTERS
+        # Articolele păstrează numele sursei (ex. HotNews), nu numele adaptorului (hotnews)
+        self.adapters = {adapter.source: adapter for adapter in ADAPTERS.values()}
+        self.stats = {}
+
+    def fetch_batch(self, after_id):
+        cursor = self.db.connection.cursor()
+        cursor.execute(
+            f"SELECT id, {', '.join(COLUMNS)} FROM dbo.news WHERE id > ? ORDER BY id"
+            + limit_clause(self.batch_size, self.db.storage.dialect),
+            (after_id,)
+        )
+        rows = cursor.fetchall()
+        cursor.close()
+        return [{'id': row[0], **dict(zip(COLUMNS, row[1:]))} for row in rows]
+
+    def count_remaining(self, after_id):
+        cursor = self.db.connection.cursor()
+        cursor.execute("SELECT COUNT(*) FROM dbo.news WHERE id > ?", (after_id,))
+        total = cursor.fetchone()[0]
+        cursor.close()
+        return total
+
+    def extract(self, articles, executor):
+        """Re-parsează paginile arhivate; returnează articolele cu textul integral nou (pentru arhivă)"""
+        from parse_pool import parse_page, shared_parse_pool
+        if self.archive is None:
+            return []
+        pages = self.archive.get_htmls(article['url'] for article in articles)
+        jobs = [(article, self.adapters[article['source']]) for article in articles
+                if article['url'] in pages and article['source'] in self.adapters]
+        if self.parse_processes:
+            pool = shared_parse_pool(self.parse_processes)
+            futures = [pool.submit(adapter.name, article['url'], pages[article['url']]) for article, adapter in jobs]
+            results = [future.result() for future in futures]
+        else:
+            results = executor.map(lambda job: parse_page(job[1].name, job[0]['url'], pages[job[0]['url']]), jobs)
+        extracted = []
+        for (article, _), parsed in zip(jobs, results):
+            if parsed is None:
+                self.stats['extract_failed'] += 1
+                continue
+            for column in STEP_COLUMNS['extract']:
+                article[column] = parsed[column]
+            article['full_content'] = parsed['full_content']
+            extracted.append(article)
+        self.stats['extracted'] += len(extracted)
+        return extracted
+
+    def process_batch(self, articles, executor):
+        original = {article['id']: tuple(article[column] for column in self.columns) for article in articles}
+        extracted = self.extract(articles, executor) if 'extract' in self.steps else []
+        if 'category' in self.steps:
+            for article in articles:
+                adapter = self.adapters.get(article['source'])
+                if adapter is not None and article['title']:
+                    article['category'] = adapter.categorize(article['title'])
+        if 'keywords' in self.steps:
+            words = self.keywords.extract_batch([(article['title'], article['content'] or '') for article in articles],
+                                                update=False)
+            for article, keywords in zip(articles, words):
+                article['keywords'] = keywords
+        if 'description' in self.steps:
+            regenerated = self.descriptions.regenerate(articles)
+            self.stats['described'] += len(regenerated)
+            self.stats['describe_failed'] += len(articles) - len(regenerated)
+
+        changed = [article for article in articles
+                   if tuple(article[column] for column in self.columns) != original[article['id']]]
+        if changed:
+            cursor = bulk_cursor(self.db.connection)
+            try:
+                cursor.executemany(
+                    f"UPDATE dbo.news SET {', '.join(f'{column} = ?' for column in self.columns)} WHERE id = ?",
+                    [(*(article[column] for column in self.columns), article['id']) for article in changed]
+                )
+                self.db.connection.commit()
+            except Exception:
+                self.db.connection.rollback()
+                raise
+            finally:
+                cursor.close()
+            # Cache-urile API-ului trebuie să vadă articolele modificate
+            notify_data_changed()
+        # Indexul și arhiva se actualizează după commit: la o reluare, lotul se scrie din nou, idempotent
+        if changed and self.search_index is not None:
+            self.search_index.add_articles(changed)
+        if extracted:
+            self.archive.add_articles(extracted)
+        return len(changed)
+
+    def run(self, restart=False):
+        """Re-procesează toate articolele (de la checkpoint, dacă există); returnează statisticile"""
+        state = None if restart else self.checkpoint.load(self.steps)
+        if state:
+            logger.info(f"Se reia re-procesarea după id {state['last_id']} ({state['processed']} articole procesate)")
+        else:
+            state = {'steps': self.steps, 'last_id': 0, 'processed': 0, 'updated': 0}
+        self.stats = {'processed': 0, 'updated': 0, 'extracted': 0, 'extract_failed': 0, 'described': 0,
+                      'describe_failed': 0}
+        total = self.count_remaining(state['last_id'])
+        logger.info(f"Re-procesare ({', '.join(self.steps)}): {total} articole rămase")
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(self.parse_workers, thread_name_prefix='reprocess') as executor:
+            while True:
+                articles = self.fetch_batch(state['last_id'])
+                if not articles:
+                    break
+                updated = self.process_batch(articles, executor)
+                state['last_id'] = articles[-1]['id']
+                state['processed'] += len(articles)
+                state['updated'] += updated
+                self.checkpoint.save(state)
+                self.stats['processed'] += len(articles)
+                self.stats['updated'] += updated
+
+                elapsed = time.perf_counter() - started
+                rate = self.stats['processed'] / elapsed if elapsed else 0.0
+                remaining = max(total - self.stats['processed'], 0)
+                eta = f", încă ~{remaining / rate:.0f}s" if rate and remaining else ""
+                logger.info(f"Re-procesate {self.stats['processed']}/{total} articole "
+                            f"({self.stats['updated']} modificate, {rate:.0f} articole/s{eta})")
+
+        self.checkpoint.clear()
+        self.stats['elapsed_seconds'] = round(time.perf_counter() - started, 3)
+        logger.info(f"Re-procesare terminată: {self.stats}")
+        return self.stats
@@ -0,0 +1,106 @@
+import os
+import threading
+import time
+import tempfile
+import logging
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+# Fișierul marcaj prin care scraper-ul anunță API-ul (chiar și din alt proces) că datele s-au schimbat
+VERSION_FILE = os.getenv('CACHE_VERSION_FILE', os.path.join(tempfile.gettempdir(), 'news_scraper_cache_version'))
+
+_generation = 0
+_generation_lock = threading.Lock()
+
+
+def notify_data_changed():
+    """Invalidează cache-urile din acest proces și pe cele ale altor procese care urmăresc fișierul marcaj"""
+    global _generation
+    with _generation_lock:
+        _generation += 1
+    try:
+        with open(VERSION_FILE, 'w') as f:
+            f.write(str(time.time()))
+    except OSError as e:
+        logger.warning(f"Nu s-a putut actualiza fișierul de versiune al cache-ului: {e}")
+
+
+def data_version():
+    try:
+        mtime = os.stat(VERSION_FILE).st_mtime_ns
+    except OSError:
+        mtime = 0
+    return _generation, mtime
+
+
+class ResponseCache:
+    """Cache LRU cu TTL pentru răspunsurile API, golit automat la schimbarea versiunii datelor"""
+
+    MISSING = object()
+
+    def __init__(self, max_size=256, ttl=300.0, version_check_interval=1.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.version_check_interval = version_check_interval
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.version = data_version()
+        self.version_checked = time.monotonic()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.stale_writes = 0
+
+    def _check_version(self, now):
+        """Verifică (cel mult o dată pe interval) dacă datele s-au schimbat; se apelează cu lock-ul deținut"""
+        if now - self.version_checked < self.version_check_interval and self.version[0] == _generation:
+            return
+        self.version_checked = now
+        version = data_version()
+        if version != self.version:
+            self.version = version
+            if self.entries:
+                self.entries.clear()
+                self.invalidations += 1
+
+    def get(self, key):
+        now = time.monotonic()
+        with self.lock:
+            self._check_version(now)
+            entry = self.entries.get(key)
+            if entry is None or entry[1] < now:
+                if entry is not None:
+                    del self.entries[key]
+                self.misses += 1
+                return self.MISSING
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key, value, version=None):
+        """Stochează `value`, dacă datele nu s-au schimbat de la `version` (data_version() dinaintea interogării)"""
+        with self.lock:
+            # Altfel un rezultat citit înainte de invalidare ar rămâne în cache până la expirarea TTL-ului
+            if version is not None and version != data_version():
+                self.stale_writes += 1
+                return
+            self.entries[key] = (value, time.monotonic() + self.ttl)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self):
+        with self.lock:
+            return {
+                'size': len(self.entries),
+                'max_size': self.max_size,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'stale_writes': self.stale_writes
+            }
@@ -0,0 +1,181 @@
+import sqlite3
+import threading
+import logging
+
+from text_processing import search_terms
+
+logger = logging.getLogger(__name__)
+
+# Coloanele indexate și ponderile lor în BM25: un termen din titlu contează mai mult decât unul din descriere
+INDEXED_COLUMNS = ('title', 'description', 'keywords')
+COLUMN_WEIGHTS = (3.0, 1.0, 2.0)
+
+
+class SearchIndexUnavailable(Exception):
+    pass
+
+
+def fts5_available():
+    try:
+        sqlite3.connect(':memory:').execute("CREATE VIRTUAL TABLE t USING fts5(x)")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+class SearchIndex:
+    """Index inversat local (SQLite FTS5) peste titlul, descrierea și cuvintele cheie ale articolelor
+
+    Textul se normalizează în Python înainte de indexare (litere mici, fără diacritice, fără stop words,
+    vezi `text_processing.search_terms`), iar interogarea trece prin aceeași normalizare, deci
+    „știri” găsește și „stiri”. Documentele sunt identificate prin URL, unic și în dbo.news, iar indexul se
+    actualizează incremental la fiecare lot inserat. Clasamentul este BM25, cu ponderi pe coloane.
+
+    BM25 trebuie calculat pentru fiecare document care se potrivește, deci un termen prezent în jumătate din
+    colecție ar costa sute de milisecunde. De aceea, dacă ultimele `recent_window` articole indexate conțin cel
+    puțin `recent_min_hits` potriviri (numărate o dată, fără BM25), rezultatele sunt întâi acestea, ordonate
+    după relevanță, apoi restul colecției, tot după relevanță. Decizia depinde doar de interogare, nu de
+    pagină, deci toate paginile sunt tăieturi ale aceleiași ordini. Pentru termenii rari ordinea este BM25 pe
+    toată colecția; pentru cei foarte frecvenți primele pagini vin din cele mai noi articole, ceea ce pentru
+    știri este de dorit, iar BM25 pe restul colecției se calculează doar pentru paginile de după fereastră.
+
+    Fișierul este în modul WAL: scraper-ul scrie, iar API-ul citește în paralel, cu câte o conexiune per fir.
+    """
+
+    def __init__(self, path='search_index.db', recent_window=20000, recent_min_hits=1000):
+        if not fts5_available():
+            raise SearchIndexUnavailable("SQLite-ul din această instalare Python nu are FTS5")
+        self.path = path
+        self.recent_window = recent_window
+        self.recent_min_hits = recent_min_hits
+        self.local = threading.local()
+        self.write_lock = threading.Lock()
+        # O bază în memorie există doar pe conexiunea care a creat-o, deci aceasta se partajează între fire
+        self.shared = self._connect() if path == ':memory:' else None
+        connection = self.connection
+        if path != ':memory:':
+            connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("""
+            CREATE TABLE IF NOT EXISTS documents (
+                id INTEGER PRIMARY KEY,
+                url TEXT NOT NULL UNIQUE,
+                source TEXT
+            )
+        """)
+        connection.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS terms USING fts5({', '.join(INDEXED_COLUMNS)})")
+        connection.commit()
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path, check_same_thread=False, timeout=10)
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    @property
+    def connection(self):
+        if self.shared is not None:
+            return self.shared
+        connection = getattr(self.local, 'connection', None)
+        if connection is None:
+            connection = self.local.connection = self._connect()
+        return connection
+
+    @staticmethod
+    def document_terms(article):
+        return tuple(' '.join(search_terms(article.get(column))) for column in INDEXED_COLUMNS)
+
+    def add_articles(self, articles):
+        """Adaugă sau actualizează articolele în index, într-o singură tranzacție; returnează câte s-au indexat"""
+        rows = [(article['url'], article.get('source'), self.document_terms(article)) for article in articles]
+        if not rows:
+            return 0
+        with self.write_lock:
+            connection = self.connection
+            with connection:
+                for url, source, terms in rows:
+                    existing = connection.execute("SELECT id FROM documents WHERE url = ?", (url,)).fetchone()
+                    if existing:
+                        connection.execute("DELETE FROM terms WHERE rowid = ?", existing)
+                        connection.execute("UPDATE documents SET source = ? WHERE id = ?", (source, existing[0]))
+                        doc_id = existing[0]
+                    else:
+                        doc_id = connection.execute(
+                            "INSERT INTO documents (url, source) VALUES (?, ?)", (url, source)).lastrowid
+                    connection.execute(
+                        f"INSERT INTO terms (rowid, {', '.join(INDEXED_COLUMNS)}) VALUES (?, ?, ?, ?)",
+                        (doc_id, *terms))
+        return len(rows)
+
+    @staticmethod
+    def match_expression(query):
+        """Expresia MATCH pentru textul căutat: toți termenii trebuie să apară (AND); None dacă nu rămâne niciunul"""
+        terms = list(dict.fromkeys(search_terms(query)))
+        if not terms:
+            return None
+        # Termenii sunt doar litere ASCII după normalizare, dar ghilimelele evită orice sintaxă FTS5
+        return ' '.join(f'"{term}"' for term in terms)
+
+    def search(self, query, limit=20, offset=0, source=None):
+        """Returnează [(url, scor)] ordonate după relevanță (scor BM25 mai mare = mai relevant)"""
+        expression = self.match_expression(query)
+        if expression is None:
+            return []
+        window = self._recent_window(expression, source)
+        if window is None:
+            return self._search(expression, limit, offset, source)
+        min_id, recent = window
+        hits = []
+        if offset < recent:
+            hits = self._search(expression, limit, offset, source, min_id=min_id)
+        if len(hits) < limit:
+            hits += self._search(expression, limit - len(hits), max(offset - recent, 0), source, max_id=min_id)
+        return hits
+
+    def _recent_window(self, expression, source):
+        """(id-ul de la care începe fereastra recentă, potrivirile din ea) sau None dacă nu se folosește fereastra"""
+        if not self.recent_window:
+            return None
+        last_id = self.connection.execute("SELECT MAX(id) FROM documents").fetchone()[0] or 0
+        if last_id <= self.recent_window:
+            return None
+        min_id = last_id - self.recent_window
+        sql = """
+            SELECT COUNT(*) FROM terms JOIN documents ON documents.id = terms.rowid
+            WHERE terms MATCH ? AND terms.rowid > ?
+        """
+        params = [expression, min_id]
+        if source:
+            sql += " AND documents.source = ?"
+            params.append(source)
+        recent = self.connection.execute(sql, params).fetchone()[0]
+        return (min_id, recent) if recent >= self.recent_min_hits else None
+
+    def _search(self, expression, limit, offset, source, min_id=None, max_id=None):
+        sql = f"""
+            SELECT documents.url, -bm25(terms, {', '.join(map(str, COLUMN_WEIGHTS))}) AS score
+            FROM terms JOIN documents ON documents.id = terms.rowid
+            WHERE terms MATCH ?
+        """
+        params = [expression]
+        if min_id is not None:
+            sql += " AND terms.rowid > ?"
+            params.append(min_id)
+        if max_id is not None:
+            sql += " AND terms.rowid <= ?"
+            params.append(max_id)
+        if source:
+            sql += " AND documents.source = ?"
+            params.append(source)
+        # id-ul departajează scorurile egale, ca paginile să nu se suprapună
+        sql += " ORDER BY score DESC, terms.rowid LIMIT ? OFFSET ?"
+        params += [limit, offset]
+        return self.connection.execute(sql, params).fetchall()
+
+    def count(self):
+        return self.connection.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def optimize(self):
+        """Comprimă segmentele indexului (după o reconstrucție sau multe inserări incrementale)"""
+        with self.write_lock:
+            connection = self.connection
+            connection.execute("INSERT INTO terms (terms) VALUES ('optimize')")
+            connection.commit()
@@ -0,0 +1,226 @@
+"""Registrul de surse: fiecare site este descris declarativ printr-un SiteAdapter
+
+O sursă nouă se adaugă cu `register(SiteAdapter(...))`; motorul din NewsScraper este comun.
+Adaptoarele nu fac cereri HTTP, deci pot fi verificate offline pe pagini salvate:
+
+    python site_adapters.py hotnews pagina.html
+    python site_adapters.py hotnews prima_pagina.html --homepage
+"""
+import argparse
+import json
+import logging
+from collections import OrderedDict
+from datetime import datetime
+from urllib.parse import urljoin, urlparse
+
+from html_parsing import extract_links, make_soup, strainer_for
+
+logger = logging.getLogger(__name__)
+
+INVALID_TITLES = ["JavaScript is not available.", "Share on WhatsApp"]
+EXCLUDED_PREFIXES = ('mailto:', 'https://www.facebook.com', 'https://twitter.com', 'https://whatsapp.com')
+
+
+def relative_url(url):
+    """Calea și query-ul unui URL, fără schemă și host"""
+    return urlparse(url)._replace(scheme='', netloc='').geturl()
+
+
+class SiteAdapter:
+    """Configurația unei surse de știri
+
+    - `link_patterns`: fragmente de URL care identifică un articol pe prima pagină
+    - `*_selectors`: selectoare CSS încercate în ordine, primul element găsit câștigă
+    - `date_attribute`: atributul din elementul de dată care conține data ISO (fără selector, data e momentul curent)
+    - `category_rules`: listă de (categorie, cuvinte); prima regulă cu un cuvânt prezent în titlu dă categoria
+    - `parse_tags`: etichetele păstrate la parsarea articolelor (restul paginii nu se construiește)
+    - `section_urls`, `feed_urls`: pagini de secțiune (inclusiv pagini de paginare) și feed-uri RSS/Atom
+      sau sitemap-uri, parcurse la adâncimea 1 a crawl-ului
+    - `max_links`: câte articole noi se descarcă cel mult per ciclu
+    """
+
+    def __init__(self, name, source, homepage, link_patterns, title_selectors, content_selectors,
+                 author_selectors=(), date_selectors=(), date_attribute='datetime', image_selector='meta[property="og:image"]',
+                 category_rules=(), default_category='General', parse_tags=None, strip_tags=('script', 'style'),
+                 section_urls=(), feed_urls=(), max_links=20, content_length=1000):
+        self.name = name
+        self.source = source
+        self.homepage = homepage
+        self.link_patterns = list(link_patterns)
+        self.title_selectors = list(title_selectors)
+        self.content_selectors = list(content_selectors)
+        self.author_selectors = list(author_selectors)
+        self.date_selectors = list(date_selectors)
+        self.date_attribute = date_attribute
+        self.image_selector = image_selector
+        self.category_rules = [(category, list(words)) for category, words in category_rules]
+        self.default_category = default_category
+        self.parse_tags = list(parse_tags) if parse_tags else None
+        self.strainer = strainer_for(self.parse_tags)
+        self.strip_tags = list(strip_tags)
+        self.section_urls = [urljoin(homepage, url) for url in section_urls]
+        self.feed_urls = [urljoin(homepage, url) for url in feed_urls]
+        self.max_links = max_links
+        self.content_length = content_length
+
+    def with_homepage(self, homepage):
+        """Copie a adaptorului cu altă adresă de bază (de ex. un server local cu pagini salvate)"""
+        adapter = SiteAdapter.__new__(SiteAdapter)
+        adapter.__dict__.update(self.__dict__)
+        adapter.homepage = homepage
+        adapter.section_urls = [urljoin(homepage, relative_url(url)) for url in self.section_urls]
+        adapter.feed_urls = [urljoin(homepage, relative_url(url)) for url in self.feed_urls]
+        return adapter
+
+    def crawl_pages(self, depth=0):
+        """Paginile de pornire pentru o adâncime dată, ca (url, adâncime, este_feed)"""
+        pages = [(self.homepage, 0, False)]
+        if depth >= 1:
+            pages += [(url, 1, False) for url in self.section_urls]
+            pages += [(url, 1, True) for url in self.feed_urls]
+        return pages
+
+    def filter_article_links(self, hrefs, base_url=None):
+        """Păstrează link-urile de articole, absolute, fără duplicate, în ordinea din pagină"""
+        links = OrderedDict()
+        for href in hrefs:
+            if any(pattern in href for pattern in self.link_patterns):
+                full_url = urljoin(base_url or self.homepage, href)
+                if not full_url.startswith(EXCLUDED_PREFIXES):
+                    links[full_url] = None
+        return list(links)
+
+    def extract_article_links(self, content, base_url=None):
+        """Link-urile de articole dintr-o pagină HTML, în ordinea din pagină"""
+        return self.filter_article_links(extract_links(content), base_url)
+
+    @staticmethod
+    def _select(soup, selectors):
+        for selector in selectors:
+            element = soup.select_one(selector)
+            if element is not None:
+                return element
+        return None
+
+    def categorize(self, title):
+        lowered = title.lower()
+        for category, words in self.category_rules:
+            if any(word in lowered for word in words):
+                return category
+        return self.default_category
+
+    def parse_published_at(self, soup):
+        published_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        element = self._select(soup, self.date_selectors)
+        if element is not None and element.get(self.date_attribute):
+            try:
+                published_at = datetime.fromisoformat(
+                    element[self.date_attribute].replace('Z', '+00:00')).strftime('%Y-%m-%d %H:%M:%S')
+            except ValueError:
+                pass
+        return published_at
+
+    def parse_article(self, content, url):
+        """Extrage câmpurile unui articol din HTML; None dacă pagina nu este un articol valid"""
+        soup = make_soup(content, parse_only=self.strainer)
+
+        title_elem = self._select(soup, self.title_selectors)
+        title = title_elem.get_text(strip=True) if title_elem else "Titlu nedisponibil"
+        if title in INVALID_TITLES or not title:
+            logger.warning(f"Titlu invalid pentru {url}: {title}")
+            return None
+
+        author_elem = self._select(soup, self.author_selectors)
+        author = author_elem.get_text(strip=True) if author_elem else "Autor nedisponibil"
+
+        content_elem = self._select(soup, self.content_selectors)
+        text = ""
+        if content_elem:
+            for element in content_elem(self.strip_tags):
+                element.decompose()
+            text = content_elem.get_text(strip=True)
+
+        image_elem = soup.select_one(self.image_selector) if self.image_selector else None
+        url_to_image = image_elem.get('content') if image_elem else None
+
+        return {
+            'title': title,
+            'source': self.source,
+            'category': self.categorize(title),
+            'author': author,
+            'url': url,
+            'publishedAt': self.parse_published_at(soup),
+            'content': text[:self.content_length],
+            # Textul integral merge doar în arhiva comprimată (content_archive.py), nu în dbo.news
+            'full_content': text,
+            'urlToImage': url_to_image
+        }
+
+
+ADAPTERS = OrderedDict()
+
+
+def register(adapter):
+    ADAPTERS[adapter.name] = adapter
+    return adapter
+
+
+def get_adapters(names=None):
+    """Adaptoarele selectate; None sau 'all' înseamnă toate sursele înregistrate"""
+    if not names or 'all' in names:
+        return list(ADAPTERS.values())
+    unknown = [name for name in names if name not in ADAPTERS]
+    if unknown:
+        raise ValueError(f"Surse necunoscute: {', '.join(unknown)}")
+    return [ADAPTERS[name] for name in names]
+
+
+register(SiteAdapter(
+    name='hotnews',
+    source='HotNews',
+    homepage='https://hotnews.ro',
+    link_patterns=['/stiri/', '/articol/'],
+    feed_urls=['/feed'],
+    title_selectors=['h1', 'title'],
+    author_selectors=['span.author', 'div.author'],
+    content_selectors=['div.article-content', 'div.content', 'article'],
+    date_selectors=['time', 'span.date'],
+    category_rules=[
+        ('Politică', ['politic', 'guvern', 'parlament']),
+        ('Sport', ['sport', 'fotbal', 'tenis']),
+        ('Economie', ['economic', 'bani', 'investiții']),
+    ],
+    parse_tags=['title', 'h1', 'meta', 'time', 'span', 'div', 'article'],
+))
+
+register(SiteAdapter(
+    name='digi24',
+    source='Digi24',
+    homepage='https://www.digi24.ro',
+    link_patterns=['/stiri/'],
+    feed_urls=['/rss'],
+    title_selectors=['h1'],
+    author_selectors=['span.author'],
+    content_selectors=['div.article-body'],
+    category_rules=[
+        ('Politică', ['politic', 'guvern']),
+        ('Sport', ['sport']),
+    ],
+    parse_tags=['h1', 'meta', 'span', 'div'],
+))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Rulează un adaptor pe o pagină HTML salvată')
+    parser.add_argument('source', choices=list(ADAPTERS))
+    parser.add_argument('file')
+    parser.add_argument('--homepage', action='store_true', help='Pagina este o primă pagină: afișează link-urile')
+    args = parser.parse_args()
+    with open(args.file, 'rb') as f:
+        page = f.read()
+    adapter = ADAPTERS[args.source]
+    if args.homepage:
+        result = adapter.extract_article_links(page)
+    else:
+        result = adapter.parse_article(page, adapter.homepage)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
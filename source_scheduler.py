@@ -0,0 +1,143 @@
+"""Scheduler de scraping cu interval propriu pentru fiecare sursă, adaptat ritmului de publicare
+
+- după fiecare rulare, ritmul observat (articole noi / timpul de la rularea anterioară) intră într-o medie
+  exponențială, iar intervalul devine timpul estimat până la `target_articles` articole noi, între
+  `min_interval` și `max_interval`; o sursă fără articole noi își mărește intervalul cu factorul `backoff`
+- fiecare termen primește un jitter de ±`jitter` din interval, ca sursele să nu pornească toate odată
+- rulările nu se suprapun: sursele scadente în același moment rulează într-un singur ciclu, iar ce devine
+  scadent în timpul ciclului rulează o singură dată după el (rulările ratate se comasează, nu se recuperează)
+- bucla rulează într-un fir separat (`start`), deci poate împărți procesul cu serverul API
+"""
+import random
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class SourceSchedule:
+    """Starea de programare a unei surse; timpii sunt în secunde, pe ceasul monoton"""
+
+    def __init__(self, name, interval, min_interval, max_interval, target_articles=10, backoff=1.5,
+                 smoothing=0.3, jitter=0.1):
+        self.name = name
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min(max(interval, min_interval), max_interval)
+        self.target_articles = target_articles
+        self.backoff = backoff
+        self.smoothing = smoothing
+        self.jitter = jitter
+        self.rate = None
+        self.next_run = 0.0
+        self.last_run = None
+        self.runs = 0
+        self.coalesced = 0
+
+    def due(self, now):
+        return now >= self.next_run
+
+    def record(self, inserted, now):
+        """Actualizează ritmul estimat și programează următoarea rulare după `inserted` articole noi"""
+        if self.last_run is not None and now > self.last_run:
+            observed = inserted / (now - self.last_run)
+            self.rate = observed if self.rate is None else self.smoothing * observed + (1 - self.smoothing) * self.rate
+        if inserted and self.rate:
+            self.interval = self.target_articles / self.rate
+        elif not inserted:
+            self.interval *= self.backoff
+        self.interval = min(max(self.interval, self.min_interval), self.max_interval)
+        self.last_run = now
+        self.runs += 1
+        self.next_run = now + self.interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def stats(self, now):
+        return {
+            'interval_seconds': round(self.interval, 1),
+            'next_run_in_seconds': round(max(0.0, self.next_run - now), 1),
+            'articles_per_hour': round(self.rate * 3600, 2) if self.rate is not None else None,
+            'runs': self.runs,
+            'coalesced': self.coalesced
+        }
+
+
+class SourceScheduler:
+    """Rulează `run_sources(nume)` pentru sursele scadente; funcția returnează articolele inserate per sursă"""
+
+    def __init__(self, run_sources, sources, interval=1800, min_interval=300, max_interval=7200,
+                 target_articles=10, backoff=1.5, jitter=0.1):
+        self.run_sources = run_sources
+        self.schedules = {name: SourceSchedule(name, interval, min_interval, max_interval, target_articles,
+                                               backoff, jitter=jitter)
+                          for name in sources}
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.thread = None
+        self.running = False
+
+    def due_sources(self, now):
+        due = []
+        with self.lock:
+            for schedule in self.schedules.values():
+                if schedule.due(now):
+                    # Termenele depășite cu mai multe intervale (ciclu lung, proces suspendat) se comasează
+                    if schedule.last_run is not None:
+                        schedule.coalesced += int((now - schedule.next_run) // schedule.interval)
+                    due.append(schedule.name)
+        return due
+
+    def run_pending(self):
+        """Un ciclu pentru toate sursele scadente acum; returnează sursele rulate"""
+        due = self.due_sources(time.monotonic())
+        if not due:
+            return []
+        self.running = True
+        try:
+            inserted = self.run_sources(due) or {}
+        except Exception as e:
+            logger.error(f"Eroare în ciclul de scraping pentru {', '.join(due)}: {e}")
+            inserted = {}
+        finally:
+            self.running = False
+        now = time.monotonic()
+        with self.lock:
+            for name in due:
+                schedule = self.schedules[name]
+                schedule.record(inserted.get(name, 0), now)
+                logger.info(f"Sursa {name}: {inserted.get(name, 0)} articole noi, "
+                            f"următoarea rulare în {schedule.next_run - now:.0f}s")
+        return due
+
+    def seconds_until_next(self):
+        with self.lock:
+            next_run = min((schedule.next_run for schedule in self.schedules.values()), default=None)
+        return 60.0 if next_run is None else max(0.0, next_run - time.monotonic())
+
+    def run_forever(self):
+        while not self.stopped.is_set():
+            self.run_pending()
+            # Așteptarea se întrerupe imediat la stop(); plafonul de 60s acoperă ceasul sistemului schimbat
+            self.stopped.wait(min(self.seconds_until_next(), 60.0))
+
+    def start(self):
+        """Pornește bucla într-un fir daemon și returnează imediat"""
+        if self.thread is None or not self.thread.is_alive():
+            self.stopped.clear()
+            self.thread = threading.Thread(target=self.run_forever, name='source-scheduler', daemon=True)
+            self.thread.start()
+        return self.thread
+
+    def stop(self, timeout=None):
+        """Oprește bucla; un ciclu în curs se termină înainte"""
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join(timeout)
+
+    def stats(self):
+        now = time.monotonic()
+        with self.lock:
+            return {
+                'running': self.running,
+                'sources': {name: schedule.stats(now) for name, schedule in self.schedules.items()}
+            }
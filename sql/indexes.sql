@@ -0,0 +1,16 @@
+-- Indexuri pentru API-ul de știri (SQL Server)
+
+-- Paginarea keyset din /api/news ordonează după (publishedAt DESC, id DESC) și continuă de la
+-- ultimul rând văzut cu predicatul
+--     publishedAt <= @p AND (publishedAt < @p OR (publishedAt = @p AND id < @id)).
+-- Cu acest index fiecare pagină este o căutare urmată de `limit` rânduri, deci costul nu crește
+-- cu adâncimea paginii, spre deosebire de OFFSET.
+CREATE NONCLUSTERED INDEX IX_news_publishedAt_id
+    ON dbo.news (publishedAt DESC, id DESC);
+
+-- Același ordin de parcurgere pentru filtrele uzuale pe sursă și categorie
+CREATE NONCLUSTERED INDEX IX_news_source_publishedAt_id
+    ON dbo.news (source, publishedAt DESC, id DESC);
+
+CREATE NONCLUSTERED INDEX IX_news_category_publishedAt_id
+    ON dbo.news (category, publishedAt DESC, id DESC);
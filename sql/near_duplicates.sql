@@ -0,0 +1,15 @@
+-- Grupuri de duplicate aproximative (politica DEDUP_POLICY=cluster)
+
+-- URL-ul primului articol din grup (reprezentantul); NULL pentru articolele originale.
+ALTER TABLE dbo.news ADD duplicate_of NVARCHAR(500) NULL;
+GO
+
+-- /api/news?collapse=1 listează doar reprezentanții, în aceeași ordine keyset ca IX_news_publishedAt_id
+CREATE NONCLUSTERED INDEX IX_news_representatives_publishedAt_id
+    ON dbo.news (publishedAt DESC, id DESC)
+    WHERE duplicate_of IS NULL;
+
+-- Membrii unui grup, pornind de la reprezentant
+CREATE NONCLUSTERED INDEX IX_news_duplicate_of
+    ON dbo.news (duplicate_of)
+    WHERE duplicate_of IS NOT NULL;
@@ -0,0 +1,152 @@
+"""Pipeline asyncio cu etape legate prin cozi limitate
+
+Fiecare etapă are propriul număr de worker-i și o coadă de intrare de `queue_size` elemente; când coada
+etapei următoare este plină, etapa curentă așteaptă (backpressure), deci memoria rămâne limitată chiar dacă
+descărcarea e mai rapidă decât scrierea. O funcție de etapă poate fi:
+
+- o corutină, executată direct în bucla de evenimente
+- o funcție obișnuită cu `executor` (fire sau procese), executată prin `run_in_executor`
+- o funcție obișnuită fără executor, executată inline în buclă (doar pentru pași foarte scurți)
+
+Rezultatul `None` scoate elementul din pipeline. Cu `batch_size` setat, funcția primește o listă cu elementele
+disponibile în coadă (cel mult `batch_size`) și returnează lista rezultatelor.
+"""
+import asyncio
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+class Stage:
+    def __init__(self, name, func, concurrency=1, queue_size=100, executor=None, batch_size=None):
+        self.name = name
+        self.func = func
+        self.concurrency = max(1, int(concurrency))
+        self.queue_size = max(1, int(queue_size))
+        self.executor = executor
+        self.batch_size = max(1, int(batch_size)) if batch_size is not None else None
+        self.queue = None
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.received = 0
+        self.emitted = 0
+        self.dropped = 0
+        self.errors = 0
+        self.busy = 0.0
+        self.max_depth = 0
+        self.active = 0
+
+    async def call(self, value):
+        if asyncio.iscoroutinefunction(self.func):
+            return await self.func(value)
+        if self.executor is not None:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, self.func, value)
+        return self.func(value)
+
+    async def take(self):
+        """Următorul element (sau lot) din coadă; _DONE când etapa anterioară s-a terminat"""
+        item = await self.queue.get()
+        if item is _DONE or self.batch_size is None:
+            return item
+        batch = [item]
+        while len(batch) < self.batch_size and not self.queue.empty():
+            item = self.queue.get_nowait()
+            if item is _DONE:
+                # Marcajul de final rămâne pentru următoarea citire a acestui worker
+                self.queue.put_nowait(_DONE)
+                break
+            batch.append(item)
+        return batch
+
+    def stats(self, elapsed):
+        return {
+            'concurrency': self.concurrency,
+            'queue_depth': self.queue.qsize() if self.queue is not None else 0,
+            'max_queue_depth': self.max_depth,
+            'active': self.active,
+            'received': self.received,
+            'emitted': self.emitted,
+            'dropped': self.dropped,
+            'errors': self.errors,
+            'busy_seconds': round(self.busy, 3),
+            'throughput_per_second': round(self.emitted / elapsed, 2) if elapsed else 0.0
+        }
+
+
+class StagedPipeline:
+    """Rulează elementele prin `stages` în ordine; ieșirile ultimei etape se returnează la final"""
+
+    def __init__(self, stages):
+        self.stages = list(stages)
+        self.started = None
+        self.finished = None
+
+    async def _produce(self, items, queue):
+        for item in items:
+            await queue.put(item)
+            stage = self.stages[0]
+            stage.max_depth = max(stage.max_depth, queue.qsize())
+
+    async def _work(self, stage, following, results):
+        while True:
+            item = await stage.take()
+            if item is _DONE:
+                return
+            values = item if stage.batch_size else [item]
+            stage.received += len(values)
+            stage.active += 1
+            started = time.perf_counter()
+            try:
+                result = await stage.call(item)
+            except Exception as e:
+                stage.errors += len(values)
+                logger.error(f"Eroare în etapa {stage.name}: {e}")
+                continue
+            finally:
+                stage.busy += time.perf_counter() - started
+                stage.active -= 1
+            outputs = [value for value in (result if stage.batch_size else [result]) or [] if value is not None]
+            stage.emitted += len(outputs)
+            stage.dropped += len(values) - len(outputs)
+            for value in outputs:
+                if following is None:
+                    results.append(value)
+                else:
+                    await following.queue.put(value)
+                    following.max_depth = max(following.max_depth, following.queue.qsize())
+
+    async def run(self, items):
+        results = []
+        for stage in self.stages:
+            stage.queue = asyncio.Queue(stage.queue_size)
+            stage.reset_stats()
+        self.started, self.finished = time.perf_counter(), None
+        following = self.stages[1:] + [None]
+
+        producer = asyncio.create_task(self._produce(items, self.stages[0].queue))
+        workers = [[asyncio.create_task(self._work(stage, next_stage, results)) for _ in range(stage.concurrency)]
+                   for stage, next_stage in zip(self.stages, following)]
+        await producer
+        # Etapele se închid în ordine: după ce toți worker-ii unei etape au terminat, urmează următoarea
+        for stage, stage_workers in zip(self.stages, workers):
+            for _ in stage_workers:
+                await stage.queue.put(_DONE)
+            await asyncio.gather(*stage_workers)
+        self.finished = time.perf_counter()
+        return results
+
+    def stats(self):
+        """Metricile fiecărei etape și debitul end-to-end (articole pe minut la ieșirea ultimei etape)"""
+        if self.started is None:
+            return {'elapsed_seconds': 0.0, 'items_per_minute': 0.0, 'stages': {}}
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        completed = self.stages[-1].emitted if self.stages else 0
+        return {
+            'elapsed_seconds': round(elapsed, 3),
+            'items_per_minute': round(completed / elapsed * 60, 1) if elapsed else 0.0,
+            'stages': {stage.name: stage.stats(elapsed) for stage in self.stages}
+        }
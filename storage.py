@@ -0,0 +1,160 @@
+"""Backend-uri de stocare pentru tabela dbo.news, comune scraper-ului, API-ului și comenzilor din main.py
+
+- `SqlServerBackend`: SQL Server prin pyodbc, cu autentificare Windows sau utilizator și parolă
+- `SqliteBackend`: un fișier SQLite local, în modul WAL (un singur scriitor, cititori concurenți), fără server
+  de baze de date; util pe noduri edge și pentru testele de performanță locale
+
+Ambele returnează conexiuni DB-API ale căror rânduri se citesc prin index sau prin atribut (`row.url`), ca
+pyodbc.Row. Fișierul SQLite se atașează ca schema `dbo`, deci query-urile rulează nemodificate; diferențele
+de dialect (paginarea) sunt în news_queries.py, după `backend.dialect`.
+
+Configurația vine din `storage_config_from_env()`: `DB_BACKEND` (`sqlserver` sau `sqlite`), apoi `DB_HOST`,
+`DB_NAME`, `DB_USER`, `DB_PASSWORD`, `DB_TRUSTED_CONNECTION`, `DB_DRIVER` pentru SQL Server și `SQLITE_PATH`,
+`DB_READ_ONLY` pentru SQLite.
+"""
+import os
+import sqlite3
+from collections import namedtuple
+from datetime import datetime
+from urllib.parse import quote
+
+
+# Echivalentul SQLite al tabelei dbo.news și al indexurilor din sql/indexes.sql și sql/near_duplicates.sql
+SQLITE_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS dbo.news (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT, source TEXT, category TEXT, author TEXT,
+        url TEXT NOT NULL UNIQUE, keywords TEXT, description TEXT,
+        publishedAt DATETIME, content TEXT, urlToImage TEXT,
+        duplicate_of TEXT
+    );
+    CREATE INDEX IF NOT EXISTS dbo.IX_news_publishedAt_id ON news (publishedAt DESC, id DESC);
+    CREATE INDEX IF NOT EXISTS dbo.IX_news_source_publishedAt_id ON news (source, publishedAt DESC, id DESC);
+    CREATE INDEX IF NOT EXISTS dbo.IX_news_category_publishedAt_id ON news (category, publishedAt DESC, id DESC);
+    CREATE INDEX IF NOT EXISTS dbo.IX_news_representatives_publishedAt_id ON news (publishedAt DESC, id DESC)
+        WHERE duplicate_of IS NULL;
+    CREATE INDEX IF NOT EXISTS dbo.IX_news_duplicate_of ON news (duplicate_of) WHERE duplicate_of IS NOT NULL;
+"""
+
+# Datele calendaristice se scriu ca 'YYYY-MM-DD HH:MM:SS', formatul produs și de adaptoarele de site-uri,
+# ca ordonarea și comparațiile textuale din SQLite să fie corecte
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(sep=' '))
+sqlite3.register_converter('DATETIME', lambda value: datetime.fromisoformat(value.decode('utf-8')))
+
+_row_classes = {}
+
+
+def _row_factory(cursor, values):
+    fields = tuple(column[0] for column in cursor.description)
+    row_class = _row_classes.get(fields)
+    if row_class is None:
+        row_class = _row_classes[fields] = namedtuple('Row', fields, rename=True)
+    return row_class(*values)
+
+
+def bulk_cursor(connection):
+    """Cursor pentru executemany; cu pyodbc parametrii se trimit într-un singur drum (fast_executemany)"""
+    cursor = connection.cursor()
+    try:
+        cursor.fast_executemany = True
+    except AttributeError:
+        pass
+    return cursor
+
+
+class StorageBackend:
+    name = None
+    dialect = None
+
+    def connect(self):
+        """O conexiune nouă; excepțiile driverului se propagă"""
+        raise NotImplementedError
+
+    def describe(self):
+        """Descriere fără credențiale, pentru log-uri"""
+        raise NotImplementedError
+
+
+class SqlServerBackend(StorageBackend):
+    name = 'sqlserver'
+    dialect = 'mssql'
+
+    def __init__(self, server='localhost\\SQLEXPRESS', database='news_scraper', trusted_connection=True,
+                 username=None, password=None, driver='ODBC Driver 17 for SQL Server'):
+        self.server = server
+        self.database = database
+        self.trusted_connection = trusted_connection
+        self.username = username
+        self.password = password
+        self.driver = driver
+
+    def connection_string(self):
+        connection_string = f'DRIVER={{{self.driver}}};SERVER={self.server};DATABASE={self.database};'
+        if self.trusted_connection:
+            return connection_string + 'Trusted_Connection=yes;'
+        return connection_string + f'UID={self.username};PWD={self.password};'
+
+    def connect(self):
+        import pyodbc
+        return pyodbc.connect(self.connection_string())
+
+    def describe(self):
+        return f"SQL Server {self.server}/{self.database}"
+
+
+class SqliteBackend(StorageBackend):
+    """Fișier SQLite atașat ca `dbo`; schema se creează la conexiune dacă lipsește (în afară de `read_only`)"""
+    name = 'sqlite'
+    dialect = 'sqlite'
+
+    def __init__(self, path='news.db', read_only=False, timeout=30.0):
+        self.path = path
+        self.read_only = read_only
+        self.timeout = timeout
+
+    def connect(self):
+        connection = sqlite3.connect(':memory:', timeout=self.timeout, check_same_thread=False,
+                                     detect_types=sqlite3.PARSE_DECLTYPES, uri=True)
+        if self.read_only:
+            connection.execute("ATTACH DATABASE ? AS dbo", (f"file:{quote(os.path.abspath(self.path))}?mode=ro",))
+        else:
+            connection.execute("ATTACH DATABASE ? AS dbo", (self.path,))
+            # WAL: cititorii (API-ul) nu blochează scrierea scraper-ului și nici invers
+            connection.execute("PRAGMA dbo.journal_mode=WAL")
+            connection.execute("PRAGMA dbo.synchronous=NORMAL")
+            connection.executescript(SQLITE_SCHEMA)
+        connection.row_factory = _row_factory
+        return connection
+
+    def describe(self):
+        return f"SQLite {self.path}" + (" (doar citire)" if self.read_only else "")
+
+
+BACKENDS = {backend.name: backend for backend in (SqlServerBackend, SqliteBackend)}
+
+
+def create_storage(backend='sqlserver', **options):
+    """Backend-ul cu numele dat; opțiunile sunt argumentele constructorului"""
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend de stocare necunoscut: {backend} (disponibile: {', '.join(BACKENDS)})")
+    return BACKENDS[backend](**options)
+
+
+def storage_config_from_env():
+    """Configurația backend-ului de stocare din variabilele de mediu"""
+    backend = os.getenv('DB_BACKEND', 'sqlserver').lower()
+    if backend == 'sqlite':
+        return {
+            'backend': 'sqlite',
+            'path': os.getenv('SQLITE_PATH', 'news.db'),
+            'read_only': os.getenv('DB_READ_ONLY', 'false').lower() == 'true'
+        }
+    return {
+        'backend': backend,
+        'server': os.getenv('DB_HOST', 'localhost\\SQLEXPRESS'),
+        'database': os.getenv('DB_NAME', 'news_scraper'),
+        'trusted_connection': os.getenv('DB_TRUSTED_CONNECTION', 'true').lower() == 'true',
+        'username': os.getenv('DB_USER'),
+        'password': os.getenv('DB_PASSWORD'),
+        'driver': os.getenv('DB_DRIVER', 'ODBC Driver 17 for SQL Server')
+    }
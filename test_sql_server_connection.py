@@ -1,5 +1,5 @@
-import pyodbc
 import logging
+from storage import SqlServerBackend
 
 # Configurare logging
 logging.basicConfig(level=logging.INFO)
@@ -12,12 +12,10 @@ def test_sql_server_connection():
         database = 'news_scraper'
         
         # Pentru Windows Authentication
-        connection_string = f'DRIVER={{ODBC Driver 17 for SQL Server}};SERVER={server};DATABASE={database};Trusted_Connection=yes;'
-        
-
+        backend = SqlServerBackend(server, database, trusted_connection=True)
         
         logger.info("Încearcă conectarea la SQL Server...")
-        connection = pyodbc.connect(connection_string)
+        connection = backend.connect()
         logger.info("Conectare reușită!")
         
         # Testează o query simplă
@@ -0,0 +1,19 @@
+import os
+import sys
+
+import pytest
+
+# Modulele proiectului sunt la rădăcina depozitului
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from news_scraper import NewsDatabase
+from storage import SqliteBackend
+
+
+@pytest.fixture
+def news_db(tmp_path):
+    """NewsDatabase conectată la o bază SQLite temporară, cu schema dbo.news"""
+    db = NewsDatabase(storage=SqliteBackend(str(tmp_path / 'news.db')))
+    assert db.connect()
+    yield db
+    db.disconnect()
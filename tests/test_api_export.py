@@ -0,0 +1,87 @@
+import os
+
+import pytest
+from werkzeug.test import EnvironBuilder
+
+from db_pool import ConnectionPool
+from storage import SqliteBackend
+
+
+class TrackingCursor:
+    def __init__(self, cursor):
+        self.cursor = cursor
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+        self.cursor.close()
+
+    def __getattr__(self, name):
+        return getattr(self.cursor, name)
+
+
+class TrackingConnection:
+    """Conexiune care ține minte cursoarele deschise, pentru a verifica închiderea lor"""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.cursors = []
+
+    def cursor(self):
+        cursor = TrackingCursor(self.connection.cursor())
+        self.cursors.append(cursor)
+        return cursor
+
+    def __getattr__(self, name):
+        return getattr(self.connection, name)
+
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    storage = SqliteBackend(str(tmp_path / 'news.db'))
+    connection = storage.connect()
+    connection.executemany("INSERT INTO dbo.news (title, source, url, publishedAt) VALUES (?, ?, ?, ?)",
+                           [(f'Titlu {i}', 'HotNews', f'https://hotnews.ro/stiri/{i}.html', '2024-01-01 10:00:00')
+                            for i in range(10)])
+    connection.commit()
+    connection.close()
+    # api_server citește configurația la import
+    monkeypatch.setenv('DB_BACKEND', 'sqlite')
+    monkeypatch.setenv('SQLITE_PATH', str(tmp_path / 'news.db'))
+    monkeypatch.setenv('SEARCH_INDEX_PATH', '')
+    monkeypatch.setenv('CONTENT_ARCHIVE_PATH', '')
+    import api_server
+    connections = []
+
+    def connect():
+        connections.append(TrackingConnection(storage.connect()))
+        return connections[-1]
+
+    pool = ConnectionPool(connect, min_size=0, max_size=2)
+    monkeypatch.setattr(api_server, 'db_pool', pool)
+    monkeypatch.setattr(api_server, 'storage', storage)
+    yield api_server.app, pool, connections
+
+
+def test_export_closes_cursor_when_client_disconnects_before_reading(api):
+    app, pool, connections = api
+    statuses = []
+    # Direct prin WSGI: clientul de test Flask citește deja prima bucată, deci ar porni generatorul
+    body = app(EnvironBuilder(path='/api/news/export').get_environ(),
+               lambda status, headers, exc_info=None: statuses.append(status))
+    assert statuses == ['200 OK']
+    # Clientul se deconectează înainte de primul octet: serverul închide răspunsul fără a-l parcurge
+    body.close()
+
+    assert pool.stats()['in_use'] == 0
+    assert [cursor.closed for cursor in connections[0].cursors] == [True]
+
+
+def test_export_closes_cursor_after_streaming(api):
+    app, pool, connections = api
+    response = app.test_client().get('/api/news/export')
+    assert len(response.get_data().splitlines()) == 10
+    response.close()
+
+    assert pool.stats()['in_use'] == 0
+    assert all(cursor.closed for cursor in connections[0].cursors)
@@ -0,0 +1,15 @@
+import sqlite3
+
+from db_pool import ConnectionPool
+
+
+def test_close_all_closes_idle_connections():
+    pool = ConnectionPool(lambda: sqlite3.connect(':memory:'), min_size=2, max_size=2)
+    pool.fill()
+    with pool.connection():
+        pool.close_all()
+        assert pool.stats()['size'] == 1
+    # Conexiunea care era în uz se întoarce în pool și se închide la următorul apel
+    pool.close_all()
+    assert pool.stats()['size'] == 0
+    assert pool.stats()['closed'] == 2
@@ -0,0 +1,69 @@
+import os
+import types
+
+import pytest
+
+from crawl_frontier import extract_feed_links
+from news_scraper import NewsScraper
+from site_adapters import ADAPTERS
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+BENCHMARK_FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks',
+                                      'fixtures')
+
+FEEDS = {
+    'hotnews': ('https://hotnews.ro/feed', 'hotnews_feed.xml', [
+        'https://hotnews.ro/stiri/guvernul-a-aprobat-bugetul-pe-anul-viitor-1001.html',
+        'https://hotnews.ro/stiri/echipa-nationala-s-a-calificat-1002.html',
+        'https://hotnews.ro/articol/analiza-piata-energiei-1003.html',
+    ]),
+    'digi24': ('https://www.digi24.ro/rss', 'digi24_feed.xml', [
+        'https://www.digi24.ro/stiri/actualitate/politica/parlamentul-dezbate-legea-educatiei-2001',
+        'https://www.digi24.ro/stiri/actualitate/vremea-se-raceste-2002',
+    ]),
+}
+
+
+def read(directory, *path):
+    with open(os.path.join(directory, *path), 'rb') as f:
+        return f.read()
+
+
+@pytest.mark.parametrize('name', sorted(FEEDS))
+def test_feed_is_crawled_from_depth_one(name):
+    adapter = ADAPTERS[name]
+    feed_url = FEEDS[name][0]
+    assert (feed_url, 1, True) not in adapter.crawl_pages(0)
+    assert (feed_url, 1, True) in adapter.crawl_pages(1)
+
+
+@pytest.mark.parametrize('name', sorted(FEEDS))
+def test_feed_article_links(name):
+    adapter = ADAPTERS[name]
+    feed_url, fixture, expected = FEEDS[name]
+    links = adapter.filter_article_links(extract_feed_links(read(FIXTURES_DIR, fixture)), feed_url)
+    assert links == expected
+
+
+@pytest.mark.parametrize('name', sorted(FEEDS))
+def test_get_links_schedules_homepage_and_feed_articles(name, tmp_path, monkeypatch):
+    feed_url, fixture, expected = FEEDS[name]
+    scraper = NewsScraper({'backend': 'sqlite', 'path': str(tmp_path / 'news.db')}, sources=[name],
+                          crawl_config={'depth': 1}, description_config={'cache_path': None})
+    adapter = scraper.adapters[0]
+    monkeypatch.setattr(adapter, 'max_links', 1000)
+    pages = {adapter.homepage: read(BENCHMARK_FIXTURES_DIR, name, 'index.html'),
+             feed_url: read(FIXTURES_DIR, fixture)}
+    requested = []
+
+    def get(url):
+        requested.append(url)
+        return types.SimpleNamespace(content=pages[url], raise_for_status=lambda: None)
+
+    scraper.fetcher.get = get
+    homepage_links = adapter.extract_article_links(pages[adapter.homepage], adapter.homepage)
+    links = scraper.get_links(adapter)
+
+    assert requested == [adapter.homepage, feed_url]
+    assert set(expected) <= set(links)
+    assert set(homepage_links) <= set(links)
@@ -0,0 +1,70 @@
+from description_pipeline import DescriptionCache, DescriptionPipeline, content_key
+from reprocessor import Reprocessor
+
+
+class FakeGenerator:
+    """Generator LLM de test: răspunde cu `reply(title)` sau ridică excepție dacă `reply` este None"""
+
+    enabled = True
+
+    def __init__(self, reply=None):
+        self.reply = reply
+        self.calls = 0
+
+    def generate_batch(self, items, max_length=200):
+        self.calls += 1
+        if self.reply is None:
+            raise ConnectionError("LLM indisponibil")
+        return [self.reply(title) for title, _ in items]
+
+    def fallback_description(self, title, content, max_length=200):
+        return ''
+
+
+def insert_articles(db, count=6):
+    rows = [(f'Titlu {i}', 'HotNews', f'https://hotnews.ro/stiri/{i}.html', f'Conținut {i}', f'Descriere LLM {i}')
+            for i in range(count)]
+    db.connection.executemany(
+        "INSERT INTO dbo.news (title, source, url, content, description) VALUES (?, ?, ?, ?, ?)", rows)
+    db.connection.commit()
+
+
+def stored_descriptions(db):
+    return [row[0] for row in db.connection.execute("SELECT description FROM dbo.news ORDER BY id").fetchall()]
+
+
+def reprocess_descriptions(db, pipeline):
+    reprocessor = Reprocessor(db, steps=['description'], descriptions=pipeline, batch_size=4, checkpoint_path=None)
+    return reprocessor.run()
+
+
+def test_failing_llm_keeps_stored_descriptions(news_db, tmp_path):
+    insert_articles(news_db)
+    before = stored_descriptions(news_db)
+    pipeline = DescriptionPipeline(FakeGenerator(), DescriptionCache(str(tmp_path / 'cache.db')), batch_size=2,
+                                   max_retries=1, backoff=0)
+
+    stats = reprocess_descriptions(news_db, pipeline)
+
+    assert stored_descriptions(news_db) == before
+    assert stats['updated'] == 0
+    assert stats['describe_failed'] == 6
+    assert pipeline.fallbacks == 0
+
+
+def test_regenerates_despite_cached_descriptions(news_db, tmp_path):
+    insert_articles(news_db)
+    cache = DescriptionCache(str(tmp_path / 'cache.db'))
+    for title, content, description in news_db.connection.execute(
+            "SELECT title, content, description FROM dbo.news").fetchall():
+        cache.set(content_key(title, content), description)
+    generator = FakeGenerator(reply=lambda title: f'Descriere nouă pentru {title}')
+    pipeline = DescriptionPipeline(generator, cache, batch_size=2, max_retries=1, backoff=0)
+
+    stats = reprocess_descriptions(news_db, pipeline)
+
+    assert stored_descriptions(news_db) == [f'Descriere nouă pentru Titlu {i}' for i in range(6)]
+    assert stats['updated'] == 6
+    assert generator.calls == 3
+    # Cache-ul primește descrierile noi, pentru scraping
+    assert cache.get(content_key('Titlu 0', 'Conținut 0')) == 'Descriere nouă pentru Titlu 0'
@@ -0,0 +1,70 @@
+import os
+
+import pytest
+
+from news_scraper import NewsScraper
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks', 'fixtures')
+URLS = [f'https://hotnews.ro/stiri/articol-{i}.html' for i in range(4)]
+
+
+def make_scraper(tmp_path, **config):
+    """Scraper HotNews peste SQLite; toate URL-urile primesc aceeași pagină din fixture, fără rețea"""
+    scraper = NewsScraper({'backend': 'sqlite', 'path': str(tmp_path / 'news.db')}, sources=['hotnews'],
+                          description_config={'cache_path': None}, **config)
+    with open(os.path.join(FIXTURES_DIR, 'hotnews', 'article.html'), 'rb') as f:
+        page = f.read()
+    scraper.fetch_article = lambda job: (job[0], job[1], page)
+    assert scraper.db.connect()
+    scraper.frontier.discover('hotnews', URLS)
+    return scraper
+
+
+@pytest.fixture
+def scraper(tmp_path):
+    scraper = make_scraper(tmp_path)
+    yield scraper
+    scraper.db.disconnect()
+
+
+def frontier_status(scraper):
+    return dict(scraper.frontier.connection.execute("SELECT url, status FROM frontier").fetchall())
+
+
+def stored_urls(scraper):
+    return {row[0] for row in scraper.db.connection.execute("SELECT url FROM dbo.news").fetchall()}
+
+
+def test_written_articles_are_marked_done(scraper):
+    adapter = scraper.adapters[0]
+    scraper.scrape_articles([(adapter, url) for url in URLS])
+
+    assert stored_urls(scraper) == set(URLS)
+    assert set(frontier_status(scraper).values()) == {'done'}
+    assert scraper.articles['new'] == len(URLS)
+
+
+def test_articles_lost_in_a_stage_stay_retryable(scraper):
+    def failing_describe(batch):
+        raise RuntimeError("etapa describe a eșuat")
+
+    scraper.description_pipeline.describe_batch = failing_describe
+    adapter = scraper.adapters[0]
+    scraper.scrape_articles([(adapter, url) for url in URLS])
+
+    assert stored_urls(scraper) == set()
+    assert set(frontier_status(scraper).values()) == {'failed'}
+    assert scraper.frontier.next_batch('hotnews', 10) == URLS
+    assert scraper.articles['failed'] == len(URLS)
+
+
+def test_skipped_duplicates_are_not_retried(tmp_path):
+    scraper = make_scraper(tmp_path, dedup_config={'policy': 'skip'})
+    adapter = scraper.adapters[0]
+    # Aceeași pagină sub patru URL-uri: primul se inserează, celelalte sunt duplicate sărite
+    scraper.scrape_articles([(adapter, url) for url in URLS])
+
+    assert len(stored_urls(scraper)) == 1
+    assert set(frontier_status(scraper).values()) == {'done'}
+    assert scraper.articles['duplicate'] == len(URLS) - 1
+    scraper.db.disconnect()
@@ -0,0 +1,33 @@
+import re
+
+STOP_WORDS = frozenset({
+    'și', 'sau', 'dar', 'care', 'pentru', 'din', 'cu', 'la', 'pe', 'de', 'în', 'să', 'că', 'nu',
+    'se', 'au', 'este', 'sunt', 'era', 'vor', 'poate', 'toate', 'foarte', 'mai', 'după', 'până'
+})
+
+WORD_PATTERN = re.compile(r'\b[a-zA-ZăâîșțĂÂÎȘȚ]{3,}\b')
+
+# Include și variantele cu sedilă (ş, ţ), încă frecvente în textele românești
+DIACRITICS = str.maketrans('ăâîșțşţĂÂÎȘȚŞŢ', 'aaiststAAISTST')
+
+
+def fold_diacritics(text):
+    """Litere mici, fără diacritice: „Științe” și „stiinte” devin același termen"""
+    return text.lower().translate(DIACRITICS)
+
+
+FOLDED_STOP_WORDS = frozenset(fold_diacritics(word) for word in STOP_WORDS)
+
+
+def search_terms(text):
+    """Termenii indexați pentru căutare: cuvinte de cel puțin 3 litere, fără diacritice și fără stop words"""
+    if not text:
+        return []
+    return [word for word in WORD_PATTERN.findall(fold_diacritics(text)) if word not in FOLDED_STOP_WORDS]
+
+
+def keyword_terms(text):
+    """Termenii candidați pentru cuvinte cheie: ca în `search_terms`, dar cu diacriticele păstrate"""
+    if not text:
+        return []
+    return [word for word in WORD_PATTERN.findall(text.lower()) if word not in STOP_WORDS]
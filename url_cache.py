@@ -0,0 +1,35 @@
+from collections import OrderedDict
+
+
+class KnownUrlCache:
+    """Mulțime mărginită (LRU) de URL-uri despre care știm sigur că sunt deja în baza de date"""
+
+    def __init__(self, max_size=50000):
+        self.max_size = max_size
+        self.urls = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, url):
+        if url in self.urls:
+            self.urls.move_to_end(url)
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+
+    def __len__(self):
+        return len(self.urls)
+
+    def add(self, url):
+        self.urls[url] = None
+        self.urls.move_to_end(url)
+        if len(self.urls) > self.max_size:
+            self.urls.popitem(last=False)
+
+    def update(self, urls):
+        for url in urls:
+            self.add(url)
+
+    def is_full(self):
+        return len(self.urls) >= self.max_size
@@ -0,0 +1,98 @@
+"""Servirea API-ului în producție, cu un server WSGI în locul serverului de dezvoltare Flask
+
+- `gunicorn` (Linux, macOS): `workers` procese cu câte `threads` fire (worker-ul `gthread`, singurul care
+  păstrează conexiunile keep-alive). Fiecare proces importă api_server.py separat, deci are propriul pool
+  de conexiuni, cache și conexiuni la index; aplicația nu se încarcă în master înainte de fork, ca nicio
+  conexiune să nu fie partajată între procese. `kill -HUP <pid master>` repornește worker-ii pe rând
+  (reîncărcând codul), iar SIGTERM așteaptă cererile în curs până la `graceful_timeout`.
+- `waitress` (și pe Windows): un singur proces cu `threads` fire; keep-alive-ul HTTP/1.1 este implicit.
+
+La pornirea fiecărui worker, `api_server.init_worker` deschide conexiunile minime ale pool-ului, ca primele
+cereri să nu plătească conectarea; la oprirea worker-ului, `api_server.shutdown_worker` le închide. Cu mai
+mulți worker-i, `/metrics` raportează doar worker-ul care a răspuns.
+"""
+import os
+import sys
+import logging
+import importlib.util
+
+logger = logging.getLogger(__name__)
+
+SERVERS = ('gunicorn', 'waitress')
+
+
+def default_server():
+    """gunicorn dacă este instalat (nu rulează pe Windows), altfel waitress"""
+    if sys.platform != 'win32' and importlib.util.find_spec('gunicorn') is not None:
+        return 'gunicorn'
+    return 'waitress'
+
+
+def serve_gunicorn(host, port, workers, threads, keepalive, timeout, graceful_timeout, max_requests,
+                   access_log=None):
+    from gunicorn.app.base import BaseApplication
+
+    def post_worker_init(worker):
+        import api_server
+        api_server.init_worker(threads)
+
+    def worker_exit(server, worker):
+        import api_server
+        api_server.shutdown_worker()
+
+    class ApiApplication(BaseApplication):
+        def load_config(self):
+            options = {
+                'bind': f'{host}:{port}',
+                'workers': workers,
+                'worker_class': 'gthread',
+                'threads': threads,
+                'keepalive': keepalive,
+                'timeout': timeout,
+                'graceful_timeout': graceful_timeout,
+                'max_requests': max_requests,
+                # Worker-ii nu se repornesc toți deodată
+                'max_requests_jitter': max_requests // 10,
+                'preload_app': False,
+                'accesslog': access_log,
+                'post_worker_init': post_worker_init,
+                'worker_exit': worker_exit,
+            }
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            # Rulează în fiecare worker, după fork
+            from api_server import app
+            return app
+
+    ApiApplication().run()
+
+
+def serve_waitress(host, port, threads, timeout):
+    import waitress
+    import api_server
+
+    api_server.init_worker(threads)
+    try:
+        waitress.serve(api_server.app, host=host, port=port, threads=threads, channel_timeout=timeout,
+                       ident='news-api')
+    finally:
+        api_server.shutdown_worker()
+
+
+def serve(server=None, host='0.0.0.0', port=5000, workers=None, threads=4, keepalive=5, timeout=30,
+          graceful_timeout=30, max_requests=0, access_log=None):
+    """Pornește serverul WSGI ales; blochează până la oprire"""
+    server = server or default_server()
+    if server not in SERVERS:
+        raise ValueError(f"Server WSGI necunoscut: {server} (disponibile: {', '.join(SERVERS)})")
+    if server == 'gunicorn':
+        workers = workers or 2 * (os.cpu_count() or 1) + 1
+        logger.info(f"Pornește API-ul cu gunicorn pe {host}:{port} ({workers} procese x {threads} fire)")
+        serve_gunicorn(host, port, workers, threads, keepalive, timeout, graceful_timeout, max_requests, access_log)
+    else:
+        if workers and workers > 1:
+            logger.warning("waitress rulează într-un singur proces; API_WORKERS se ignoră")
+        logger.info(f"Pornește API-ul cu waitress pe {host}:{port} ({threads} fire)")
+        serve_waitress(host, port, threads, timeout)